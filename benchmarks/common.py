@@ -0,0 +1,166 @@
+"""Common methods used across benchmarks for Tesla."""
+
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from copy import deepcopy
+from dataclasses import asdict, dataclass
+import gc
+import statistics
+import time
+from unittest.mock import MagicMock, patch
+
+from homeassistant.const import (
+    CONF_ACCESS_TOKEN,
+    CONF_CLIENT_ID,
+    CONF_DOMAIN,
+    CONF_TOKEN,
+    CONF_USERNAME,
+)
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from teslajsonpy.car import TeslaCar
+from teslajsonpy.const import AUTH_DOMAIN
+
+from custom_components.tesla_custom.const import CONF_EXPIRATION, DOMAIN
+from tests.common import setup_mock_controller
+from tests.const import (
+    TEST_ACCESS_TOKEN,
+    TEST_CLIENT_ID,
+    TEST_TOKEN,
+    TEST_USERNAME,
+    TEST_VALID_EXPIRATION,
+)
+from tests.mock_data import car as car_mock_data
+
+# Fleet sizes every benchmark is run for.
+VEHICLE_COUNTS = [1, 10, 100]
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings of one benchmark for one fleet size, in milliseconds per op."""
+
+    name: str
+    vehicles: int
+    rounds: int
+    ops: int
+    min: float
+    median: float
+    mean: float
+    max: float
+
+
+RESULTS: list[BenchmarkResult] = []
+
+
+def results_as_dicts() -> list[dict]:
+    """Return the recorded results sorted for stable output."""
+    return [
+        asdict(result)
+        for result in sorted(RESULTS, key=lambda result: (result.name, result.vehicles))
+    ]
+
+
+async def measure(
+    name: str,
+    vehicles: int,
+    func: Callable[[], Awaitable[None]],
+    *,
+    rounds: int,
+    ops: int = 1,
+    teardown: Callable[[], Awaitable[None]] | None = None,
+) -> BenchmarkResult:
+    """Time func over rounds after a warm up round and record the result.
+
+    ops is how many operations a call of func runs, the timings are reported
+    per operation. The garbage collector is paused while timing so collections
+    do not land on random rounds.
+    """
+    samples = []
+    for round_index in range(rounds + 1):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            await func()
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        if teardown is not None:
+            await teardown()
+        if round_index:
+            samples.append(elapsed * 1000 / ops)
+
+    result = BenchmarkResult(
+        name=name,
+        vehicles=vehicles,
+        rounds=rounds,
+        ops=ops,
+        min=min(samples),
+        median=statistics.median(samples),
+        mean=statistics.fmean(samples),
+        max=max(samples),
+    )
+    RESULTS.append(result)
+    return result
+
+
+def fleet_vin(index: int) -> str:
+    """Return the VIN of the car at index of the fleet."""
+    return f"{car_mock_data.VIN[:-3]}{index:03d}"
+
+
+def make_fleet(controller: MagicMock, vehicles: int) -> dict[str, TeslaCar]:
+    """Return vehicles cars built from the shared mock data."""
+    cars = {}
+    for index in range(vehicles):
+        vin = fleet_vin(index)
+        vehicle = {
+            **deepcopy(car_mock_data.VEHICLE),
+            "id": car_mock_data.VEHICLE["id"] + index,
+            "vehicle_id": car_mock_data.VEHICLE["vehicle_id"] + index,
+            "vin": vin,
+            "display_name": f"Model S {index}",
+        }
+        cars[vin] = TeslaCar(vehicle, controller, deepcopy(car_mock_data.VEHICLE_DATA))
+    return cars
+
+
+@contextmanager
+def patch_fleet_controller(vehicles: int) -> Iterator[MagicMock]:
+    """Patch the Tesla API with a mock controller owning a fleet of cars."""
+    with patch(
+        "custom_components.tesla_custom.TeslaAPI", autospec=True
+    ) as mock_controller:
+        setup_mock_controller(mock_controller)
+        instance = mock_controller.return_value
+        # Tokens are saved on refreshes that renewed them, keep that out of
+        # the steady state being measured.
+        instance.is_token_refreshed.return_value = False
+        instance.generate_car_objects.return_value = make_fleet(instance, vehicles)
+        yield mock_controller
+
+
+def add_config_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Add a Tesla config entry to hass."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=TEST_USERNAME,
+        data={
+            CONF_USERNAME: TEST_USERNAME,
+            CONF_ACCESS_TOKEN: TEST_ACCESS_TOKEN,
+            CONF_TOKEN: TEST_TOKEN,
+            CONF_EXPIRATION: TEST_VALID_EXPIRATION,
+            CONF_DOMAIN: AUTH_DOMAIN,
+            CONF_CLIENT_ID: TEST_CLIENT_ID,
+        },
+        options=None,
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+async def setup_entry(hass: HomeAssistant, entry: MockConfigEntry) -> None:
+    """Set up the config entry and wait for its platforms."""
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
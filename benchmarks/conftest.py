@@ -0,0 +1,52 @@
+"""Global fixtures and reporting for the Tesla benchmarks.
+
+Run with ``pytest benchmarks``, pass ``--benchmark-json=PATH`` to also write
+the results to a file that can be compared between branches.
+"""
+
+import json
+
+import pytest
+
+from .common import results_as_dicts
+
+pytest_plugins = "pytest_homeassistant_custom_component"
+
+
+def pytest_addoption(parser):
+    """Add the benchmark options."""
+    parser.addoption(
+        "--benchmark-json",
+        action="store",
+        default=None,
+        help="Write the benchmark results to this JSON file.",
+    )
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable custom integrations"""
+    yield
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Print the benchmark results and write them to the JSON file."""
+    results = results_as_dicts()
+    if not results:
+        return
+
+    terminalreporter.section("benchmark results (ms per op)")
+    terminalreporter.write_line(
+        f"{'benchmark':<24}{'vehicles':>10}{'min':>12}{'median':>12}"
+        f"{'mean':>12}{'max':>12}"
+    )
+    for result in results:
+        terminalreporter.write_line(
+            f"{result['name']:<24}{result['vehicles']:>10}"
+            f"{result['min']:>12.3f}{result['median']:>12.3f}"
+            f"{result['mean']:>12.3f}{result['max']:>12.3f}"
+        )
+
+    if path := config.getoption("--benchmark-json"):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
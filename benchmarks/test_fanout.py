@@ -0,0 +1,120 @@
+"""Benchmarks for Tesla setup, coordinator refreshes and TeslaMate pushes."""
+
+from datetime import timedelta
+from types import SimpleNamespace
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.tesla_custom.const import DOMAIN
+
+from .common import (
+    VEHICLE_COUNTS,
+    add_config_entry,
+    fleet_vin,
+    measure,
+    patch_fleet_controller,
+    setup_entry,
+)
+
+pytestmark = pytest.mark.asyncio
+
+# One message for each of the TeslaMate maps and the car state.
+TESLAMATE_MESSAGES = [
+    ("speed", "50"),
+    ("locked", "true"),
+    ("inside_temp", "21.5"),
+    ("battery_level", "80"),
+    ("rated_battery_range_km", "350.5"),
+    ("state", "online"),
+]
+
+
+@pytest.mark.parametrize("vehicles", VEHICLE_COUNTS)
+async def test_setup(hass: HomeAssistant, vehicles: int) -> None:
+    """Time setting up an account with every platform."""
+    with patch_fleet_controller(vehicles):
+        entry = add_config_entry(hass)
+
+        async def unload() -> None:
+            assert await hass.config_entries.async_unload(entry.entry_id)
+            await hass.async_block_till_done()
+
+        await measure(
+            "setup",
+            vehicles,
+            lambda: setup_entry(hass, entry),
+            rounds=5,
+            teardown=unload,
+        )
+
+
+@pytest.mark.parametrize("vehicles", VEHICLE_COUNTS)
+async def test_refresh(hass: HomeAssistant, vehicles: int) -> None:
+    """Time an account refresh and its fan-out to every car entity."""
+    with patch_fleet_controller(vehicles):
+        entry = add_config_entry(hass)
+        await setup_entry(hass, entry)
+        entry_data = hass.data[DOMAIN][entry.entry_id]
+        account_coordinator = entry_data["coordinators"]["update_vehicles"]
+        cars = list(entry_data["cars"].values())
+        level = 50
+
+        async def refresh() -> None:
+            nonlocal level
+            # Every refresh brings new data, like a polled car that is driving.
+            level = 50 if level == 80 else level + 1
+            for car in cars:
+                car._vehicle_data["charge_state"]["battery_level"] = level
+                car._vehicle_data["drive_state"]["speed"] = level
+            await account_coordinator.async_refresh()
+
+        await measure("refresh", vehicles, refresh, rounds=20)
+
+
+@pytest.mark.parametrize("vehicles", VEHICLE_COUNTS)
+async def test_teslamate_message(hass: HomeAssistant, vehicles: int) -> None:
+    """Time handling TeslaMate messages, then writing the debounced states."""
+    with patch_fleet_controller(vehicles):
+        entry = add_config_entry(hass)
+        await setup_entry(hass, entry)
+        teslamate = hass.data[DOMAIN][entry.entry_id]["teslamate"]
+        for index in range(vehicles):
+            await teslamate.set_car_id(fleet_vin(index), str(index))
+        messages = [
+            SimpleNamespace(topic=f"teslamate/cars/{index}/{attr}", payload=payload)
+            for index in range(vehicles)
+            for attr, payload in TESLAMATE_MESSAGES
+        ]
+
+        async def handle_messages() -> None:
+            for msg in messages:
+                teslamate.async_queue_message(msg)
+            await hass.async_block_till_done()
+
+        async def flush() -> None:
+            async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+            await hass.async_block_till_done()
+
+        await measure(
+            "teslamate message",
+            vehicles,
+            handle_messages,
+            rounds=10,
+            ops=len(messages),
+            teardown=flush,
+        )
+
+        async def handle_and_flush() -> None:
+            await handle_messages()
+            await flush()
+
+        await measure(
+            "teslamate message+flush",
+            vehicles,
+            handle_and_flush,
+            rounds=10,
+            ops=len(messages),
+        )
@@ -1,11 +1,12 @@
 """Support for Tesla cars."""
 
 import asyncio
+from collections.abc import Callable, Iterable
 from datetime import timedelta
 from functools import partial
 from http import HTTPStatus
 import logging
-import ssl
+import time
 from typing import Any
 
 import async_timeout
@@ -19,39 +20,81 @@ from homeassistant.const import (
     CONF_USERNAME,
     EVENT_HOMEASSISTANT_CLOSE,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv, device_registry as dr
 from homeassistant.helpers.event import async_call_later
-from homeassistant.helpers.httpx_client import SERVER_SOFTWARE, USER_AGENT
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 import httpx
 from teslajsonpy import Controller as TeslaAPI
-from teslajsonpy.const import AUTH_DOMAIN
+from teslajsonpy.car import TeslaCar
+from teslajsonpy.const import AUTH_DOMAIN, RESOURCE_TYPE_BATTERY
+from teslajsonpy.energy import EnergySite
 from teslajsonpy.exceptions import IncompleteCredentials, TeslaException
 
+from .client import TeslaHttpOptions, async_create_client
+from .commands import TeslaCommandQueue
 from .config_flow import CannotConnect, InvalidAuth, validate_input
 from .const import (
     CONF_API_PROXY_CERT,
     CONF_API_PROXY_URL,
+    CONF_ENABLE_FLEET_TELEMETRY,
     CONF_ENABLE_TESLAMATE,
     CONF_EXPIRATION,
+    CONF_FLEET_CONCURRENCY,
+    CONF_FLEET_MODE,
+    CONF_FLEET_REDUCED_ENTITIES,
     CONF_INCLUDE_ENERGYSITES,
     CONF_INCLUDE_VEHICLES,
     CONF_POLLING_POLICY,
+    CONF_REQUEST_BURST,
+    CONF_REQUEST_RATE,
+    CONF_TESLAMATE_BATCH_WINDOW,
+    CONF_TESLAMATE_SUBSCRIBE_ALL,
+    CONF_WAKE_COOLDOWN,
     CONF_WAKE_ON_START,
     DATA_LISTENER,
+    DEFAULT_ENABLE_FLEET_TELEMETRY,
     DEFAULT_ENABLE_TESLAMATE,
+    DEFAULT_FLEET_CONCURRENCY,
+    DEFAULT_FLEET_MODE,
+    DEFAULT_FLEET_REDUCED_ENTITIES,
     DEFAULT_POLLING_POLICY,
+    DEFAULT_REQUEST_BURST,
+    DEFAULT_REQUEST_RATE,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TESLAMATE_BATCH_WINDOW,
+    DEFAULT_TESLAMATE_SUBSCRIBE_ALL,
+    DEFAULT_WAKE_COOLDOWN,
     DEFAULT_WAKE_ON_START,
+    DISCOVERY_TIMEOUT,
     DOMAIN,
+    FLEET_PLATFORMS,
     MIN_SCAN_INTERVAL,
     PLATFORMS,
+    PUSH_DATA_TIMEOUT,
+    REFRESH_COALESCE_DELAY,
+    SCAN_INTERVAL_ACTIVE,
+    SCAN_INTERVAL_ASLEEP,
+    SCAN_INTERVAL_ENERGYSITE,
+    SCAN_INTERVAL_ENERGYSITE_IDLE,
+    SCAN_INTERVAL_ONLINE,
 )
+from .fleet import TeslaFleetPoller
+from .governor import TeslaRequestGovernor
+from .metrics import TeslaCoordinatorMetrics
 from .services import async_setup_services, async_unload_services
+from .snapshot import TeslaSnapshot, snapshot_store
+from .telemetry import TeslaFleetTelemetry
 from .teslamate import TeslaMate
-from .util import create_tesla_ssl_context
+from .util import (
+    DataPath,
+    async_get_tesla_ssl_context,
+    diff_car_data,
+    snapshot_car_data,
+    update_car_snapshot,
+)
+from .wake import TeslaWakeManager
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -71,6 +114,66 @@ def _async_save_tokens(hass, config_entry, access_token, refresh_token, expirati
     )
 
 
+def _raise_on_setup_error(ex: Exception) -> None:
+    """Raise the config entry error matching an error during setup.
+
+    Returns for errors that are not worth retrying, after logging them.
+    """
+    if isinstance(ex, IncompleteCredentials):
+        raise ConfigEntryAuthFailed from ex
+
+    if isinstance(ex, (asyncio.TimeoutError, httpx.ConnectTimeout, httpx.ConnectError)):
+        raise ConfigEntryNotReady from ex
+
+    if isinstance(ex, TeslaException):
+        if ex.code == HTTPStatus.UNAUTHORIZED:
+            raise ConfigEntryAuthFailed from ex
+
+        if ex.message in [
+            "TOO_MANY_REQUESTS",
+            "SERVICE_MAINTENANCE",
+            "UPSTREAM_TIMEOUT",
+        ]:
+            raise ConfigEntryNotReady(
+                f"Temporarily unable to communicate with Tesla API: {ex.message}"
+            ) from ex
+
+        _LOGGER.error("Unable to communicate with Tesla API: %s", ex.message)
+        return
+
+    raise ex
+
+
+def _platforms_for_devices(
+    cars: dict[str, TeslaCar],
+    energysites: dict[int, EnergySite],
+    reduced: bool = False,
+) -> list[str]:
+    """Return the platforms with entities for the discovered devices.
+
+    reduced limits the cars to the platforms of the fleet mode's reduced
+    entity set. Platforms forwarded for energy sites only must then skip the
+    cars, see "car_platforms" in the entry data.
+    """
+    platforms = set()
+    if cars:
+        platforms.update(FLEET_PLATFORMS if reduced else PLATFORMS)
+    for energysite in energysites.values():
+        platforms.add("sensor")
+        if energysite.resource_type == RESOURCE_TYPE_BATTERY:
+            platforms.update(("binary_sensor", "number", "select"))
+    return [platform for platform in PLATFORMS if platform in platforms]
+
+
+def _fleet_options(config_entry: ConfigEntry) -> tuple[bool, bool]:
+    """Return whether fleet mode and its reduced entity set are enabled."""
+    fleet_mode = config_entry.options.get(CONF_FLEET_MODE, DEFAULT_FLEET_MODE)
+    reduced = fleet_mode and config_entry.options.get(
+        CONF_FLEET_REDUCED_ENTITIES, DEFAULT_FLEET_REDUCED_ENTITIES
+    )
+    return fleet_mode, reduced
+
+
 @callback
 def _async_configured_emails(hass):
     """Return a set of configured Tesla emails."""
@@ -139,26 +242,28 @@ async def async_setup_entry(hass, config_entry):
     # pylint: disable=too-many-locals,too-many-statements,too-many-branches
     hass.data.setdefault(DOMAIN, {})
     config = config_entry.data
-    # Because users can have multiple accounts, we always
-    # create a new session so they have separate cookies
-
-    tesla_ssl_context = create_tesla_ssl_context()
-
-    if api_proxy_cert := config.get(CONF_API_PROXY_CERT):
-        try:
-            await hass.async_add_executor_job(
-                tesla_ssl_context.load_verify_locations, api_proxy_cert
-            )
-            if _LOGGER.isEnabledFor(logging.DEBUG):
-                _LOGGER.debug("Trusting CA: %s", tesla_ssl_context.get_ca_certs()[-1])
-        except (FileNotFoundError, ssl.SSLError):
-            _LOGGER.warning(
-                "Unable to load custom SSL certificate from %s",
-                api_proxy_cert,
-            )
-
-    async_client = httpx.AsyncClient(
-        headers={USER_AGENT: SERVER_SOFTWARE}, timeout=60, verify=tesla_ssl_context
+    # Because users can have multiple accounts, we always create a new
+    # client so they have separate cookies, on a connection pool shared by
+    # the accounts with the same certificate and connection options.
+
+    api_proxy_cert = config.get(CONF_API_PROXY_CERT)
+    # Reloads reuse the context built for the same certificate.
+    tesla_ssl_context = await async_get_tesla_ssl_context(hass, api_proxy_cert)
+
+    # Every request of the account, polls and commands alike, goes through
+    # the request governor's hooks on the account's client.
+    governor = TeslaRequestGovernor(
+        config_entry.options.get(CONF_REQUEST_RATE, DEFAULT_REQUEST_RATE),
+        config_entry.options.get(CONF_REQUEST_BURST, DEFAULT_REQUEST_BURST),
+    )
+    http_options = TeslaHttpOptions.from_options(config_entry.options)
+    async_client = async_create_client(
+        hass,
+        tesla_ssl_context,
+        api_proxy_cert,
+        http_options,
+        [governor.async_on_request],
+        [governor.async_on_response],
     )
     email = config_entry.title
 
@@ -172,6 +277,8 @@ async def async_setup_entry(hass, config_entry):
         )
         hass.data[DOMAIN].pop(email)
 
+    snapshot = TeslaSnapshot(hass, config_entry.entry_id)
+
     try:
         controller = TeslaAPI(
             async_client,
@@ -189,6 +296,7 @@ async def async_setup_entry(hass, config_entry):
             api_proxy_url=config.get(CONF_API_PROXY_URL),
             client_id=config.get(CONF_CLIENT_ID),
         )
+        snapshot_load = hass.async_create_task(snapshot.async_load())
         result = await controller.connect(
             include_vehicles=config.get(CONF_INCLUDE_VEHICLES),
             include_energysites=config.get(CONF_INCLUDE_ENERGYSITES),
@@ -197,30 +305,9 @@ async def async_setup_entry(hass, config_entry):
         access_token = result["access_token"]
         expiration = result["expiration"]
 
-    except IncompleteCredentials as ex:
-        await async_client.aclose()
-        raise ConfigEntryAuthFailed from ex
-
-    except (httpx.ConnectTimeout, httpx.ConnectError) as ex:
-        await async_client.aclose()
-        raise ConfigEntryNotReady from ex
-
-    except TeslaException as ex:
+    except (httpx.ConnectTimeout, httpx.ConnectError, TeslaException) as ex:
         await async_client.aclose()
-
-        if ex.code == HTTPStatus.UNAUTHORIZED:
-            raise ConfigEntryAuthFailed from ex
-
-        if ex.message in [
-            "TOO_MANY_REQUESTS",
-            "UPSTREAM_TIMEOUT",
-        ]:
-            raise ConfigEntryNotReady(
-                f"Temporarily unable to communicate with Tesla API: {ex.message}"
-            ) from ex
-
-        _LOGGER.error("Unable to communicate with Tesla API: %s", ex.message)
-
+        _raise_on_setup_error(ex)
         return False
 
     async def _async_close_client(*_):
@@ -248,54 +335,57 @@ async def async_setup_entry(hass, config_entry):
 
     _async_save_tokens(hass, config_entry, access_token, refresh_token, expiration)
 
-    try:
-        if config_entry.data.get("initial_setup"):
-            wake_if_asleep = True
-        else:
-            wake_if_asleep = config_entry.options.get(
-                CONF_WAKE_ON_START, DEFAULT_WAKE_ON_START
-            )
-
-        cars = await controller.generate_car_objects(wake_if_asleep=wake_if_asleep)
-
-        hass.config_entries.async_update_entry(
-            config_entry, data={**config_entry.data, "initial_setup": False}
+    if config_entry.data.get("initial_setup"):
+        wake_if_asleep = True
+    else:
+        wake_if_asleep = config_entry.options.get(
+            CONF_WAKE_ON_START, DEFAULT_WAKE_ON_START
         )
 
-    except TeslaException as ex:
-        await async_client.aclose()
-
-        if ex.message in [
-            "TOO_MANY_REQUESTS",
-            "SERVICE_MAINTENANCE",
-            "UPSTREAM_TIMEOUT",
-        ]:
-            raise ConfigEntryNotReady(
-                f"Temporarily unable to communicate with Tesla API: {ex.message}"
-            ) from ex
-
-        _LOGGER.error("Unable to communicate with Tesla API: %s", ex.message)
-
-        return False
-
+    # Vehicles and energy sites are discovered concurrently under one time
+    # budget, so setup takes about as long as the slowest of the two.
+    discovery = [
+        hass.async_create_task(
+            # Cars are woken through their wake managers once discovered.
+            controller.generate_car_objects(wake_if_asleep=False)
+        ),
+        hass.async_create_task(controller.generate_energysite_objects()),
+    ]
     try:
-        energysites = await controller.generate_energysite_objects()
-
-    except TeslaException as ex:
+        async with async_timeout.timeout(DISCOVERY_TIMEOUT):
+            cars, energysites = await asyncio.gather(*discovery)
+
+    except (
+        asyncio.TimeoutError,
+        httpx.ConnectTimeout,
+        httpx.ConnectError,
+        TeslaException,
+    ) as ex:
+        for task in discovery:
+            task.cancel()
         await async_client.aclose()
+        _raise_on_setup_error(ex)
+        return False
 
-        if ex.message in [
-            "TOO_MANY_REQUESTS",
-            "SERVICE_MAINTENANCE",
-            "UPSTREAM_TIMEOUT",
-        ]:
-            raise ConfigEntryNotReady(
-                f"Temporarily unable to communicate with Tesla API: {ex.message}"
-            ) from ex
-
-        _LOGGER.error("Unable to communicate with Tesla API: %s", ex.message)
+    hass.config_entries.async_update_entry(
+        config_entry, data={**config_entry.data, "initial_setup": False}
+    )
 
-        return False
+    # Sleeping cars are discovered without data, fill it in from the last
+    # known state so their entities do not stay unknown until they wake up.
+    await snapshot_load
+    restored_vins, restored_site_ids = snapshot.async_restore(cars, energysites)
+
+    fleet_mode, reduced_entities = _fleet_options(config_entry)
+    fleet = (
+        TeslaFleetPoller(
+            controller,
+            cars,
+            config_entry.options.get(CONF_FLEET_CONCURRENCY, DEFAULT_FLEET_CONCURRENCY),
+        )
+        if fleet_mode
+        else None
+    )
 
     reload_lock = asyncio.Lock()
     _partial_coordinator = partial(
@@ -305,33 +395,69 @@ async def async_setup_entry(hass, config_entry):
         controller=controller,
         reload_lock=reload_lock,
         update_vehicles=False,
+        governor=governor,
+    )
+    # A single account-level coordinator owns the only timer and runs one
+    # controller.update() pass for every VIN and energy site. The per-device
+    # coordinators below do not poll on their own; they are fed the result.
+    account_coordinator = _partial_coordinator(update_vehicles=True, fleet=fleet)
+    _partial_device_coordinator = partial(
+        _partial_coordinator, account_coordinator=account_coordinator
     )
     energy_coordinators = {
-        energy_site_id: _partial_coordinator(energy_site_id=energy_site_id)
-        for energy_site_id in energysites
+        energy_site_id: _partial_device_coordinator(
+            energy_site_id=energy_site_id, energysite=energysite
+        )
+        for energy_site_id, energysite in energysites.items()
+    }
+    car_coordinators = {
+        vin: _partial_device_coordinator(vin=vin, car=car) for vin, car in cars.items()
     }
-    car_coordinators = {vin: _partial_coordinator(vin=vin) for vin in cars}
+    for vin in restored_vins:
+        car_coordinators[vin].async_set_restored()
+    for energy_site_id in restored_site_ids:
+        energy_coordinators[energy_site_id].async_set_restored()
+
+    if wake_if_asleep:
+        # The priming refresh below fetches the data of the cars woken here.
+        await asyncio.gather(
+            *(
+                coordinator.wake_manager.async_wake_up()
+                for vin, coordinator in car_coordinators.items()
+                if not cars[vin].is_on
+            ),
+            return_exceptions=True,
+        )
     coordinators = {**energy_coordinators, **car_coordinators}
 
-    if car_coordinators:
-        update_vehicles_coordinator = _partial_coordinator(update_vehicles=True)
-        coordinators["update_vehicles"] = update_vehicles_coordinator
+    if coordinators:
+        coordinators["update_vehicles"] = account_coordinator
 
-        # If we have cars, we want to update the vehicles coordinator
-        # to keep the vehicles up to date.
         @callback
         def _async_update_vehicles():
-            """Update vehicles coordinator.
+            """Save the latest account data as the last known state.
 
-            This listener is called when the update_vehicles_coordinator
-            is updated. Since each car coordinator is also polling we don't
-            need to do anything here, but we need to have this listener
-            to ensure the update_vehicles_coordinator is updated regularly.
+            The account coordinator pushes its results to the device
+            coordinators itself. The listener also keeps the account
+            coordinator's refresh timer scheduled.
             """
-
-        update_vehicles_coordinator.async_add_listener(_async_update_vehicles)
-
-    teslamate = TeslaMate(hass=hass, cars=cars, coordinators=coordinators)
+            if account_coordinator.last_update_success:
+                snapshot.async_schedule_save()
+
+        account_coordinator.async_add_listener(_async_update_vehicles)
+
+    teslamate = TeslaMate(
+        hass=hass,
+        cars=cars,
+        coordinators=coordinators,
+        batch_window=config_entry.options.get(
+            CONF_TESLAMATE_BATCH_WINDOW, DEFAULT_TESLAMATE_BATCH_WINDOW
+        ),
+        subscribe_all=config_entry.options.get(
+            CONF_TESLAMATE_SUBSCRIBE_ALL, DEFAULT_TESLAMATE_SUBSCRIBE_ALL
+        ),
+    )
+    platforms = _platforms_for_devices(cars, energysites, reduced_entities)
 
     enable_teslamate = config_entry.options.get(
         CONF_ENABLE_TESLAMATE, DEFAULT_ENABLE_TESLAMATE
@@ -339,31 +465,49 @@ async def async_setup_entry(hass, config_entry):
 
     await teslamate.enable(enable_teslamate)
 
+    telemetry = TeslaFleetTelemetry(hass=hass, coordinators=coordinators, cars=cars)
+    telemetry.async_enable(
+        config_entry.options.get(
+            CONF_ENABLE_FLEET_TELEMETRY, DEFAULT_ENABLE_FLEET_TELEMETRY
+        )
+    )
+
     hass.data[DOMAIN][config_entry.entry_id] = {
         "controller": controller,
         "coordinators": coordinators,
         "cars": cars,
         "energysites": energysites,
         "teslamate": teslamate,
+        "telemetry": telemetry,
+        "snapshot": snapshot,
+        "platforms": platforms,
+        "car_platforms": FLEET_PLATFORMS if reduced_entities else PLATFORMS,
+        "governor": governor,
+        "fleet": fleet,
+        "http_options": http_options,
         DATA_LISTENER: [config_entry.add_update_listener(update_listener)],
     }
     _LOGGER.debug("Connected to the Tesla API")
 
-    # We do not do a first refresh as we already know the API is working
-    # from above. Each platform will schedule a refresh via update_before_add
-    # for the sites/vehicles they are interested in.
+    # Prime every device with a single account refresh before the platforms
+    # add their entities, instead of each entity requesting its own update.
+    # Failures are not fatal as we already know the API is working from
+    # above; the entities start unavailable and the account coordinator
+    # keeps polling.
+    if coordinators:
+        await account_coordinator.async_refresh()
 
-    await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
+    await hass.config_entries.async_forward_entry_setups(config_entry, platforms)
 
     return True
 
 
 async def async_unload_entry(hass, config_entry) -> bool:
     """Unload a config entry."""
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
     unload_ok = await hass.config_entries.async_unload_platforms(
-        config_entry, PLATFORMS
+        config_entry, entry_data["platforms"]
     )
-    entry_data = hass.data[DOMAIN][config_entry.entry_id]
     controller: TeslaAPI = entry_data["controller"]
     await controller.disconnect()
 
@@ -372,6 +516,7 @@ async def async_unload_entry(hass, config_entry) -> bool:
     username = config_entry.title
 
     await entry_data["teslamate"].unload()
+    entry_data["telemetry"].async_unload()
 
     if unload_ok:
         hass.data[DOMAIN].pop(config_entry.entry_id)
@@ -385,6 +530,11 @@ async def async_unload_entry(hass, config_entry) -> bool:
     return False
 
 
+async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Remove the last known state of a removed config entry."""
+    await snapshot_store(hass, config_entry.entry_id).async_remove()
+
+
 async def async_remove_config_entry_device(
     hass: HomeAssistant, config_entry: ConfigEntry, device_entry: dr.DeviceEntry
 ) -> bool:
@@ -392,13 +542,13 @@ async def async_remove_config_entry_device(
 
     Allow removal only for devices that are no longer provided by the
     integration (e.g. a vehicle that was removed from the Tesla account). The
-    live car(s) and energy site(s) are protected from deletion. Removal is
-    refused while the entry is not loaded, since we cannot then confirm what is
-    currently provided.
+    live car(s), energy site(s) and the account itself are protected from
+    deletion. Removal is refused while the entry is not loaded, since we cannot
+    then confirm what is currently provided.
     """
     # Imported lazily to avoid a circular import: base imports
     # TeslaDataUpdateCoordinator from this module at top level.
-    from .base import device_identifier
+    from .base import account_device_identifier, device_identifier
 
     entry_data = hass.data.get(DOMAIN, {}).get(config_entry.entry_id)
     if not entry_data:
@@ -408,12 +558,33 @@ async def async_remove_config_entry_device(
         for tesla_device in list((entry_data.get("cars") or {}).values())
         + list((entry_data.get("energysites") or {}).values())
     }
+    provided.add(account_device_identifier(config_entry))
     return not device_entry.identifiers.intersection(provided)
 
 
 async def update_listener(hass, config_entry):
     """Update when config_entry options update."""
     entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    fleet_mode, reduced_entities = _fleet_options(config_entry)
+    fleet: TeslaFleetPoller | None = entry_data["fleet"]
+    platforms = _platforms_for_devices(
+        entry_data["cars"], entry_data["energysites"], reduced_entities
+    )
+    if (
+        fleet_mode != (fleet is not None)
+        or platforms != entry_data["platforms"]
+        or TeslaHttpOptions.from_options(config_entry.options)
+        != entry_data["http_options"]
+    ):
+        # The account coordinator, the entities and the client are set up
+        # for the options at the time.
+        hass.async_create_task(hass.config_entries.async_reload(config_entry.entry_id))
+        return
+    if fleet is not None:
+        fleet.concurrency = config_entry.options.get(
+            CONF_FLEET_CONCURRENCY, DEFAULT_FLEET_CONCURRENCY
+        )
+
     controller: TeslaAPI = entry_data["controller"]
     old_update_interval = controller.update_interval
     controller.update_interval = config_entry.options.get(
@@ -426,11 +597,32 @@ async def update_listener(hass, config_entry):
             controller.update_interval,
         )
 
+    entry_data["governor"].configure(
+        config_entry.options.get(CONF_REQUEST_RATE, DEFAULT_REQUEST_RATE),
+        config_entry.options.get(CONF_REQUEST_BURST, DEFAULT_REQUEST_BURST),
+    )
+
     enable_teslamate = config_entry.options.get(
         CONF_ENABLE_TESLAMATE, DEFAULT_ENABLE_TESLAMATE
     )
 
+    wake_cooldown = config_entry.options.get(CONF_WAKE_COOLDOWN, DEFAULT_WAKE_COOLDOWN)
+    for coordinator in entry_data["coordinators"].values():
+        if coordinator.wake_manager is not None:
+            coordinator.wake_manager.cooldown = wake_cooldown
+
+    entry_data["teslamate"].batch_window = config_entry.options.get(
+        CONF_TESLAMATE_BATCH_WINDOW, DEFAULT_TESLAMATE_BATCH_WINDOW
+    )
+    entry_data["teslamate"].subscribe_all = config_entry.options.get(
+        CONF_TESLAMATE_SUBSCRIBE_ALL, DEFAULT_TESLAMATE_SUBSCRIBE_ALL
+    )
     await entry_data["teslamate"].enable(enable_teslamate)
+    entry_data["telemetry"].async_enable(
+        config_entry.options.get(
+            CONF_ENABLE_FLEET_TELEMETRY, DEFAULT_ENABLE_FLEET_TELEMETRY
+        )
+    )
 
 
 class TeslaDataUpdateCoordinator(DataUpdateCoordinator):
@@ -444,24 +636,75 @@ class TeslaDataUpdateCoordinator(DataUpdateCoordinator):
         controller: TeslaAPI,
         reload_lock: asyncio.Lock,
         vin: str | None = None,
+        car: TeslaCar | None = None,
         energy_site_id: str | None = None,
+        energysite: EnergySite | None = None,
         update_vehicles: bool = False,
+        account_coordinator: "TeslaDataUpdateCoordinator | None" = None,
+        governor: TeslaRequestGovernor | None = None,
+        fleet: TeslaFleetPoller | None = None,
     ) -> None:
-        """Initialize global Tesla data updater."""
+        """Initialize global Tesla data updater.
+
+        When ``account_coordinator`` is provided, this coordinator does not
+        schedule its own refreshes. Instead it registers with the account
+        coordinator, which polls every device in a single pass and pushes the
+        result here. An account coordinator given ``fleet`` polls through it.
+        """
         self.controller = controller
         self.config_entry = config_entry
         self.reload_lock = reload_lock
         self.vin = vin
         self.vins = {vin} if vin else set()
+        self.car = car
         self.energy_site_id = energy_site_id
         self.energy_site_ids = {energy_site_id} if energy_site_id else set()
+        self.energysite = energysite
+        # Loop time the energy site was last polled at.
+        self.last_site_poll_time: float | None = None
         self.update_vehicles = update_vehicles
+        self.governor = governor
+        self.fleet = fleet
+        self.device_coordinators: list[TeslaDataUpdateCoordinator] = []
         self._cancel_debounce_timer = None
         self._last_update_time = None
         self.last_update_time: float | None = None
+        self.last_push_time: float | None = None
         self.assumed_state = True
+        # Set while the device data is the last known state restored at
+        # startup, until the controller fetched the car data after the update
+        # time below, or the site data differs from the restored site data.
+        self.restored = False
+        self._restored_update_time = None
+        self._restored_site_data: dict | None = None
+        # Paths of the car data that changed since the previous listener
+        # update, or None when unknown and every listener should be written.
+        self.changed_paths: set[DataPath] | None = None
+        self._data_snapshot: dict[str | None, dict] | None = None
+        # Entity callbacks by the car data path they read, so pushed values
+        # only write the entities that depend on them.
+        self._path_listeners: dict[DataPath, list[CALLBACK_TYPE]] = {}
+        # Paths waiting on the debounce timer, None when a full update is due.
+        self._pending_paths: set[DataPath] | None = set()
+        # The car update callers can still join, with the flags it will use.
+        self._car_update: asyncio.Task | None = None
+        self._car_update_wake = False
+        self._car_update_force = False
+        self.wake_manager: TeslaWakeManager | None = None
+        self.commands: TeslaCommandQueue | None = None
+        self.metrics = TeslaCoordinatorMetrics()
+        if car is not None:
+            self.wake_manager = TeslaWakeManager(
+                hass,
+                car,
+                config_entry.options.get(CONF_WAKE_COOLDOWN, DEFAULT_WAKE_COOLDOWN),
+            )
+            self.commands = TeslaCommandQueue(hass, car, self.wake_manager)
 
-        update_interval = timedelta(seconds=MIN_SCAN_INTERVAL)
+        if account_coordinator is None:
+            update_interval = timedelta(seconds=MIN_SCAN_INTERVAL)
+        else:
+            update_interval = None
 
         super().__init__(
             hass,
@@ -471,6 +714,61 @@ class TeslaDataUpdateCoordinator(DataUpdateCoordinator):
             update_interval=update_interval,
         )
 
+        if account_coordinator is not None:
+            account_coordinator.async_add_device_coordinator(self)
+
+    async def async_update_car(
+        self, *, wake_if_asleep: bool = False, force: bool = True
+    ) -> None:
+        """Update the car from the API, then refresh the coordinator.
+
+        Calls within REFRESH_COALESCE_DELAY of each other share one update,
+        e.g. a scene setting several seat heaters fetches the car data once.
+        """
+        self._car_update_wake |= wake_if_asleep
+        self._car_update_force |= force
+        if self._car_update is None:
+            self._car_update = self.hass.async_create_task(
+                self._async_update_car(), f"{DOMAIN} update car {self.vin}"
+            )
+        # Shielded so a cancelled caller does not cancel the shared update.
+        await asyncio.shield(self._car_update)
+
+    async def _async_update_car(self) -> None:
+        """Run the shared car update once the coalescing window closed."""
+        await asyncio.sleep(REFRESH_COALESCE_DELAY)
+        wake_if_asleep = self._car_update_wake
+        force = self._car_update_force
+        # Callers from now on need data fetched after their command.
+        self._car_update = None
+        self._car_update_wake = self._car_update_force = False
+        if wake_if_asleep and not self.car.is_on:
+            await self.wake_manager.async_wake_up()
+        # The controller must not wake the car itself, a car still asleep
+        # after the wake manager's attempt is not updated.
+        with self.metrics.update_latency.time():
+            await self.controller.update(self.car.id, wake_if_asleep=False, force=force)
+        await self.async_refresh()
+
+    @property
+    def debounce_scheduled(self) -> bool:
+        """Return whether debounced listener updates are waiting on the timer."""
+        return self._cancel_debounce_timer is not None
+
+    @property
+    def pending_paths(self) -> set[DataPath] | None:
+        """Return the paths waiting on the debounce timer, None for all."""
+        return self._pending_paths
+
+    @callback
+    def async_add_device_coordinator(
+        self, coordinator: "TeslaDataUpdateCoordinator"
+    ) -> None:
+        """Register a device coordinator to be fed by this coordinator."""
+        self.device_coordinators.append(coordinator)
+        self.vins |= coordinator.vins
+        self.energy_site_ids |= coordinator.energy_site_ids
+
     async def _async_update_data(self):
         """Fetch data from API endpoint."""
         controller = self.controller
@@ -486,17 +784,34 @@ class TeslaDataUpdateCoordinator(DataUpdateCoordinator):
             )
             _LOGGER.debug("Saving new tokens in config_entry")
 
+        if self.governor is not None and (backoff := self.governor.backoff_remaining):
+            # Do not hit the API again before it accepts requests, and do not
+            # tick again before then either.
+            self._async_back_off_update_interval(backoff)
+            self.metrics.update_failed += 1
+            raise UpdateFailed(
+                f"Rate limited by the Tesla API, retrying in {backoff:.0f} seconds"
+            )
+
         data = None
+        metrics = self.metrics
+        requests = self.governor.request_count if self.governor is not None else None
+        vins = self._polled_vins()
+        energy_site_ids = self._due_energy_site_ids()
         try:
             # Note: asyncio.TimeoutError and aiohttp.ClientError are already
             # handled by the data update coordinator.
             async with async_timeout.timeout(30):
                 _LOGGER.debug("Running controller.update()")
-                data = await controller.update(
-                    vins=self.vins,
-                    energy_site_ids=self.energy_site_ids,
-                    update_vehicles=self.update_vehicles,
-                )
+                with metrics.update_latency.time():
+                    if self.fleet is not None:
+                        data = await self.fleet.async_update(vins, energy_site_ids)
+                    else:
+                        data = await controller.update(
+                            vins=vins,
+                            energy_site_ids=energy_site_ids,
+                            update_vehicles=self.update_vehicles,
+                        )
         except IncompleteCredentials:
             if self.reload_lock.locked():
                 # Any of the coordinators can trigger a reload, but we only
@@ -504,6 +819,7 @@ class TeslaDataUpdateCoordinator(DataUpdateCoordinator):
                 # another coordinator is already reloading.
                 _LOGGER.debug("Config entry is already being reloaded")
                 return
+            metrics.reloads += 1
             async with self.reload_lock:
                 await self.hass.config_entries.async_reload(self.config_entry.entry_id)
         except KeyError as err:
@@ -513,22 +829,256 @@ class TeslaDataUpdateCoordinator(DataUpdateCoordinator):
                 _LOGGER.debug("Config entry is already being reloaded")
                 return
             _LOGGER.info("Reloading config entry after vehicle list changed")
+            metrics.reloads += 1
             async with self.reload_lock:
                 await self.hass.config_entries.async_reload(self.config_entry.entry_id)
         except TeslaException as err:
+            if err.code == HTTPStatus.TOO_MANY_REQUESTS and self.governor is not None:
+                self._async_back_off_update_interval(self.governor.backoff_remaining)
+            metrics.update_failed += 1
             raise UpdateFailed(f"Error communicating with API: {err}") from err
         else:
-            if vin := self.vin:
-                self.last_update_time = controller.get_last_update_time(vin=vin)
-                self.assumed_state = not controller.is_car_online(vin=vin) and (
-                    self.last_update_time - controller.get_last_wake_up_time(vin=vin)
-                    > controller.update_interval
-                )
+            if not self.vin:
+                # Car coordinators count their fetches per VIN instead, in
+                # _async_update_vehicle_state.
+                if requests is None or self.governor.request_count > requests:
+                    metrics.api_calls += 1
+                else:
+                    metrics.cache_hits += 1
+            now = self.hass.loop.time()
+            for coordinator in self.device_coordinators or [self]:
+                if coordinator.energy_site_id in energy_site_ids:
+                    coordinator.last_site_poll_time = now
+                coordinator._async_update_vehicle_state()
+            if self.update_interval is not None:
+                self._async_adapt_update_interval()
         return data
 
+    @property
+    def push_active(self) -> bool:
+        """Return whether data is currently being pushed to this coordinator."""
+        return (
+            self.last_push_time is not None
+            and self.hass.loop.time() - self.last_push_time < PUSH_DATA_TIMEOUT
+        )
+
+    def _calculate_update_interval(self) -> timedelta | None:
+        """Return how often this device needs a tick given its current state.
+
+        Returns None when the device does not need polling at all, e.g. while
+        TeslaMate is pushing its data.
+        """
+        if self.energy_site_id:
+            if self._energysite_active():
+                return timedelta(seconds=SCAN_INTERVAL_ENERGYSITE)
+            return timedelta(seconds=SCAN_INTERVAL_ENERGYSITE_IDLE)
+        if not (vin := self.vin) or self.push_active:
+            return None
+        if self.assumed_state or not self.controller.is_car_online(vin=vin):
+            return timedelta(seconds=SCAN_INTERVAL_ASLEEP)
+        if (car := self.car) is not None and (
+            car.shift_state in ("D", "R", "N")
+            or (car.charging_state == "Charging" and car.fast_charger_present)
+        ):
+            return timedelta(seconds=SCAN_INTERVAL_ACTIVE)
+        return timedelta(seconds=SCAN_INTERVAL_ONLINE)
+
+    def _energysite_active(self) -> bool:
+        """Return whether the energy site produces or (dis)charges power."""
+        energysite = self.energysite
+        if energysite is None or not energysite.data_available:
+            return True
+        return bool(getattr(energysite, "solar_power", None)) or bool(
+            getattr(energysite, "battery_power", None)
+        )
+
+    def _polled_vins(self) -> set[str]:
+        """Return the cars to poll, leaving out those pushing data."""
+        return {
+            coordinator.vin
+            for coordinator in self.device_coordinators or [self]
+            if coordinator.vin and not coordinator.push_active
+        }
+
+    def _due_energy_site_ids(self) -> set[str]:
+        """Return the energy sites whose interval passed since they were polled."""
+        # Ticks are scheduled on whole seconds and may fire up to a second
+        # before the interval passed.
+        now = self.hass.loop.time() + 1
+        return {
+            coordinator.energy_site_id
+            for coordinator in self.device_coordinators or [self]
+            if coordinator.energy_site_id
+            and (
+                coordinator.last_site_poll_time is None
+                or now - coordinator.last_site_poll_time
+                >= coordinator._calculate_update_interval().total_seconds()
+            )
+        }
+
+    @callback
+    def _async_adapt_update_interval(self) -> None:
+        """Tick as fast as the most active device we refresh requires."""
+        intervals = [
+            interval
+            for coordinator in self.device_coordinators or [self]
+            if (interval := coordinator._calculate_update_interval()) is not None
+        ]
+        update_interval = (
+            min(intervals) if intervals else timedelta(seconds=PUSH_DATA_TIMEOUT)
+        )
+        if update_interval != self.update_interval:
+            _LOGGER.debug(
+                "Changing coordinator update interval from %s to %s",
+                self.update_interval,
+                update_interval,
+            )
+            self.update_interval = update_interval
+
+    @callback
+    def _async_back_off_update_interval(self, backoff: float) -> None:
+        """Tick no sooner than backoff seconds from now.
+
+        The interval is recalculated after the next successful update.
+        """
+        if self.update_interval is not None and backoff > 0:
+            self.update_interval = max(self.update_interval, timedelta(seconds=backoff))
+
+    @callback
+    def async_set_restored(self) -> None:
+        """Flag the device data as restored until the data is next fetched."""
+        self.restored = True
+        if (energysite := self.energysite) is not None:
+            # Live site data always differs from the snapshot, if only in its
+            # timestamp.
+            # pylint: disable=protected-access
+            self._restored_site_data = dict(energysite._site_data)
+        else:
+            self._restored_update_time = self.controller.get_last_update_time(
+                vin=self.vin
+            )
+
+    @callback
+    def _async_update_vehicle_state(self) -> None:
+        """Refresh the cached update time and assumed state of our device."""
+        if vin := self.vin:
+            controller = self.controller
+            previous_update_time = self.last_update_time
+            self.last_update_time = controller.get_last_update_time(vin=vin)
+            if previous_update_time is not None:
+                # The controller only moves the update time when it fetched
+                # the car data, otherwise its cache was used.
+                if self.last_update_time != previous_update_time:
+                    self.metrics.api_calls += 1
+                else:
+                    self.metrics.cache_hits += 1
+            if self.restored and self.last_update_time != self._restored_update_time:
+                # The car data was fetched, it is no longer restored.
+                self.restored = False
+            is_car_online = controller.is_car_online(vin=vin)
+            self.assumed_state = self.restored or (
+                not is_car_online
+                and self.last_update_time - controller.get_last_wake_up_time(vin=vin)
+                > controller.update_interval
+            )
+        elif (energysite := self.energysite) is not None:
+            # pylint: disable=protected-access
+            if self.restored and energysite._site_data != self._restored_site_data:
+                # The site data was fetched, it is no longer restored.
+                self.restored = False
+            self.assumed_state = self.restored
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Push the latest result to device coordinators, then update listeners."""
+        with self.metrics.fanout_latency.time():
+            for coordinator in self.device_coordinators:
+                coordinator.async_handle_account_update(self)
+            if self.car is not None:
+                self._async_update_changed_paths()
+            super().async_update_listeners()
+
+    @callback
+    def _async_update_changed_paths(self) -> None:
+        """Diff the car data against the data seen by the last listener update."""
+        snapshot = snapshot_car_data(self.car)
+        if self._data_snapshot is None:
+            self.changed_paths = None
+        else:
+            self.changed_paths = diff_car_data(self._data_snapshot, snapshot)
+        self._data_snapshot = snapshot
+
+    @callback
+    def async_add_path_listener(
+        self, paths: Iterable[DataPath], update_callback: CALLBACK_TYPE
+    ) -> Callable[[], None]:
+        """Call update_callback when any of paths is pushed, return a remover."""
+        paths = tuple(paths)
+        for path in paths:
+            self._path_listeners.setdefault(path, []).append(update_callback)
+
+        @callback
+        def remove_path_listener() -> None:
+            """Remove the path listener."""
+            for path in paths:
+                listeners = self._path_listeners.get(path)
+                if listeners is None or update_callback not in listeners:
+                    continue
+                listeners.remove(update_callback)
+                if not listeners:
+                    del self._path_listeners[path]
+
+        return remove_path_listener
+
+    @callback
+    def async_update_path_listeners(self, paths: set[DataPath]) -> None:
+        """Update only the listeners reading one of the changed paths."""
+        if self._data_snapshot is not None:
+            update_car_snapshot(self._data_snapshot, self.car, paths)
+        self.changed_paths = paths
+        update_callbacks: dict[CALLBACK_TYPE, None] = {}
+        for sub_path, attr in paths:
+            for key in ((sub_path, attr), (sub_path, None)):
+                update_callbacks.update(
+                    dict.fromkeys(self._path_listeners.get(key, ()))
+                )
+        with self.metrics.fanout_latency.time():
+            for update_callback in update_callbacks:
+                update_callback()
+
+    @callback
+    def async_handle_account_update(
+        self, account_coordinator: "TeslaDataUpdateCoordinator"
+    ) -> None:
+        """Apply the result of an account-level refresh to this device."""
+        self.last_exception = account_coordinator.last_exception
+        if account_coordinator.last_update_success:
+            self.async_set_updated_data(account_coordinator.data)
+            return
+        if self.last_update_success:
+            self.last_update_success = False
+            self.async_update_listeners()
+
+    @callback
+    def async_handle_pushed_data(self, paths: set[DataPath]) -> None:
+        """Take car data pushed to us (e.g. by TeslaMate) at paths as current.
+
+        Only the entities reading the changed paths need a state write, unless
+        the data was assumed until now and every entity has to drop that.
+        """
+        if self.assumed_state:
+            paths = None
+        self.last_update_time = round(time.time())
+        self.last_push_time = self.hass.loop.time()
+        self.assumed_state = False
+        self.async_update_listeners_debounced(paths=paths)
+
     @callback
     def async_update_listeners_debounced(
-        self, delay_since_last=0.1, max_delay=1.0
+        self,
+        delay_since_last=0.1,
+        max_delay=1.0,
+        paths: Iterable[DataPath] | None = None,
     ) -> None:
         """
         Debounced version of async_update_listeners.
@@ -542,8 +1092,16 @@ class TeslaDataUpdateCoordinator(DataUpdateCoordinator):
         max_delay : float
             Maximum delay in seconds before calling async_update_listeners,
             regardless of when the last message was received.
+        paths : Iterable[DataPath] | None
+            Car data paths that changed. When every pending call passed paths,
+            only the listeners reading them are updated.
 
         """
+        if paths is None:
+            self._pending_paths = None
+        elif self._pending_paths is not None:
+            self._pending_paths.update(paths)
+
         # If there's an existing debounce task, cancel it
         if self._cancel_debounce_timer:
             self._cancel_debounce_timer()
@@ -568,6 +1126,8 @@ class TeslaDataUpdateCoordinator(DataUpdateCoordinator):
             Maximum delay in seconds before calling async_update_listeners.
 
         """
+        # The timer that called us has fired
+        self._cancel_debounce_timer = None
         # Get the current time
         now = self.hass.loop.time()
 
@@ -575,7 +1135,11 @@ class TeslaDataUpdateCoordinator(DataUpdateCoordinator):
         # call async_update_listeners and update the last update time
         if not self._last_update_time or now - self._last_update_time >= max_delay:
             self._last_update_time = now
-            self.async_update_listeners()
+            paths, self._pending_paths = self._pending_paths, set()
+            if paths is None or self.car is None:
+                self.async_update_listeners()
+            else:
+                self.async_update_path_listeners(paths)
             _LOGGER.debug("Listeners updated")
         else:
             # If it hasn't been max_delay since the last update,
@@ -1,6 +1,11 @@
 """Support for Tesla cars and energy sites."""
 
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import slugify
@@ -10,6 +15,12 @@ from teslajsonpy.energy import EnergySite
 
 from . import TeslaDataUpdateCoordinator
 from .const import ATTRIBUTION, DOMAIN
+from .util import DataPath
+
+
+def account_device_identifier(config_entry: ConfigEntry) -> tuple[str, str]:
+    """Return the (DOMAIN, entry_id) device-registry identifier for an account."""
+    return (DOMAIN, config_entry.entry_id)
 
 
 def device_identifier(tesla_device: TeslaCar | EnergySite) -> tuple[str, int]:
@@ -49,6 +60,12 @@ class TeslaBaseEntity(CoordinatorEntity[TeslaDataUpdateCoordinator]):
 class TeslaCarEntity(TeslaBaseEntity):
     """Representation of a Tesla car device."""
 
+    # (sub_path, attr) paths of the car data this entity's state is built from.
+    # Entities declaring paths are only written when one of them changed, an
+    # empty tuple means the state does not depend on the car data. Entities
+    # leaving this as None are written whenever the car was updated.
+    _data_paths: tuple[DataPath, ...] | None = None
+
     def __init__(
         self,
         car: TeslaCar,
@@ -74,27 +91,58 @@ class TeslaCarEntity(TeslaBaseEntity):
             sw_version=car.car_version,
         )
         self._last_update_success: bool | None = None
+        self._last_assumed_state: bool | None = None
         self.last_update_time: float | None = None
 
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to pushed changes of the entity's data paths."""
+        await super().async_added_to_hass()
+        if self._data_paths:
+            self.async_on_remove(
+                self.coordinator.async_add_path_listener(
+                    self._data_paths, self._handle_coordinator_update
+                )
+            )
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         prev_last_update_success = self._last_update_success
         prev_last_update_time = self.last_update_time
+        prev_assumed_state = self._last_assumed_state
         coordinator = self.coordinator
         current_last_update_success = coordinator.last_update_success
         current_last_update_time = coordinator.last_update_time
         self._last_update_success = current_last_update_success
+        self._last_assumed_state = coordinator.assumed_state
         self.last_update_time = current_last_update_time
         if (
             prev_last_update_success == current_last_update_success
-            and prev_last_update_time == current_last_update_time
+            and prev_assumed_state == coordinator.assumed_state
         ):
-            # If there was no change in the last update success or time,
-            # avoid writing state to prevent unnecessary entity updates.
-            return
+            if self._data_paths is not None:
+                if not self._data_changed(coordinator.changed_paths):
+                    # None of the data this entity is built from changed,
+                    # avoid writing state to prevent unnecessary updates.
+                    return
+            elif prev_last_update_time == current_last_update_time:
+                # If there was no change in the last update success or time,
+                # avoid writing state to prevent unnecessary entity updates.
+                return
         super()._handle_coordinator_update()
 
+    def _data_changed(self, changed_paths: set[DataPath] | None) -> bool:
+        """Return whether any of the entity's data paths are in changed_paths."""
+        if changed_paths is None:
+            return True
+        for sub_path, attr in self._data_paths:
+            if attr is not None:
+                if (sub_path, attr) in changed_paths:
+                    return True
+            elif any(path[0] == sub_path for path in changed_paths):
+                return True
+        return False
+
     async def update_controller(
         self, *, wake_if_asleep: bool = False, force: bool = True, blocking: bool = True
     ) -> None:
@@ -102,6 +150,7 @@ class TeslaCarEntity(TeslaBaseEntity):
 
         This does a controller update then a coordinator update.
         The coordinator triggers a call to the refresh function.
+        Concurrent calls for the same car share a single update.
 
         Setting the blocking param to False will create a background task for the update.
         """
@@ -112,10 +161,23 @@ class TeslaCarEntity(TeslaBaseEntity):
             )
             return
 
-        await self.coordinator.controller.update(
-            self._car.id, wake_if_asleep=wake_if_asleep, force=force
+        await self.coordinator.async_update_car(
+            wake_if_asleep=wake_if_asleep, force=force
         )
-        await self.coordinator.async_refresh()
+
+    async def async_send_command(
+        self,
+        key: str | None,
+        command: Callable[..., Awaitable[Any]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """Send a command through the car's command queue.
+
+        A command still waiting in the queue is replaced by a newer one with
+        the same key, None keeps every call, e.g. for toggles.
+        """
+        return await self.coordinator.commands.async_send(key, command, *args, **kwargs)
 
     @property
     def assumed_state(self) -> bool:
@@ -147,3 +209,26 @@ class TeslaEnergyEntity(TeslaBaseEntity):
             name=energysite.site_name,
             sw_version=sw_version,
         )
+
+    @property
+    def assumed_state(self) -> bool:
+        """Return whether the data is restored rather than live."""
+        return self.coordinator.assumed_state
+
+
+class TeslaAccountEntity(TeslaBaseEntity):
+    """Representation of a Tesla account service."""
+
+    def __init__(
+        self,
+        config_entry: ConfigEntry,
+        coordinator: TeslaDataUpdateCoordinator,
+    ) -> None:
+        """Initialise the Tesla account service."""
+        super().__init__(config_entry.entry_id, coordinator)
+        self._attr_device_info = DeviceInfo(
+            identifiers={account_device_identifier(config_entry)},
+            manufacturer="Tesla",
+            name=config_entry.title,
+            entry_type=DeviceEntryType.SERVICE,
+        )
@@ -42,13 +42,14 @@ async def async_setup_entry(hass: HomeAssistant, config_entry, async_add_entitie
             entities.append(TeslaEnergyBatteryCharging(energysite, coordinator))
             entities.append(TeslaEnergyGridStatus(energysite, coordinator))
 
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities)
 
 
 class TeslaCarParkingBrake(TeslaCarEntity, BinarySensorEntity):
     """Representation of a Tesla car parking brake binary sensor."""
 
     type = "parking brake"
+    _data_paths = (("drive_state", "shift_state"),)
     _attr_icon = "mdi:car-brake-parking"
     _attr_device_class = None
 
@@ -63,6 +64,13 @@ class TeslaCarChargerConnection(TeslaCarEntity, BinarySensorEntity):
     """Representation of a Tesla car charger connection binary sensor."""
 
     type = "charger"
+    _data_paths = (
+        ("charge_state", "charging_state"),
+        ("charge_state", "conn_charge_cable"),
+        ("charge_state", "fast_charger_present"),
+        ("charge_state", "fast_charger_brand"),
+        ("charge_state", "fast_charger_type"),
+    )
     _attr_icon = "mdi:ev-station"
     _attr_device_class = BinarySensorDeviceClass.PLUG
 
@@ -87,6 +95,7 @@ class TeslaCarCharging(TeslaCarEntity, BinarySensorEntity):
     """Representation of Tesla car charging binary sensor."""
 
     type = "charging"
+    _data_paths = (("charge_state", "charging_state"),)
     _attr_icon = "mdi:ev-station"
     _attr_device_class = BinarySensorDeviceClass.BATTERY_CHARGING
 
@@ -122,6 +131,7 @@ class TeslaCarAsleep(TeslaCarEntity, BinarySensorEntity):
     """Representation of a Tesla car asleep binary sensor."""
 
     type = "asleep"
+    _data_paths = ((None, "state"),)
     _attr_device_class = None
     _attr_icon = "mdi:sleep"
 
@@ -160,6 +170,12 @@ class TeslaCarDoors(TeslaCarEntity, BinarySensorEntity):
     """Representation of a Tesla car door sensor."""
 
     type = "doors"
+    _data_paths = (
+        ("vehicle_state", "df"),
+        ("vehicle_state", "dr"),
+        ("vehicle_state", "pf"),
+        ("vehicle_state", "pr"),
+    )
     _attr_device_class = BinarySensorDeviceClass.DOOR
     _attr_icon = "mdi:car-door"
 
@@ -188,6 +204,12 @@ class TeslaCarWindows(TeslaCarEntity, BinarySensorEntity):
     """Representation of a Tesla window door sensor."""
 
     type = "windows"
+    _data_paths = (
+        ("vehicle_state", "fd_window"),
+        ("vehicle_state", "fp_window"),
+        ("vehicle_state", "rd_window"),
+        ("vehicle_state", "rp_window"),
+    )
     _attr_device_class = BinarySensorDeviceClass.WINDOW
     _attr_icon = "mdi:car-door"
 
@@ -219,6 +241,11 @@ class TeslaCarScheduledCharging(TeslaCarEntity, BinarySensorEntity):
     """Representation of a Tesla car scheduled charging binary sensor."""
 
     type = "scheduled charging"
+    _data_paths = (
+        ("charge_state", "scheduled_charging_mode"),
+        ("charge_state", "scheduled_charging_start_time"),
+        ("charge_state", "scheduled_charging_start_time_app"),
+    )
     _attr_icon = "mdi:calendar-plus"
     _attr_device_class = None
 
@@ -244,6 +271,16 @@ class TeslaCarScheduledDeparture(TeslaCarEntity, BinarySensorEntity):
     """Representation of a Tesla car scheduled departure binary sensor."""
 
     type = "scheduled departure"
+    _data_paths = (
+        ("charge_state", "scheduled_charging_mode"),
+        ("charge_state", "scheduled_departure_time"),
+        ("charge_state", "scheduled_departure_time_minutes"),
+        ("charge_state", "preconditioning_enabled"),
+        ("charge_state", "preconditioning_times"),
+        ("charge_state", "off_peak_charging_enabled"),
+        ("charge_state", "off_peak_charging_times"),
+        ("charge_state", "off_peak_hours_end_time"),
+    )
     _attr_icon = "mdi:calendar-plus"
     _attr_device_class = None
 
@@ -280,6 +317,7 @@ class TeslaCarUserPresent(TeslaCarEntity, BinarySensorEntity):
     """Representation of a Tesla car user present binary sensor."""
 
     type = "user present"
+    _data_paths = (("vehicle_state", "is_user_present"),)
     _attr_icon = "mdi:account-check"
     _attr_device_class = None
 
@@ -31,41 +31,44 @@ async def async_setup_entry(hass: HomeAssistant, config_entry, async_add_entitie
         entities.append(TeslaCarRemoteStart(car, coordinator))
         entities.append(TeslaCarEmissionsTest(car, coordinator))
 
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities)
 
 
 class TeslaCarHorn(TeslaCarEntity, ButtonEntity):
     """Representation of a Tesla car horn button."""
 
     type = "horn"
+    _data_paths = ()
     _attr_icon = "mdi:bullhorn"
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        await self._car.honk_horn()
+        await self.async_send_command(None, self._car.honk_horn)
 
 
 class TeslaCarFlashLights(TeslaCarEntity, ButtonEntity):
     """Representation of a Tesla car flash lights button."""
 
     type = "flash lights"
+    _data_paths = ()
     _attr_icon = "mdi:car-light-high"
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        await self._car.flash_lights()
+        await self.async_send_command(None, self._car.flash_lights)
 
 
 class TeslaCarWakeUp(TeslaCarEntity, ButtonEntity):
     """Representation of a Tesla car wake up button."""
 
     type = "wake up"
+    _data_paths = ()
     _attr_icon = "mdi:moon-waning-crescent"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        await self._car.wake_up()
+        await self.coordinator.wake_manager.async_wake_up()
 
     @property
     def available(self) -> bool:
@@ -77,6 +80,7 @@ class TeslaCarForceDataUpdate(TeslaCarEntity, ButtonEntity):
     """Representation of a Tesla car force data update button."""
 
     type = "force data update"
+    _data_paths = ()
     _attr_icon = "mdi:database-sync"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
@@ -94,6 +98,7 @@ class TeslaCarTriggerHomelink(TeslaCarEntity, ButtonEntity):
     """Representation of a Tesla car Homelink button."""
 
     type = "homelink"
+    _data_paths = (("vehicle_state", "homelink_nearby"),)
     _attr_icon = "mdi:garage"
 
     def __init__(
@@ -113,24 +118,26 @@ class TeslaCarTriggerHomelink(TeslaCarEntity, ButtonEntity):
 
     async def async_press(self):
         """Send the command."""
-        await self._car.trigger_homelink()
+        await self.async_send_command(None, self._car.trigger_homelink)
 
 
 class TeslaCarRemoteStart(TeslaCarEntity, ButtonEntity):
     """Representation of a Tesla car remote start button."""
 
     type = "remote start"
+    _data_paths = ()
     _attr_icon = "mdi:power"
 
     async def async_press(self):
         """Send the command."""
-        await self._car.remote_start()
+        await self.async_send_command(None, self._car.remote_start)
 
 
 class TeslaCarEmissionsTest(TeslaCarEntity, ButtonEntity):
     """Representation of a Tesla car emissions test button."""
 
     type = "emissions test"
+    _data_paths = ()
     _attr_icon = "mdi:weather-windy"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
@@ -145,7 +152,7 @@ class TeslaCarEmissionsTest(TeslaCarEntity, ButtonEntity):
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        await self._car.remote_boombox()
+        await self.async_send_command(None, self._car.remote_boombox)
 
     @property
     def available(self) -> bool:
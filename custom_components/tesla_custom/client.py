@@ -0,0 +1,180 @@
+"""Client Module.
+
+This builds the httpx clients of the accounts. Accounts with the same
+certificate and pool options share one connection pool, so they reuse each
+other's TLS connections, while every client keeps its own cookies.
+"""
+
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+import logging
+import ssl
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.httpx_client import SERVER_SOFTWARE, USER_AGENT
+import httpx
+
+from .const import (
+    CONF_HTTP2,
+    CONF_HTTP_COMMAND_TIMEOUT,
+    CONF_HTTP_CONNECT_TIMEOUT,
+    CONF_HTTP_KEEPALIVE_EXPIRY,
+    CONF_HTTP_POOL_SIZE,
+    CONF_HTTP_READ_TIMEOUT,
+    DATA_TRANSPORTS,
+    DEFAULT_HTTP2,
+    DEFAULT_HTTP_COMMAND_TIMEOUT,
+    DEFAULT_HTTP_CONNECT_TIMEOUT,
+    DEFAULT_HTTP_KEEPALIVE_EXPIRY,
+    DEFAULT_HTTP_POOL_SIZE,
+    DEFAULT_HTTP_READ_TIMEOUT,
+)
+
+logger = logging.getLogger(__name__)
+
+RequestHook = Callable[[httpx.Request], Awaitable[None]]
+ResponseHook = Callable[[httpx.Response], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class TeslaHttpOptions:
+    """Connection options of an account's client."""
+
+    pool_size: int = DEFAULT_HTTP_POOL_SIZE
+    keepalive_expiry: float = DEFAULT_HTTP_KEEPALIVE_EXPIRY
+    http2: bool = DEFAULT_HTTP2
+    connect_timeout: float = DEFAULT_HTTP_CONNECT_TIMEOUT
+    read_timeout: float = DEFAULT_HTTP_READ_TIMEOUT
+    command_timeout: float = DEFAULT_HTTP_COMMAND_TIMEOUT
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> "TeslaHttpOptions":
+        """Return the connection options of config entry options."""
+        return cls(
+            pool_size=options.get(CONF_HTTP_POOL_SIZE, DEFAULT_HTTP_POOL_SIZE),
+            keepalive_expiry=options.get(
+                CONF_HTTP_KEEPALIVE_EXPIRY, DEFAULT_HTTP_KEEPALIVE_EXPIRY
+            ),
+            http2=options.get(CONF_HTTP2, DEFAULT_HTTP2),
+            connect_timeout=options.get(
+                CONF_HTTP_CONNECT_TIMEOUT, DEFAULT_HTTP_CONNECT_TIMEOUT
+            ),
+            read_timeout=options.get(CONF_HTTP_READ_TIMEOUT, DEFAULT_HTTP_READ_TIMEOUT),
+            command_timeout=options.get(
+                CONF_HTTP_COMMAND_TIMEOUT, DEFAULT_HTTP_COMMAND_TIMEOUT
+            ),
+        )
+
+    @property
+    def timeout(self) -> httpx.Timeout:
+        """Return the timeout of polls."""
+        return httpx.Timeout(self.read_timeout, connect=self.connect_timeout)
+
+    @property
+    def command_timeouts(self) -> dict[str, float]:
+        """Return the timeout of commands as httpx request extensions expect."""
+        return httpx.Timeout(
+            self.command_timeout, connect=self.connect_timeout
+        ).as_dict()
+
+
+def is_command(request: httpx.Request) -> bool:
+    """Return whether a request is a car command or a wake up."""
+    path = request.url.path
+    return "/command/" in path or path.endswith("/wake_up")
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """A client's share of a connection pool used by several accounts.
+
+    Closing the client only closes the pool once no other client uses it.
+    """
+
+    def __init__(self, hass: HomeAssistant, key: tuple) -> None:
+        """Init Class."""
+        self.hass = hass
+        self.key = key
+        self._transport: httpx.AsyncHTTPTransport = hass.data[DATA_TRANSPORTS][key][0]
+        self._closed = False
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request through the shared pool."""
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Release the pool, closing it when this was its last client."""
+        if self._closed:
+            return
+        self._closed = True
+        transports = self.hass.data[DATA_TRANSPORTS]
+        transports[self.key][1] -= 1
+        if not transports[self.key][1]:
+            del transports[self.key]
+            await self._transport.aclose()
+
+
+def _create_transport(
+    ssl_context: ssl.SSLContext, options: TeslaHttpOptions
+) -> httpx.AsyncHTTPTransport:
+    """Return a connection pool, over HTTP/2 if asked for and available."""
+    limits = httpx.Limits(
+        max_connections=options.pool_size,
+        max_keepalive_connections=options.pool_size,
+        keepalive_expiry=options.keepalive_expiry,
+    )
+    if options.http2:
+        try:
+            return httpx.AsyncHTTPTransport(
+                verify=ssl_context, http2=True, limits=limits
+            )
+        except ImportError:
+            logger.warning(
+                "HTTP/2 needs the h2 package which is not installed, using HTTP/1.1"
+            )
+    return httpx.AsyncHTTPTransport(verify=ssl_context, limits=limits)
+
+
+def async_create_client(
+    hass: HomeAssistant,
+    ssl_context: ssl.SSLContext,
+    cert: str | None,
+    options: TeslaHttpOptions,
+    request_hooks: list[RequestHook],
+    response_hooks: list[ResponseHook],
+) -> httpx.AsyncClient:
+    """Return a client of an account on the pool shared for cert and options.
+
+    Commands and wake ups get the command timeout, every other request the
+    connect and read timeouts.
+    """
+    # A changed certificate file gets a new context from the SSL context cache,
+    # and so a new pool. The pool holds the context, so its id is not reused
+    # while the key is in use.
+    key = (
+        cert,
+        id(ssl_context),
+        options.pool_size,
+        options.keepalive_expiry,
+        options.http2,
+    )
+    transports = hass.data.setdefault(DATA_TRANSPORTS, {})
+    if key in transports:
+        transports[key][1] += 1
+    else:
+        transports[key] = [_create_transport(ssl_context, options), 1]
+
+    async def _async_set_command_timeout(request: httpx.Request) -> None:
+        """Give commands their own timeout."""
+        if is_command(request):
+            request.extensions["timeout"] = options.command_timeouts
+
+    return httpx.AsyncClient(
+        headers={USER_AGENT: SERVER_SOFTWARE},
+        timeout=options.timeout,
+        transport=_SharedTransport(hass, key),
+        event_hooks={
+            "request": [*request_hooks, _async_set_command_timeout],
+            "response": response_hooks,
+        },
+    )
@@ -33,13 +33,14 @@ async def async_setup_entry(
     cars = entry_data["cars"]
 
     entities = [TeslaCarClimate(car, coordinators[vin]) for vin, car in cars.items()]
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities)
 
 
 class TeslaCarClimate(TeslaCarEntity, ClimateEntity):
     """Representation of a Tesla car climate."""
 
     type = "HVAC (climate) system"
+    _data_paths = (("climate_state", None),)
     _attr_supported_features = (
         ClimateEntityFeature.TARGET_TEMPERATURE
         | ClimateEntityFeature.PRESET_MODE
@@ -105,16 +106,18 @@ class TeslaCarClimate(TeslaCarEntity, ClimateEntity):
             _LOGGER.debug("%s: Setting temperature to %s", self.name, temperature)
             temp = round(temperature, 1)
 
-            await self._car.set_temperature(temp)
+            await self.async_send_command(
+                "temperature", self._car.set_temperature, temp
+            )
             self.async_write_ha_state()
 
     async def async_set_hvac_mode(self, hvac_mode):
         """Set new target hvac mode."""
         _LOGGER.debug("%s: Setting hvac mode to %s", self.name, hvac_mode)
         if hvac_mode == HVACMode.OFF:
-            await self._car.set_hvac_mode("off")
+            await self.async_send_command("hvac_mode", self._car.set_hvac_mode, "off")
         elif hvac_mode == HVACMode.HEAT_COOL:
-            await self._car.set_hvac_mode("on")
+            await self.async_send_command("hvac_mode", self._car.set_hvac_mode, "on")
         # set_hvac_mode changes multiple states so refresh all entities
         await self.coordinator.async_refresh()
 
@@ -142,16 +145,24 @@ class TeslaCarClimate(TeslaCarEntity, ClimateEntity):
         if preset_mode == "normal":
             # If setting Normal, we need to check Defrost And Keep modes.
             if self._car.defrost_mode != 0:
-                await self._car.set_max_defrost(0)
+                await self.async_send_command(
+                    "max_defrost", self._car.set_max_defrost, 0
+                )
 
             if self._car.climate_keeper_mode != 0:
-                await self._car.set_climate_keeper_mode(0)
+                await self.async_send_command(
+                    "climate_keeper_mode", self._car.set_climate_keeper_mode, 0
+                )
 
         elif preset_mode == "defrost":
-            await self._car.set_max_defrost(2)
+            await self.async_send_command("max_defrost", self._car.set_max_defrost, 2)
 
         else:
-            await self._car.set_climate_keeper_mode(KEEPER_MAP[preset_mode])
+            await self.async_send_command(
+                "climate_keeper_mode",
+                self._car.set_climate_keeper_mode,
+                KEEPER_MAP[preset_mode],
+            )
         # max_defrost changes multiple states so refresh all entities
         await self.coordinator.async_refresh()
 
@@ -170,4 +181,6 @@ class TeslaCarClimate(TeslaCarEntity, ClimateEntity):
         """Set new fan mode as bioweapon mode."""
         _LOGGER.debug("%s: Setting fan_mode to: %s", self.name, fan_mode)
 
-        await self._car.set_bioweapon_mode(fan_mode == "bioweapon")
+        await self.async_send_command(
+            "bioweapon_mode", self._car.set_bioweapon_mode, fan_mode == "bioweapon"
+        )
@@ -0,0 +1,168 @@
+"""Commands Module.
+
+This serializes the commands sent to a car so they reach the API one at a
+time, in order, after a single wake up.
+"""
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from functools import partial
+from http import HTTPStatus
+from itertools import count
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from teslajsonpy.car import TeslaCar
+from teslajsonpy.exceptions import TeslaException
+
+from .const import DOMAIN
+from .wake import TeslaWakeManager
+
+logger = logging.getLogger(__name__)
+
+
+class _QueuedCommand:
+    """A command waiting in the queue and the callers waiting on it."""
+
+    __slots__ = ("command", "futures")
+
+    def __init__(self, command: Callable[[], Awaitable[Any]]) -> None:
+        """Init Class."""
+        self.command = command
+        self.futures: list[asyncio.Future] = []
+
+
+class TeslaCommandQueue:
+    """Per car queue of commands to the Tesla API.
+
+    Commands run one at a time in the order they were queued. A command queued
+    with the key of a command still waiting replaces it in place, so only the
+    newest value is sent, at the position of the first, and the callers of both
+    get its result. The car is woken up once for all the commands queued while
+    it runs.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, car: TeslaCar, wake_manager: TeslaWakeManager
+    ) -> None:
+        """Init Class."""
+        self.hass = hass
+        self.car = car
+        self.wake_manager = wake_manager
+        self._pending: OrderedDict[Any, _QueuedCommand] = OrderedDict()
+        self._worker: asyncio.Task | None = None
+        self._anonymous_keys = count()
+        self.executed_count = 0
+        self.superseded_count = 0
+        self.failed_count = 0
+        self.last_latency: float | None = None
+        self.max_latency = 0.0
+        self._total_latency = 0.0
+
+    @property
+    def depth(self) -> int:
+        """Return the number of commands waiting to be sent."""
+        return len(self._pending)
+
+    @property
+    def average_latency(self) -> float | None:
+        """Return the mean seconds a command took to run."""
+        if not self.executed_count:
+            return None
+        return self._total_latency / self.executed_count
+
+    async def async_send(
+        self,
+        key: str | None,
+        command: Callable[..., Awaitable[Any]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """Queue a command and return its result once it was sent.
+
+        Commands without a key are never replaced, e.g. toggles where every
+        call matters.
+        """
+        if key is None:
+            key = next(self._anonymous_keys)
+        future = self.hass.loop.create_future()
+        if (queued := self._pending.get(key)) is not None:
+            # The newest value keeps the queue position of the command it
+            # replaces, so commands queued later still run after it.
+            logger.debug("%s: Replacing queued %s command", self.car.vin[-5:], key)
+            self.superseded_count += 1
+            queued.command = partial(command, *args, **kwargs)
+        else:
+            queued = self._pending[key] = _QueuedCommand(
+                partial(command, *args, **kwargs)
+            )
+        queued.futures.append(future)
+
+        if self._worker is None:
+            self._worker = self.hass.async_create_task(
+                self._async_run(), f"{DOMAIN} commands {self.car.vin}"
+            )
+        return await future
+
+    async def _async_run(self) -> None:
+        """Wake the car once, then send the queued commands in order."""
+        try:
+            if not self.car.is_on:
+                if self.wake_manager.cooling_down:
+                    # A wake up was sent moments ago. The commands are sent with
+                    # wake_if_asleep, so teslajsonpy wakes the car if needed.
+                    logger.debug(
+                        "%s: Sending commands without waking up during the cooldown",
+                        self.car.vin[-5:],
+                    )
+                else:
+                    try:
+                        if not await self.wake_manager.async_wake_up():
+                            raise TeslaException(HTTPStatus.REQUEST_TIMEOUT)
+                    except Exception as ex:  # pylint: disable=broad-except
+                        self._async_fail_pending(ex)
+                        return
+
+            while self._pending:
+                _, queued = self._pending.popitem(last=False)
+                start = time.monotonic()
+                try:
+                    result = await queued.command()
+                except Exception as ex:  # pylint: disable=broad-except
+                    self.failed_count += 1
+                    self._async_set_result(queued, exception=ex)
+                    continue
+                latency = time.monotonic() - start
+                self.executed_count += 1
+                self.last_latency = latency
+                self.max_latency = max(self.max_latency, latency)
+                self._total_latency += latency
+                self._async_set_result(queued, result=result)
+        finally:
+            self._worker = None
+
+    def _async_fail_pending(self, ex: Exception) -> None:
+        """Fail every queued command with the error of the wake up."""
+        while self._pending:
+            _, queued = self._pending.popitem(last=False)
+            self.failed_count += 1
+            self._async_set_result(queued, exception=ex)
+
+    @staticmethod
+    def _async_set_result(
+        queued: _QueuedCommand,
+        *,
+        result: Any = None,
+        exception: Exception | None = None,
+    ) -> None:
+        """Resolve the futures of every caller waiting on a command."""
+        for future in queued.futures:
+            if future.done():
+                continue
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(result)
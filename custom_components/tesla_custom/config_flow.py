@@ -3,7 +3,6 @@
 from http import HTTPStatus
 import logging
 import os
-import ssl
 
 from homeassistant import config_entries, core, exceptions
 from homeassistant.const import (
@@ -30,20 +29,50 @@ from .const import (
     CONF_API_PROXY_CERT,
     CONF_API_PROXY_ENABLE,
     CONF_API_PROXY_URL,
+    CONF_ENABLE_FLEET_TELEMETRY,
     CONF_ENABLE_TESLAMATE,
     CONF_EXPIRATION,
+    CONF_FLEET_CONCURRENCY,
+    CONF_FLEET_MODE,
+    CONF_FLEET_REDUCED_ENTITIES,
+    CONF_HTTP2,
+    CONF_HTTP_COMMAND_TIMEOUT,
+    CONF_HTTP_CONNECT_TIMEOUT,
+    CONF_HTTP_KEEPALIVE_EXPIRY,
+    CONF_HTTP_POOL_SIZE,
+    CONF_HTTP_READ_TIMEOUT,
     CONF_INCLUDE_ENERGYSITES,
     CONF_INCLUDE_VEHICLES,
     CONF_POLLING_POLICY,
+    CONF_REQUEST_BURST,
+    CONF_REQUEST_RATE,
+    CONF_TESLAMATE_BATCH_WINDOW,
+    CONF_TESLAMATE_SUBSCRIBE_ALL,
+    CONF_WAKE_COOLDOWN,
     CONF_WAKE_ON_START,
+    DEFAULT_ENABLE_FLEET_TELEMETRY,
     DEFAULT_ENABLE_TESLAMATE,
+    DEFAULT_FLEET_CONCURRENCY,
+    DEFAULT_FLEET_MODE,
+    DEFAULT_FLEET_REDUCED_ENTITIES,
+    DEFAULT_HTTP2,
+    DEFAULT_HTTP_COMMAND_TIMEOUT,
+    DEFAULT_HTTP_CONNECT_TIMEOUT,
+    DEFAULT_HTTP_KEEPALIVE_EXPIRY,
+    DEFAULT_HTTP_POOL_SIZE,
+    DEFAULT_HTTP_READ_TIMEOUT,
     DEFAULT_POLLING_POLICY,
+    DEFAULT_REQUEST_BURST,
+    DEFAULT_REQUEST_RATE,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TESLAMATE_BATCH_WINDOW,
+    DEFAULT_TESLAMATE_SUBSCRIBE_ALL,
+    DEFAULT_WAKE_COOLDOWN,
     DEFAULT_WAKE_ON_START,
     DOMAIN,
     MIN_SCAN_INTERVAL,
 )
-from .util import create_tesla_ssl_context
+from .util import async_get_tesla_ssl_context
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -237,6 +266,94 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                         CONF_ENABLE_TESLAMATE, DEFAULT_ENABLE_TESLAMATE
                     ),
                 ): bool,
+                vol.Optional(
+                    CONF_TESLAMATE_BATCH_WINDOW,
+                    default=self.config_entry.options.get(
+                        CONF_TESLAMATE_BATCH_WINDOW, DEFAULT_TESLAMATE_BATCH_WINDOW
+                    ),
+                ): cv.positive_int,
+                vol.Optional(
+                    CONF_TESLAMATE_SUBSCRIBE_ALL,
+                    default=self.config_entry.options.get(
+                        CONF_TESLAMATE_SUBSCRIBE_ALL, DEFAULT_TESLAMATE_SUBSCRIBE_ALL
+                    ),
+                ): bool,
+                vol.Optional(
+                    CONF_ENABLE_FLEET_TELEMETRY,
+                    default=self.config_entry.options.get(
+                        CONF_ENABLE_FLEET_TELEMETRY, DEFAULT_ENABLE_FLEET_TELEMETRY
+                    ),
+                ): bool,
+                vol.Optional(
+                    CONF_REQUEST_RATE,
+                    default=self.config_entry.options.get(
+                        CONF_REQUEST_RATE, DEFAULT_REQUEST_RATE
+                    ),
+                ): vol.All(cv.positive_int, vol.Clamp(min=1)),
+                vol.Optional(
+                    CONF_REQUEST_BURST,
+                    default=self.config_entry.options.get(
+                        CONF_REQUEST_BURST, DEFAULT_REQUEST_BURST
+                    ),
+                ): vol.All(cv.positive_int, vol.Clamp(min=1)),
+                vol.Optional(
+                    CONF_WAKE_COOLDOWN,
+                    default=self.config_entry.options.get(
+                        CONF_WAKE_COOLDOWN, DEFAULT_WAKE_COOLDOWN
+                    ),
+                ): cv.positive_int,
+                vol.Optional(
+                    CONF_FLEET_MODE,
+                    default=self.config_entry.options.get(
+                        CONF_FLEET_MODE, DEFAULT_FLEET_MODE
+                    ),
+                ): bool,
+                vol.Optional(
+                    CONF_FLEET_CONCURRENCY,
+                    default=self.config_entry.options.get(
+                        CONF_FLEET_CONCURRENCY, DEFAULT_FLEET_CONCURRENCY
+                    ),
+                ): vol.All(cv.positive_int, vol.Clamp(min=1)),
+                vol.Optional(
+                    CONF_FLEET_REDUCED_ENTITIES,
+                    default=self.config_entry.options.get(
+                        CONF_FLEET_REDUCED_ENTITIES, DEFAULT_FLEET_REDUCED_ENTITIES
+                    ),
+                ): bool,
+                vol.Optional(
+                    CONF_HTTP_POOL_SIZE,
+                    default=self.config_entry.options.get(
+                        CONF_HTTP_POOL_SIZE, DEFAULT_HTTP_POOL_SIZE
+                    ),
+                ): vol.All(cv.positive_int, vol.Clamp(min=1)),
+                vol.Optional(
+                    CONF_HTTP_KEEPALIVE_EXPIRY,
+                    default=self.config_entry.options.get(
+                        CONF_HTTP_KEEPALIVE_EXPIRY, DEFAULT_HTTP_KEEPALIVE_EXPIRY
+                    ),
+                ): cv.positive_int,
+                vol.Optional(
+                    CONF_HTTP2,
+                    default=self.config_entry.options.get(CONF_HTTP2, DEFAULT_HTTP2),
+                ): bool,
+                vol.Optional(
+                    CONF_HTTP_CONNECT_TIMEOUT,
+                    default=self.config_entry.options.get(
+                        CONF_HTTP_CONNECT_TIMEOUT, DEFAULT_HTTP_CONNECT_TIMEOUT
+                    ),
+                ): vol.All(cv.positive_int, vol.Clamp(min=1)),
+                vol.Optional(
+                    CONF_HTTP_READ_TIMEOUT,
+                    default=self.config_entry.options.get(
+                        CONF_HTTP_READ_TIMEOUT, DEFAULT_HTTP_READ_TIMEOUT
+                    ),
+                ): vol.All(cv.positive_int, vol.Clamp(min=1)),
+                vol.Optional(
+                    CONF_HTTP_COMMAND_TIMEOUT,
+                    default=self.config_entry.options.get(
+                        CONF_HTTP_COMMAND_TIMEOUT, DEFAULT_HTTP_COMMAND_TIMEOUT
+                    ),
+                ): vol.All(cv.positive_int, vol.Clamp(min=1)),
             }
         )
         return self.async_show_form(step_id="init", data_schema=data_schema)
@@ -249,18 +366,9 @@ async def validate_input(hass: core.HomeAssistant, data) -> dict:
     """
 
     config = {}
-    tesla_ssl_context = create_tesla_ssl_context()
-
-    if api_proxy_cert := data.get(CONF_API_PROXY_CERT):
-        try:
-            await hass.async_add_executor_job(
-                tesla_ssl_context.load_verify_locations, api_proxy_cert
-            )
-        except (FileNotFoundError, ssl.SSLError):
-            _LOGGER.warning(
-                "Unable to load custom SSL certificate from %s",
-                api_proxy_cert,
-            )
+    tesla_ssl_context = await async_get_tesla_ssl_context(
+        hass, data.get(CONF_API_PROXY_CERT)
+    )
 
     async_client = httpx.AsyncClient(
         headers={USER_AGENT: SERVER_SOFTWARE}, timeout=60, verify=tesla_ssl_context
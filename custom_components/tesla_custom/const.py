@@ -7,17 +7,79 @@ CONF_INCLUDE_ENERGYSITES = "include_energysites"
 CONF_POLLING_POLICY = "polling_policy"
 CONF_WAKE_ON_START = "enable_wake_on_start"
 CONF_ENABLE_TESLAMATE = "enable_teslamate"
+CONF_TESLAMATE_BATCH_WINDOW = "teslamate_batch_window"
+CONF_TESLAMATE_SUBSCRIBE_ALL = "teslamate_subscribe_all"
 CONF_API_PROXY_ENABLE = "api_proxy_enable"
 CONF_API_PROXY_URL = "api_proxy_url"
 CONF_API_PROXY_CERT = "api_proxy_cert"
+CONF_REQUEST_RATE = "request_rate"
+CONF_REQUEST_BURST = "request_burst"
+CONF_WAKE_COOLDOWN = "wake_cooldown"
+CONF_FLEET_MODE = "fleet_mode"
+CONF_FLEET_CONCURRENCY = "fleet_concurrency"
+CONF_FLEET_REDUCED_ENTITIES = "fleet_reduced_entities"
+CONF_HTTP_POOL_SIZE = "http_pool_size"
+CONF_HTTP_KEEPALIVE_EXPIRY = "http_keepalive_expiry"
+CONF_HTTP2 = "http2"
+CONF_HTTP_CONNECT_TIMEOUT = "http_connect_timeout"
+CONF_HTTP_READ_TIMEOUT = "http_read_timeout"
+CONF_HTTP_COMMAND_TIMEOUT = "http_command_timeout"
+CONF_ENABLE_FLEET_TELEMETRY = "enable_fleet_telemetry"
 DOMAIN = "tesla_custom"
 ATTRIBUTION = "Data provided by Tesla"
 DATA_LISTENER = "listener"
+DATA_TRANSPORTS = f"{DOMAIN}_transports"
+DATA_SSL_CONTEXTS = f"{DOMAIN}_ssl_contexts"
+DATA_TELEMETRY = f"{DOMAIN}_telemetry"
 DEFAULT_SCAN_INTERVAL = 660
 DEFAULT_WAKE_ON_START = False
 DEFAULT_ENABLE_TESLAMATE = False
+# Milliseconds the TeslaMate updates of a car are collected before applying them
+DEFAULT_TESLAMATE_BATCH_WINDOW = 50
+DEFAULT_TESLAMATE_SUBSCRIBE_ALL = False
+# Account-wide Tesla API request budget, requests per minute and bucket size
+DEFAULT_REQUEST_RATE = 60
+DEFAULT_REQUEST_BURST = 30
+# Seconds to back off after Too Many Requests without a Retry-After header
+REQUEST_BACKOFF_BASE = 30
+REQUEST_BACKOFF_MAX = 900
+# Seconds after a wake up before the same car is woken up again
+DEFAULT_WAKE_COOLDOWN = 30
+# Fleet mode only fetches the vehicle data of due cars, this many at a time
+DEFAULT_FLEET_MODE = False
+DEFAULT_FLEET_CONCURRENCY = 4
+DEFAULT_FLEET_REDUCED_ENTITIES = False
+# Connections kept per shared pool, seconds idle connections are kept open and
+# request timeouts in seconds
+DEFAULT_HTTP_POOL_SIZE = 10
+DEFAULT_HTTP_KEEPALIVE_EXPIRY = 30
+DEFAULT_HTTP2 = False
+DEFAULT_HTTP_CONNECT_TIMEOUT = 10
+DEFAULT_HTTP_READ_TIMEOUT = 60
+DEFAULT_HTTP_COMMAND_TIMEOUT = 60
+DEFAULT_ENABLE_FLEET_TELEMETRY = False
+# Endpoint Fleet Telemetry records are posted to
+FLEET_TELEMETRY_URL = f"/api/{DOMAIN}/fleet_telemetry"
 ERROR_URL_NOT_DETECTED = "url_not_detected"
 MIN_SCAN_INTERVAL = 10
+# Coordinator tick rates in seconds, picked from the current vehicle state.
+# The controller still applies its own per-vehicle polling policy on each tick.
+SCAN_INTERVAL_ACTIVE = MIN_SCAN_INTERVAL
+SCAN_INTERVAL_ONLINE = 30
+SCAN_INTERVAL_ASLEEP = 60
+# Energy sites are fetched this often while producing or (dis)charging,
+# otherwise at the idle interval, e.g. at night.
+SCAN_INTERVAL_ENERGYSITE = 30
+SCAN_INTERVAL_ENERGYSITE_IDLE = 300
+# Seconds forced car updates wait for other callers to share the update with
+REFRESH_COALESCE_DELAY = 0.5
+# Seconds to discover vehicles and energy sites during setup, long enough to
+# wake a car on the first setup
+DISCOVERY_TIMEOUT = 120
+# Number of latest timings the diagnostic latency sensors are computed from
+METRICS_WINDOW = 100
+# Seconds after the last pushed update (e.g. TeslaMate) before polling resumes
+PUSH_DATA_TIMEOUT = 300
 
 PLATFORMS = [
     "sensor",
@@ -34,6 +96,14 @@ PLATFORMS = [
     "text",
 ]
 
+# Platforms with car entities when fleet mode is limited to a reduced entity set
+FLEET_PLATFORMS = [
+    "sensor",
+    "lock",
+    "binary_sensor",
+    "device_tracker",
+]
+
 
 ATTR_PARAMETERS = "parameters"
 ATTR_PATH_VARS = "path_vars"
@@ -48,3 +118,10 @@ SERVICE_SCAN_INTERVAL = "polling_interval"
 
 TESLAMATE_STORAGE_VERSION = 1
 TESLAMATE_STORAGE_KEY = f"{DOMAIN}_teslamate"
+# TeslaMate messages waiting to be applied, the oldest are dropped beyond this
+TESLAMATE_QUEUE_SIZE = 1000
+
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_STORAGE_KEY = f"{DOMAIN}_snapshot"
+# Seconds to wait before writing the last known state to disk
+SNAPSHOT_SAVE_DELAY = 60
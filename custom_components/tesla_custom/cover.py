@@ -32,13 +32,14 @@ async def async_setup_entry(hass: HomeAssistant, config_entry, async_add_entitie
         entities.append(TeslaCarWindows(car, coordinator))
         entities.append(TeslaCarSunRoof(car, coordinator))
 
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities)
 
 
 class TeslaCarChargerDoor(TeslaCarEntity, CoverEntity):
     """Representation of a Tesla car charger door cover."""
 
     type = "charger door"
+    _data_paths = (("charge_state", "charge_port_door_open"),)
     _attr_device_class = CoverDeviceClass.DOOR
     _attr_icon = "mdi:ev-plug-tesla"
     _attr_supported_features = CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE
@@ -46,13 +47,17 @@ class TeslaCarChargerDoor(TeslaCarEntity, CoverEntity):
     async def async_close_cover(self, **kwargs):
         """Send close cover command."""
         _LOGGER.debug("Closing cover: %s", self.name)
-        await self._car.charge_port_door_close()
+        await self.async_send_command(
+            "charge_port_door", self._car.charge_port_door_close
+        )
         self.async_write_ha_state()
 
     async def async_open_cover(self, **kwargs):
         """Send open cover command."""
         _LOGGER.debug("Opening cover: %s", self.name)
-        await self._car.charge_port_door_open()
+        await self.async_send_command(
+            "charge_port_door", self._car.charge_port_door_open
+        )
         self.async_write_ha_state()
 
     @property
@@ -65,6 +70,7 @@ class TeslaCarFrunk(TeslaCarEntity, CoverEntity):
     """Representation of a Tesla car frunk lock."""
 
     type = "frunk"
+    _data_paths = (("vehicle_state", "ft"), ("vehicle_config", "plg"))
     _attr_device_class = CoverDeviceClass.DOOR
     _attr_icon = "mdi:car"
 
@@ -72,14 +78,14 @@ class TeslaCarFrunk(TeslaCarEntity, CoverEntity):
         """Send close cover command."""
         _LOGGER.debug("Closing cover: %s", self.name)
         if self.is_closed is False:
-            await self._car.toggle_frunk()
+            await self.async_send_command(None, self._car.toggle_frunk)
             self.async_write_ha_state()
 
     async def async_open_cover(self, **kwargs):
         """Send open cover command."""
         _LOGGER.debug("Opening cover: %s", self.name)
         if self.is_closed is True:
-            await self._car.toggle_frunk()
+            await self.async_send_command(None, self._car.toggle_frunk)
             self.async_write_ha_state()
 
     @property
@@ -101,6 +107,7 @@ class TeslaCarTrunk(TeslaCarEntity, CoverEntity):
     """Representation of a Tesla car trunk cover."""
 
     type = "trunk"
+    _data_paths = (("vehicle_state", "rt"), ("vehicle_config", "plg"))
     _attr_device_class = CoverDeviceClass.DOOR
     _attr_icon = "mdi:car-back"
 
@@ -108,14 +115,14 @@ class TeslaCarTrunk(TeslaCarEntity, CoverEntity):
         """Send close cover command."""
         _LOGGER.debug("Closing cover: %s", self.name)
         if self.is_closed is False:
-            await self._car.toggle_trunk()
+            await self.async_send_command(None, self._car.toggle_trunk)
             self.async_write_ha_state()
 
     async def async_open_cover(self, **kwargs):
         """Send open cover command."""
         _LOGGER.debug("Opening cover: %s", self.name)
         if self.is_closed is True:
-            await self._car.toggle_trunk()
+            await self.async_send_command(None, self._car.toggle_trunk)
             self.async_write_ha_state()
 
     @property
@@ -136,6 +143,12 @@ class TeslaCarWindows(TeslaCarEntity, CoverEntity):
     """Representation of a Tesla car window cover."""
 
     type = "windows"
+    _data_paths = (
+        ("vehicle_state", "fd_window"),
+        ("vehicle_state", "fp_window"),
+        ("vehicle_state", "rd_window"),
+        ("vehicle_state", "rp_window"),
+    )
     _attr_device_class = CoverDeviceClass.AWNING
     _attr_icon = "mdi:car-door"
     _attr_supported_features = CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE
@@ -144,14 +157,14 @@ class TeslaCarWindows(TeslaCarEntity, CoverEntity):
         """Send close cover command."""
         _LOGGER.debug("Closing cover: %s", self.name)
         if self.is_closed is False:
-            await self._car.close_windows()
+            await self.async_send_command("windows", self._car.close_windows)
             self.async_write_ha_state()
 
     async def async_open_cover(self, **kwargs):
         """Send open cover command."""
         _LOGGER.debug("Opening cover: %s", self.name)
         if self.is_closed is True:
-            await self._car.vent_windows()
+            await self.async_send_command("windows", self._car.vent_windows)
             self.async_write_ha_state()
 
     @property
@@ -164,6 +177,10 @@ class TeslaCarSunRoof(TeslaCarEntity, CoverEntity):
     """Representation of a Tesla car sunroof cover."""
 
     type = "sunroof"
+    _data_paths = (
+        ("vehicle_config", "sun_roof_installed"),
+        ("vehicle_state", "sun_roof_state"),
+    )
     _attr_device_class = CoverDeviceClass.WINDOW
     _attr_icon = "mdi:car-select"
     _attr_supported_features = CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE
@@ -183,7 +200,12 @@ class TeslaCarSunRoof(TeslaCarEntity, CoverEntity):
         """Send close cover command."""
         _LOGGER.debug("Closing cover: %s", self.name)
         if not self.is_closed:
-            await self._car._send_command("CHANGE_SUNROOF_STATE", state="close")
+            await self.async_send_command(
+                "sunroof",
+                self._car._send_command,
+                "CHANGE_SUNROOF_STATE",
+                state="close",
+            )
             await self.coordinator.async_request_refresh()
             self.async_write_ha_state()
 
@@ -191,7 +213,9 @@ class TeslaCarSunRoof(TeslaCarEntity, CoverEntity):
         """Send open cover command (vent)."""
         _LOGGER.debug("Opening cover: %s", self.name)
         if self.is_closed:
-            await self._car._send_command("CHANGE_SUNROOF_STATE", state="vent")
+            await self.async_send_command(
+                "sunroof", self._car._send_command, "CHANGE_SUNROOF_STATE", state="vent"
+            )
             await self.coordinator.async_request_refresh()
             self.async_write_ha_state()
 
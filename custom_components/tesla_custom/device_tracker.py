@@ -23,13 +23,19 @@ async def async_setup_entry(hass: HomeAssistant, config_entry, async_add_entitie
         entities.append(TeslaCarLocation(car, coordinator))
         entities.append(TeslaCarDestinationLocation(car, coordinator))
 
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities)
 
 
 class TeslaCarLocation(TeslaCarEntity, TrackerEntity):
     """Representation of a Tesla car location device tracker."""
 
     type = "location tracker"
+    _data_paths = (
+        ("drive_state", "longitude"),
+        ("drive_state", "latitude"),
+        ("drive_state", "heading"),
+        ("drive_state", "speed"),
+    )
 
     @property
     def source_type(self):
@@ -64,6 +70,11 @@ class TeslaCarDestinationLocation(TeslaCarEntity, TrackerEntity):
     """Representation of a Tesla car destination location device tracker."""
 
     type = "destination location tracker"
+    _data_paths = (
+        ("drive_state", "active_route_miles_to_arrival"),
+        ("drive_state", "active_route_longitude"),
+        ("drive_state", "active_route_latitude"),
+    )
 
     @property
     def source_type(self):
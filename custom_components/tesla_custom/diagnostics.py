@@ -0,0 +1,183 @@
+"""Diagnostics support for Tesla."""
+
+import json
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import (
+    CONF_ACCESS_TOKEN,
+    CONF_CLIENT_ID,
+    CONF_TOKEN,
+    CONF_USERNAME,
+)
+from homeassistant.core import HomeAssistant
+
+from . import TeslaDataUpdateCoordinator
+from .const import DOMAIN
+
+TO_REDACT = {
+    CONF_ACCESS_TOKEN,
+    CONF_CLIENT_ID,
+    CONF_TOKEN,
+    CONF_USERNAME,
+    "vin",
+    "energy_site_id",
+}
+
+
+def _payload_size(data: Any) -> int:
+    """Return the size in bytes of a cached API payload as JSON."""
+    return len(json.dumps(data, default=str).encode())
+
+
+def _coordinator_diagnostics(
+    coordinator: TeslaDataUpdateCoordinator,
+) -> dict[str, Any]:
+    """Return the scheduler state and metrics of a coordinator."""
+    update_interval = coordinator.update_interval
+    pending_paths = coordinator.pending_paths
+    data = {
+        "vin": coordinator.vin,
+        "energy_site_id": coordinator.energy_site_id,
+        "update_interval": (
+            update_interval.total_seconds() if update_interval is not None else None
+        ),
+        "last_update_success": coordinator.last_update_success,
+        "last_update_time": coordinator.last_update_time,
+        "last_push_time": coordinator.last_push_time,
+        "push_active": coordinator.push_active,
+        "assumed_state": coordinator.assumed_state,
+        "restored": coordinator.restored,
+        "debounce_scheduled": coordinator.debounce_scheduled,
+        "pending_paths": (
+            "all"
+            if pending_paths is None
+            else sorted(f"{sub_path}/{attr}" for sub_path, attr in pending_paths)
+        ),
+        "metrics": coordinator.metrics.as_dict(),
+    }
+    if (commands := coordinator.commands) is not None:
+        data["commands"] = {
+            "depth": commands.depth,
+            "executed": commands.executed_count,
+            "superseded": commands.superseded_count,
+            "failed": commands.failed_count,
+            "average_latency": commands.average_latency,
+            "max_latency": commands.max_latency,
+        }
+    if (wake_manager := coordinator.wake_manager) is not None:
+        data["wake"] = {
+            "wake_count": wake_manager.wake_count,
+            "shared": wake_manager.shared_count,
+            "refused": wake_manager.refused_count,
+            "last_latency": wake_manager.last_latency,
+            "max_latency": wake_manager.max_latency,
+            "cooldown_remaining": wake_manager.cooldown_remaining,
+        }
+    return data
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    entry = {
+        "data": dict(config_entry.data),
+        "options": dict(config_entry.options),
+    }
+    if (entry_data := hass.data.get(DOMAIN, {}).get(config_entry.entry_id)) is None:
+        # The entry failed to set up or was unloaded.
+        return async_redact_data({"entry": entry}, TO_REDACT)
+    controller = entry_data["controller"]
+    coordinators = entry_data["coordinators"]
+    cars = entry_data["cars"]
+    energysites = entry_data["energysites"]
+    governor = entry_data["governor"]
+    teslamate = entry_data["teslamate"]
+    fleet = entry_data["fleet"]
+    telemetry = entry_data["telemetry"]
+
+    car_payloads = {
+        vin: _payload_size(car._car) + _payload_size(car._vehicle_data)
+        for vin, car in cars.items()
+    }
+    site_payloads = {
+        energy_site_id: _payload_size(getattr(energysite, "_site_data", {}))
+        for energy_site_id, energysite in energysites.items()
+    }
+
+    diagnostics = {
+        "entry": entry,
+        "controller": {
+            "update_interval": controller.update_interval,
+            "cars": [
+                {
+                    "vin": vin,
+                    "polling_interval": controller.get_update_interval_vin(vin=vin),
+                    "online": controller.is_car_online(vin=vin),
+                }
+                for vin in cars
+            ],
+        },
+        "account": (
+            _coordinator_diagnostics(coordinators["update_vehicles"])
+            if "update_vehicles" in coordinators
+            else None
+        ),
+        "cars": [_coordinator_diagnostics(coordinators[vin]) for vin in cars],
+        "energysites": [
+            _coordinator_diagnostics(coordinators[energy_site_id])
+            for energy_site_id in energysites
+        ],
+        "fleet": (
+            {
+                "concurrency": fleet.concurrency,
+                "last_due": fleet.last_due,
+                "fetched": fleet.fetch_count,
+                "failed": fleet.failed_count,
+            }
+            if fleet is not None
+            else None
+        ),
+        "requests": {
+            "remaining": governor.remaining,
+            "backoff_remaining": governor.backoff_remaining,
+            "rate_limited_count": governor.rate_limited_count,
+            "total": governor.request_count,
+            "endpoints": {
+                endpoint: stats.as_dict()
+                for endpoint, stats in sorted(governor.endpoints.items())
+            },
+        },
+        "teslamate": {
+            "enabled": teslamate.enabled,
+            "subscribed_topics": len(teslamate.subscribed_topics),
+            "received": teslamate.received_count,
+            "dropped": teslamate.dropped_count,
+            "queue_depth": teslamate.queue_depth,
+            "batches": teslamate.batch_count,
+            "messages_per_batch": teslamate.messages_per_batch,
+            "max_batch_size": teslamate.max_batch_size,
+            "car_map": [
+                {"vin": vin, "teslamate_id": teslamate_id, "loaded": vin in cars}
+                for vin, teslamate_id in teslamate.car_map.items()
+            ],
+        },
+        "telemetry": {
+            "enabled": telemetry.enabled,
+            "records": telemetry.record_count,
+            "fields": telemetry.field_count,
+            "unknown_fields": telemetry.unknown_field_count,
+            "invalid_fields": telemetry.invalid_field_count,
+        },
+        "payloads": {
+            "cars": [{"vin": vin, "bytes": size} for vin, size in car_payloads.items()],
+            "energysites": [
+                {"energy_site_id": energy_site_id, "bytes": size}
+                for energy_site_id, size in site_payloads.items()
+            ],
+            "total_bytes": sum(car_payloads.values()) + sum(site_payloads.values()),
+        },
+    }
+    return async_redact_data(diagnostics, TO_REDACT)
@@ -0,0 +1,133 @@
+"""Fleet Module.
+
+This polls accounts with many cars: the vehicle list tells which cars are
+online, and only the cars whose state changed or whose data is older than
+the controller's polling interval for them get their vehicle data fetched,
+a few at a time.
+"""
+
+import asyncio
+import logging
+import time
+
+from teslajsonpy import Controller as TeslaAPI
+from teslajsonpy.car import TeslaCar
+from teslajsonpy.exceptions import TeslaException
+
+logger = logging.getLogger(__name__)
+
+
+class TeslaFleetPoller:
+    """Account-wide poller fetching the vehicle data of due cars only.
+
+    The controller polls every online car in sequence on each update, which
+    does not scale to dozens of cars. Here the controller only refreshes the
+    vehicle list and the energy sites; the vehicle data of at most
+    ``concurrency`` cars is fetched at the same time.
+    """
+
+    def __init__(
+        self, controller: TeslaAPI, cars: dict[str, TeslaCar], concurrency: int
+    ) -> None:
+        """Init Class."""
+        self.controller = controller
+        self.cars = cars
+        self.concurrency = concurrency
+        # Car states as of the previous update, a change makes the car due.
+        self._states: dict[str, str | None] = {}
+        self.fetch_count = 0
+        self.failed_count = 0
+        self.last_due = 0
+
+    async def async_update(self, vins: set[str], energy_site_ids: set[int]) -> bool:
+        """Update the vehicle list and sites, then the cars that are due.
+
+        vins are the cars to poll, cars whose data is pushed (e.g. by
+        TeslaMate) are left out.
+        """
+        controller = self.controller
+        # Without VINs the controller only refreshes the vehicle list, which
+        # it throttles itself, and the energy sites.
+        result = await controller.update(
+            vins=set(), energy_site_ids=energy_site_ids, update_vehicles=True
+        )
+
+        now = time.time()
+        last_update = controller.get_last_update_time()
+        due = []
+        for vin in vins:
+            car = self.cars[vin]
+            previous_state = self._states.get(vin)
+            self._states[vin] = state = car.state
+            if (
+                car.in_service
+                or not controller.is_car_online(vin=vin)
+                or not controller.get_updates(vin=vin)
+            ):
+                continue
+            # The controller's own interval applies the car's scan interval,
+            # the driving interval and the polling policy, including the
+            # throttle letting a parked car fall asleep.
+            # pylint: disable=protected-access
+            if (
+                state != previous_state
+                or vin not in last_update
+                or now - last_update[vin] >= controller._calculate_next_interval(vin)
+            ):
+                due.append(vin)
+
+        self.last_due = len(due)
+        if not due:
+            return result
+        semaphore = asyncio.Semaphore(self.concurrency)
+        fetched = await asyncio.gather(
+            *(self._async_fetch(vin, semaphore) for vin in due)
+        )
+        return result or any(fetched)
+
+    def _car_lock(self, vin: str) -> asyncio.Lock:
+        """Return the lock the controller holds while it updates a car."""
+        # pylint: disable=protected-access
+        return self.controller._Controller__lock[vin]
+
+    async def _async_fetch(self, vin: str, semaphore: asyncio.Semaphore) -> bool:
+        """Fetch the vehicle data of a car, returns whether it was updated.
+
+        This does the bookkeeping of the controller's own poll, except for
+        connecting its streaming websocket which the integration never enables.
+        """
+        controller = self.controller
+        car = self.cars[vin]
+        async with semaphore, self._car_lock(vin):
+            try:
+                response = await controller.get_vehicle_data(vin)
+            except TeslaException as ex:
+                logger.warning(
+                    "%s: Unable to get vehicle data during poll. %s: %s",
+                    vin[-5:],
+                    ex.code,
+                    ex.message,
+                )
+                self.failed_count += 1
+                return False
+            if not response:
+                # The car fell asleep since the vehicle list was fetched.
+                return False
+            drive_state = response.get("drive_state") or {}
+            shift_state = drive_state.get("shift_state")
+            if (
+                car.is_climate_on
+                and car.is_climate_on != shift_state
+                and shift_state in (None, "P")
+                and "timestamp" in drive_state
+            ):
+                controller.set_last_park_time(
+                    vin=vin,
+                    timestamp=drive_state["timestamp"] / 1000,
+                    shift_state=shift_state,
+                )
+            controller.set_last_update_time(vin=vin, timestamp=round(time.time()))
+            # pylint: disable=protected-access
+            car._vehicle_data.update(response)
+        self.fetch_count += 1
+        return True
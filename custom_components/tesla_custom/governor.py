@@ -0,0 +1,176 @@
+"""Governor Module.
+
+This limits the rate of requests an account sends to the Tesla API and backs
+off when the API answers with Too Many Requests.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+import logging
+import random
+import time
+from weakref import WeakKeyDictionary
+
+import httpx
+from teslajsonpy.exceptions import TeslaException
+
+from .const import REQUEST_BACKOFF_BASE, REQUEST_BACKOFF_MAX
+from .metrics import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+
+def endpoint_name(request: httpx.Request) -> str:
+    """Return the method and path of a request with its ids left out.
+
+    Path segments with digits longer than a version number, e.g. vehicle ids,
+    VINs and energy site ids, are replaced so requests to the same endpoint
+    are counted together.
+    """
+    segments = [
+        (
+            "{id}"
+            if len(segment) > 3 and any(char.isdigit() for char in segment)
+            else segment
+        )
+        for segment in request.url.path.split("/")
+    ]
+    return f"{request.method} {'/'.join(segments)}"
+
+
+class EndpointStats:
+    """Request count and response latency of a Tesla API endpoint."""
+
+    def __init__(self) -> None:
+        """Init Class."""
+        self.requests = 0
+        self.errors = 0
+        self.latency = LatencyHistogram()
+
+    def as_dict(self) -> dict:
+        """Return the count and latency percentiles."""
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "latency": self.latency.as_dict(),
+        }
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Return the seconds to wait from a Retry-After header value."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class TeslaRequestGovernor:
+    """Account-wide token bucket for requests to the Tesla API.
+
+    Every request of the account's httpx client takes a token. Requests wait
+    for a token when the bucket is empty, and are refused with
+    TOO_MANY_REQUESTS while the API asked us to back off.
+    """
+
+    def __init__(self, requests_per_minute: float, burst: int) -> None:
+        """Init Class."""
+        self.rate = requests_per_minute / 60
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._backoff_until = 0.0
+        self.rate_limited_count = 0
+        self.request_count = 0
+        self.endpoints: dict[str, EndpointStats] = {}
+        self._request_starts: WeakKeyDictionary[httpx.Request, float] = (
+            WeakKeyDictionary()
+        )
+
+    def configure(self, requests_per_minute: float, burst: int) -> None:
+        """Change the size and refill rate of the bucket."""
+        self._refill()
+        self.rate = requests_per_minute / 60
+        self.burst = burst
+        self._tokens = min(self._tokens, float(burst))
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(
+            self._tokens + (now - self._last_refill) * self.rate, float(self.burst)
+        )
+        self._last_refill = now
+
+    @property
+    def remaining(self) -> int:
+        """Return the number of requests that can be sent right now."""
+        self._refill()
+        return max(int(self._tokens), 0)
+
+    @property
+    def backoff_remaining(self) -> float:
+        """Return the seconds left until the API accepts requests again."""
+        return max(self._backoff_until - time.monotonic(), 0.0)
+
+    async def async_on_request(self, request: httpx.Request) -> None:
+        """Take a token for a request, waiting for one when the bucket is empty."""
+        if (backoff := self.backoff_remaining) > 0:
+            logger.debug(
+                "Refusing %s %s, backing off for %.0f seconds",
+                request.method,
+                request.url.path,
+                backoff,
+            )
+            raise TeslaException(HTTPStatus.TOO_MANY_REQUESTS)
+
+        self.request_count += 1
+        self._refill()
+        # Tokens may go negative, each waiter then sleeps until its own token
+        # has been earned so queued requests are spread out at the rate.
+        self._tokens -= 1
+        if self._tokens < 0 and self.rate > 0:
+            wait = -self._tokens / self.rate
+            logger.debug("Request budget exhausted, waiting %.1f seconds", wait)
+            await asyncio.sleep(wait)
+        self._request_starts[request] = time.perf_counter()
+
+    async def async_on_response(self, response: httpx.Response) -> None:
+        """Back off when the API answers with Too Many Requests."""
+        request = response.request
+        stats = self.endpoints.setdefault(endpoint_name(request), EndpointStats())
+        stats.requests += 1
+        if response.is_error:
+            stats.errors += 1
+        if (start := self._request_starts.pop(request, None)) is not None:
+            stats.latency.record(time.perf_counter() - start)
+
+        if response.status_code != HTTPStatus.TOO_MANY_REQUESTS:
+            if response.is_success:
+                self.rate_limited_count = 0
+            return
+
+        self.rate_limited_count += 1
+        backoff = parse_retry_after(response.headers.get("Retry-After"))
+        if backoff is None:
+            backoff = min(
+                REQUEST_BACKOFF_BASE * 2 ** (self.rate_limited_count - 1),
+                REQUEST_BACKOFF_MAX,
+            )
+        # Jitter keeps accounts sharing an IP from retrying in lockstep.
+        backoff += random.uniform(0, backoff / 4)
+        self._backoff_until = max(self._backoff_until, time.monotonic() + backoff)
+        logger.warning(
+            "Tesla API rate limit reached, pausing requests for %.0f seconds",
+            backoff,
+        )
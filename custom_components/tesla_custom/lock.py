@@ -23,13 +23,14 @@ async def async_setup_entry(hass: HomeAssistant, config_entry, async_add_entitie
         entities.append(TeslaCarDoors(car, coordinator))
         entities.append(TeslaCarChargePortLatch(car, coordinator))
 
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities)
 
 
 class TeslaCarDoors(TeslaCarEntity, LockEntity):
     """Representation of a Tesla car door lock."""
 
     type = "doors"
+    _data_paths = (("vehicle_state", "locked"),)
 
     def _ensure_vehicle_state(self) -> None:
         """Ensure vehicle_state can be updated after lock commands."""
@@ -40,14 +41,14 @@ class TeslaCarDoors(TeslaCarEntity, LockEntity):
         """Send lock command."""
         _LOGGER.debug("Locking: %s", self.name)
         self._ensure_vehicle_state()
-        await self._car.lock()
+        await self.async_send_command("lock", self._car.lock)
         self.async_write_ha_state()
 
     async def async_unlock(self, **kwargs):
         """Send unlock command."""
         _LOGGER.debug("Unlocking: %s", self.name)
         self._ensure_vehicle_state()
-        await self._car.unlock()
+        await self.async_send_command("lock", self._car.unlock)
         self.async_write_ha_state()
 
     @property
@@ -63,19 +64,24 @@ class TeslaCarChargePortLatch(TeslaCarEntity, LockEntity):
     """Representation of a Tesla charge port latch."""
 
     type = "charge port latch"
+    _data_paths = (("charge_state", "charge_port_latch"),)
     _attr_icon = "mdi:ev-plug-tesla"
     _attr_supported_features = LockEntityFeature.OPEN
 
     async def async_open(self, **kwargs):
         """Send open command."""
         _LOGGER.debug("Opening: %s", self.name)
-        await self._car.charge_port_door_open()
+        await self.async_send_command(
+            "charge_port_door", self._car.charge_port_door_open
+        )
         self.async_write_ha_state()
 
     async def async_unlock(self, **kwargs):
         """Send unlock command."""
         _LOGGER.debug("Unlocking: %s", self.name)
-        await self._car.charge_port_door_open()
+        await self.async_send_command(
+            "charge_port_door", self._car.charge_port_door_open
+        )
         self.async_write_ha_state()
 
     async def async_lock(self, **kwargs):
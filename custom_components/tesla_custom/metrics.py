@@ -0,0 +1,105 @@
+"""Metrics Module.
+
+This keeps rolling timings and counters of the coordinators' hot paths so
+they can be published as diagnostic sensors.
+"""
+
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+import math
+import time
+
+from .const import METRICS_WINDOW
+
+
+class LatencyHistogram:
+    """Rolling window of the latest durations of an operation."""
+
+    def __init__(self, size: int = METRICS_WINDOW) -> None:
+        """Init Class."""
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        """Return the number of durations in the window."""
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        """Add a duration to the window."""
+        self._samples.append(seconds)
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Record how long the block takes, also when it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(time.perf_counter() - start)
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the nearest-rank percentile of the window in seconds."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+        return ordered[rank - 1]
+
+    @property
+    def p50(self) -> float | None:
+        """Return the median duration in seconds."""
+        return self.percentile(50)
+
+    @property
+    def p95(self) -> float | None:
+        """Return the 95th percentile duration in seconds."""
+        return self.percentile(95)
+
+    @property
+    def max(self) -> float | None:
+        """Return the longest duration in seconds."""
+        return max(self._samples, default=None)
+
+    def as_dict(self) -> dict[str, float | int | None]:
+        """Return the percentiles in milliseconds and the sample count."""
+        return {
+            "p50": _milliseconds(self.p50),
+            "p95": _milliseconds(self.p95),
+            "max": _milliseconds(self.max),
+            "samples": len(self),
+        }
+
+
+def _milliseconds(seconds: float | None) -> float | None:
+    """Return seconds as rounded milliseconds."""
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+class TeslaCoordinatorMetrics:
+    """Timings and counters of a coordinator.
+
+    ``update_latency`` times controller updates and ``fanout_latency`` times
+    pushing a result to the listeners. ``api_calls`` counts updates that
+    reached the Tesla API and ``cache_hits`` the ones served from the
+    controller's cache.
+    """
+
+    def __init__(self) -> None:
+        """Init Class."""
+        self.update_latency = LatencyHistogram()
+        self.fanout_latency = LatencyHistogram()
+        self.api_calls = 0
+        self.cache_hits = 0
+        self.update_failed = 0
+        self.reloads = 0
+
+    def as_dict(self) -> dict[str, dict | int]:
+        """Return every timing and counter."""
+        return {
+            "update_latency": self.update_latency.as_dict(),
+            "fanout_latency": self.fanout_latency.as_dict(),
+            "api_calls": self.api_calls,
+            "cache_hits": self.cache_hits,
+            "update_failed": self.update_failed,
+            "reloads": self.reloads,
+        }
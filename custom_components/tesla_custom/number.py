@@ -19,7 +19,8 @@ async def async_setup_entry(hass: HomeAssistant, config_entry, async_add_entitie
     """Set up the Tesla numbers by config_entry."""
     entry_data = hass.data[DOMAIN][config_entry.entry_id]
     coordinators = entry_data["coordinators"]
-    cars = entry_data["cars"]
+    # A Powerwall forwards this platform even when cars leave it out.
+    cars = entry_data["cars"] if "number" in entry_data["car_platforms"] else {}
     energysites = entry_data["energysites"]
     entities = []
 
@@ -33,20 +34,27 @@ async def async_setup_entry(hass: HomeAssistant, config_entry, async_add_entitie
         if energysite.resource_type == RESOURCE_TYPE_BATTERY:
             entities.append(TeslaEnergyBackupReserve(energysite, coordinator))
 
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities)
 
 
 class TeslaCarChargeLimit(TeslaCarEntity, NumberEntity):
     """Representation of a Tesla car charge limit number."""
 
     type = "charge limit"
+    _data_paths = (
+        ("charge_state", "charge_limit_soc"),
+        ("charge_state", "charge_limit_soc_min"),
+        ("charge_state", "charge_limit_soc_max"),
+    )
     _attr_icon = "mdi:ev-station"
     _attr_mode = NumberMode.AUTO
     _attr_native_step = 1
 
     async def async_set_native_value(self, value: int) -> None:
         """Update charge limit."""
-        await self._car.change_charge_limit(value)
+        await self.async_send_command(
+            "charge_limit", self._car.change_charge_limit, value
+        )
         self.async_write_ha_state()
 
     @property
@@ -82,13 +90,19 @@ class TeslaCarChargingAmps(TeslaCarEntity, NumberEntity):
     """Representation of a Tesla car charging amps number."""
 
     type = "charging amps"
+    _data_paths = (
+        ("charge_state", "charge_current_request"),
+        ("charge_state", "charge_current_request_max"),
+    )
     _attr_icon = "mdi:ev-station"
     _attr_mode = NumberMode.AUTO
     _attr_native_step = 1
 
     async def async_set_native_value(self, value: int) -> None:
         """Update charging amps."""
-        await self._car.set_charging_amps(value)
+        await self.async_send_command(
+            "charging_amps", self._car.set_charging_amps, value
+        )
         self.async_write_ha_state()
 
     @property
@@ -100,7 +100,8 @@ async def async_setup_entry(hass: HomeAssistant, config_entry, async_add_entitie
     """Set up the Tesla selects by config_entry."""
     entry_data = hass.data[DOMAIN][config_entry.entry_id]
     coordinators = entry_data["coordinators"]
-    cars = entry_data["cars"]
+    # A Powerwall forwards this platform even when cars leave it out.
+    cars = entry_data["cars"] if "select" in entry_data["car_platforms"] else {}
     energysites = entry_data["energysites"]
     entities = []
 
@@ -131,12 +132,13 @@ async def async_setup_entry(hass: HomeAssistant, config_entry, async_add_entitie
             entities.append(TeslaEnergyExportRule(energysite, coordinator))
             entities.append(TeslaEnergyGridCharging(energysite, coordinator))
 
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities)
 
 
 class TeslaCarHeatedSeat(TeslaCarEntity, SelectEntity):
     """Representation of a Tesla car heated/cooling seat select."""
 
+    _data_paths = (("climate_state", None), ("vehicle_config", "has_seat_cooling"))
     _attr_icon = "mdi:car-seat-heater"
 
     def __init__(
@@ -159,22 +161,30 @@ class TeslaCarHeatedSeat(TeslaCarEntity, SelectEntity):
         # If selected auto
         if self._is_auto_available and option == FRONT_HEATER_OPTIONS[4]:
             _LOGGER.debug("Setting %s to %s", self.name, option)
-            await self._car.remote_auto_seat_climate_request(
-                AUTO_SEAT_ID_MAP[self._seat_name], True
+            await self.async_send_command(
+                f"auto_seat_climate_{self._seat_name}",
+                self._car.remote_auto_seat_climate_request,
+                AUTO_SEAT_ID_MAP[self._seat_name],
+                True,
             )
         # If any options other than auto
         else:
             # First turn off auto if currently on
             if self.current_option == FRONT_HEATER_OPTIONS[4]:
                 _LOGGER.debug("Turning off Auto heat/cool on %s", self.name)
-                await self._car.remote_auto_seat_climate_request(
-                    AUTO_SEAT_ID_MAP[self._seat_name], False
+                await self.async_send_command(
+                    f"auto_seat_climate_{self._seat_name}",
+                    self._car.remote_auto_seat_climate_request,
+                    AUTO_SEAT_ID_MAP[self._seat_name],
+                    False,
                 )
             # If front seat and car has seat cooling
             if self._is_auto_available and self._car.has_seat_cooling:
                 level: int = FRONT_COOL_HEAT_OPTIONS.index(option)
                 if not self._car.is_climate_on and level > 0:
-                    await self._car.set_hvac_mode("on")
+                    await self.async_send_command(
+                        "hvac_mode", self._car.set_hvac_mode, "on"
+                    )
                 # If turning off
                 if option == FRONT_COOL_HEAT_OPTIONS[0]:
                     _LOGGER.debug("Turning off Cooling/%s", self.name)
@@ -184,46 +194,69 @@ class TeslaCarHeatedSeat(TeslaCarEntity, SelectEntity):
                             "Currently on Auto, Turning off Both heat and cooling on Cooling/%s",
                             self.name,
                         )
-                        await self._car.remote_seat_heater_request(
-                            level, SEAT_ID_MAP[self._seat_name]
+                        await self.async_send_command(
+                            f"seat_heater_{self._seat_name}",
+                            self._car.remote_seat_heater_request,
+                            level,
+                            SEAT_ID_MAP[self._seat_name],
                         )
-                        await self._car.remote_seat_cooler_request(
-                            1, AUTO_SEAT_ID_MAP[self._seat_name]
+                        await self.async_send_command(
+                            f"seat_cooler_{self._seat_name}",
+                            self._car.remote_seat_cooler_request,
+                            1,
+                            AUTO_SEAT_ID_MAP[self._seat_name],
                         )
                     # If heating, turn off heat
                     elif self._car.get_seat_heater_status(SEAT_ID_MAP[self._seat_name]):
                         _LOGGER.debug("Turning off heat on Cooling/%s", self.name)
-                        await self._car.remote_seat_heater_request(
-                            level, SEAT_ID_MAP[self._seat_name]
+                        await self.async_send_command(
+                            f"seat_heater_{self._seat_name}",
+                            self._car.remote_seat_heater_request,
+                            level,
+                            SEAT_ID_MAP[self._seat_name],
                         )
                     # If cooling, turn off cooling, 1 is off
                     else:
                         _LOGGER.debug("Turning off cooling on Cooling/%s", self.name)
-                        await self._car.remote_seat_cooler_request(
-                            1, AUTO_SEAT_ID_MAP[self._seat_name]
+                        await self.async_send_command(
+                            f"seat_cooler_{self._seat_name}",
+                            self._car.remote_seat_cooler_request,
+                            1,
+                            AUTO_SEAT_ID_MAP[self._seat_name],
                         )
                 # If heat levels selected
                 elif "Heat" in option:
                     _LOGGER.debug("Setting Cooling/%s to heat %s", self.name, level)
-                    await self._car.remote_seat_heater_request(
-                        level, SEAT_ID_MAP[self._seat_name]
+                    await self.async_send_command(
+                        f"seat_heater_{self._seat_name}",
+                        self._car.remote_seat_heater_request,
+                        level,
+                        SEAT_ID_MAP[self._seat_name],
                     )
                 # If cool levels selected
                 elif "Cool" in option:
                     # Cool Low == 2, Cool Medium == 3, Cool High ==4
                     level = level - (FRONT_COOL_HEAT_OPTIONS.index("Cool Low") - 2)
                     _LOGGER.debug("Setting Cooling/%s to cool %s", self.name, level)
-                    await self._car.remote_seat_cooler_request(
-                        level, AUTO_SEAT_ID_MAP[self._seat_name]
+                    await self.async_send_command(
+                        f"seat_cooler_{self._seat_name}",
+                        self._car.remote_seat_cooler_request,
+                        level,
+                        AUTO_SEAT_ID_MAP[self._seat_name],
                     )
             # If no seat cooling and not setting to auto
             else:
                 level: int = HEATER_OPTIONS.index(option)
                 if not self._car.is_climate_on and level > 0:
-                    await self._car.set_hvac_mode("on")
+                    await self.async_send_command(
+                        "hvac_mode", self._car.set_hvac_mode, "on"
+                    )
                 _LOGGER.debug("Setting %s to %s", self.name, level)
-                await self._car.remote_seat_heater_request(
-                    level, SEAT_ID_MAP[self._seat_name]
+                await self.async_send_command(
+                    f"seat_heater_{self._seat_name}",
+                    self._car.remote_seat_heater_request,
+                    level,
+                    SEAT_ID_MAP[self._seat_name],
                 )
 
         await self.update_controller(force=True)
@@ -298,6 +331,7 @@ class TeslaCarHeatedSteeringWheel(TeslaCarEntity, SelectEntity):
     """Representation of a Tesla car heated steering wheel select."""
 
     type = "heated steering wheel"
+    _data_paths = (("climate_state", None),)
     _attr_icon = "mdi:steering"
 
     def __init__(
@@ -314,17 +348,31 @@ class TeslaCarHeatedSteeringWheel(TeslaCarEntity, SelectEntity):
 
         if option == STEERING_HEATER_OPTIONS[3]:
             _LOGGER.debug("Setting Heated Steering to Auto")
-            await self._car.remote_auto_steering_wheel_heat_climate_request(True)
+            await self.async_send_command(
+                "auto_steering_wheel_heat",
+                self._car.remote_auto_steering_wheel_heat_climate_request,
+                True,
+            )
         else:
             level: int = STEERING_HEATER_OPTIONS_MAP[option]
 
-            await self._car.remote_auto_steering_wheel_heat_climate_request(False)
+            await self.async_send_command(
+                "auto_steering_wheel_heat",
+                self._car.remote_auto_steering_wheel_heat_climate_request,
+                False,
+            )
 
             if not self._car.is_climate_on and level > 0:
-                await self._car.set_hvac_mode("on")
+                await self.async_send_command(
+                    "hvac_mode", self._car.set_hvac_mode, "on"
+                )
 
             _LOGGER.debug("Setting Heated Steering to %s", level)
-            await self._car.set_heated_steering_wheel_level(level)
+            await self.async_send_command(
+                "steering_wheel_heat_level",
+                self._car.set_heated_steering_wheel_level,
+                level,
+            )
 
         await self.update_controller(force=True)
 
@@ -363,13 +411,16 @@ class TeslaCarCabinOverheatProtection(TeslaCarEntity, SelectEntity):
     """Representation of a Tesla car cabin overheat protection select."""
 
     type = "cabin overheat protection"
+    _data_paths = (("climate_state", "cabin_overheat_protection"),)
     _attr_options = CABIN_OPTIONS
     _attr_entity_category = EntityCategory.CONFIG
     _attr_icon = "mdi:sun-thermometer"
 
     async def async_select_option(self, option: str, **kwargs):
         """Change the selected option."""
-        await self._car.set_cabin_overheat_protection(option)
+        await self.async_send_command(
+            "cabin_overheat_protection", self._car.set_cabin_overheat_protection, option
+        )
         self.async_write_ha_state()
 
     @property
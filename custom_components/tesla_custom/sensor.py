@@ -12,6 +12,7 @@ from homeassistant.components.sensor import (
     SensorEntity,
     SensorStateClass,
 )
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     PERCENTAGE,
     UnitOfEnergy,
@@ -32,8 +33,9 @@ from teslajsonpy.const import RESOURCE_TYPE_BATTERY, RESOURCE_TYPE_SOLAR
 from teslajsonpy.energy import EnergySite
 
 from . import TeslaDataUpdateCoordinator
-from .base import TeslaCarEntity, TeslaEnergyEntity
+from .base import TeslaAccountEntity, TeslaCarEntity, TeslaEnergyEntity
 from .const import DISTANCE_UNITS_KM_HR, DOMAIN
+from .governor import TeslaRequestGovernor
 
 SOLAR_SITE_SENSORS = ["solar power", "grid power", "load power"]
 BATTERY_SITE_SENSORS = SOLAR_SITE_SENSORS + ["battery power"]
@@ -45,6 +47,12 @@ TPMS_SENSORS = {
     "TPMS rear right": "tpms_pressure_rr",
 }
 
+# Diagnostic latency sensors by the coordinator metrics histogram they show
+LATENCY_SENSORS = {
+    "update_latency": "update latency",
+    "fanout_latency": "fan-out latency",
+}
+
 TPMS_SENSOR_ATTR = {
     "TPMS front left": "tpms_last_seen_pressure_time_fl",
     "TPMS front right": "tpms_last_seen_pressure_time_fr",
@@ -61,6 +69,17 @@ async def async_setup_entry(hass: HomeAssistant, config_entry, async_add_entitie
     energysites = entry_data["energysites"]
     entities = []
 
+    if account_coordinator := coordinators.get("update_vehicles"):
+        entities.append(
+            TeslaAccountRequestBudget(
+                config_entry, account_coordinator, entry_data["governor"]
+            )
+        )
+        for histogram in LATENCY_SENSORS:
+            entities.append(
+                TeslaAccountLatency(config_entry, account_coordinator, histogram)
+            )
+
     for vin, car in cars.items():
         coordinator = coordinators[vin]
         entities.append(TeslaCarBattery(car, coordinator))
@@ -79,6 +98,8 @@ async def async_setup_entry(hass: HomeAssistant, config_entry, async_add_entitie
         entities.append(TeslaCarDistanceToArrival(car, coordinator))
         entities.append(TeslaCarDataUpdateTime(car, coordinator))
         entities.append(TeslaCarPollingInterval(car, coordinator))
+        for histogram in LATENCY_SENSORS:
+            entities.append(TeslaCarLatency(car, coordinator, histogram))
 
     for energy_site_id, energysite in energysites.items():
         coordinator = coordinators[energy_site_id]
@@ -104,13 +125,18 @@ async def async_setup_entry(hass: HomeAssistant, config_entry, async_add_entitie
                     TeslaEnergyPowerSensor(energysite, coordinator, sensor_type)
                 )
 
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities)
 
 
 class TeslaCarBattery(TeslaCarEntity, SensorEntity):
     """Representation of the Tesla car battery sensor."""
 
     type = "battery"
+    _data_paths = (
+        ("charge_state", "usable_battery_level"),
+        ("charge_state", "battery_level"),
+        ("charge_state", "charging_state"),
+    )
     _attr_device_class = SensorDeviceClass.BATTERY
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = PERCENTAGE
@@ -148,6 +174,13 @@ class TeslaCarChargerEnergy(TeslaCarEntity, SensorEntity):
     """Representation of a Tesla car energy added sensor."""
 
     type = "energy added"
+    _data_paths = (
+        ("charge_state", "charge_energy_added"),
+        ("charge_state", "charge_miles_added_rated"),
+        ("charge_state", "charge_miles_added_ideal"),
+        ("gui_settings", "gui_range_display"),
+        ("gui_settings", "gui_distance_units"),
+    )
     _attr_device_class = SensorDeviceClass.ENERGY
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
     _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
@@ -187,6 +220,13 @@ class TeslaCarChargerPower(TeslaCarEntity, SensorEntity):
     """Representation of a Tesla car charger power."""
 
     type = "charger power"
+    _data_paths = (
+        ("charge_state", "charger_power"),
+        ("charge_state", "charge_current_request"),
+        ("charge_state", "charger_actual_current"),
+        ("charge_state", "charger_voltage"),
+        ("charge_state", "charger_phases"),
+    )
     _attr_device_class = SensorDeviceClass.POWER
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfPower.KILO_WATT
@@ -216,6 +256,10 @@ class TeslaCarChargerRate(TeslaCarEntity, SensorEntity):
     """Representation of the Tesla car charging rate."""
 
     type = "charging rate"
+    _data_paths = (
+        ("charge_state", "charge_rate"),
+        ("charge_state", "time_to_full_charge"),
+    )
     _attr_device_class = SensorDeviceClass.SPEED
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfSpeed.MILES_PER_HOUR
@@ -243,6 +287,7 @@ class TeslaCarOdometer(TeslaCarEntity, SensorEntity):
     """Representation of the Tesla car odometer sensor."""
 
     type = "odometer"
+    _data_paths = (("vehicle_state", "odometer"),)
     _attr_device_class = SensorDeviceClass.DISTANCE
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
     _attr_native_unit_of_measurement = UnitOfLength.MILES
@@ -263,6 +308,7 @@ class TeslaCarShiftState(TeslaCarEntity, SensorEntity):
     """Representation of the Tesla car Shift State sensor."""
 
     type = "shift state"
+    _data_paths = (("drive_state", "shift_state"),)
     _attr_device_class = SensorDeviceClass.ENUM
     _attr_icon = "mdi:car-shift-pattern"
 
@@ -297,6 +343,12 @@ class TeslaCarRange(TeslaCarEntity, SensorEntity):
     """Representation of the Tesla car range sensor."""
 
     type = "range"
+    _data_paths = (
+        ("charge_state", "battery_range"),
+        ("charge_state", "ideal_battery_range"),
+        ("charge_state", "est_battery_range"),
+        ("gui_settings", "gui_range_display"),
+    )
     _attr_device_class = SensorDeviceClass.DISTANCE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfLength.MILES
@@ -356,8 +408,10 @@ class TeslaCarTemp(TeslaCarEntity, SensorEntity):
         self.inside = inside
         if inside is True:
             self.type += " (inside)"
+            self._data_paths = (("climate_state", "inside_temp"),)
         else:
             self.type += " (outside)"
+            self._data_paths = (("climate_state", "outside_temp"),)
         super().__init__(car, coordinator)
 
     @property
@@ -498,6 +552,11 @@ class TeslaCarTimeChargeComplete(TeslaCarEntity, SensorEntity):
     """Representation of the Tesla car time charge complete."""
 
     type = "time charge complete"
+    _data_paths = (
+        ("charge_state", "time_to_full_charge"),
+        ("charge_state", "charging_state"),
+        ("charge_state", "minutes_to_full_charge"),
+    )
     _attr_device_class = SensorDeviceClass.TIMESTAMP
     _attr_icon = "mdi:timer-plus"
     _value: Optional[datetime] = None
@@ -562,6 +621,10 @@ class TeslaCarTpmsPressureSensor(TeslaCarEntity, SensorEntity):
         """Initialize TPMS Pressure sensor."""
         self._tpms_sensor = tpms_sensor
         self.type = tpms_sensor
+        self._data_paths = (
+            ("vehicle_state", TPMS_SENSORS[tpms_sensor]),
+            ("vehicle_state", TPMS_SENSOR_ATTR[tpms_sensor]),
+        )
         super().__init__(car, coordinator)
 
     @property
@@ -589,6 +652,12 @@ class TeslaCarArrivalTime(TeslaCarEntity, SensorEntity):
     """Representation of the Tesla car route arrival time."""
 
     type = "arrival time"
+    _data_paths = (
+        ("drive_state", "active_route_minutes_to_arrival"),
+        ("drive_state", "active_route_traffic_minutes_delay"),
+        ("drive_state", "active_route_energy_at_arrival"),
+        ("drive_state", "active_route_destination"),
+    )
     _attr_device_class = SensorDeviceClass.TIMESTAMP
     _attr_icon = "mdi:timer-sand"
     _datetime_value: Optional[datetime] = None
@@ -642,6 +711,7 @@ class TeslaCarDistanceToArrival(TeslaCarEntity, SensorEntity):
     """Representation of the Tesla distance to arrival."""
 
     type = "distance to arrival"
+    _data_paths = (("drive_state", "active_route_miles_to_arrival"),)
     _attr_device_class = SensorDeviceClass.DISTANCE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfLength.MILES
@@ -695,3 +765,98 @@ class TeslaCarPollingInterval(TeslaCarEntity, SensorEntity):
     def native_value(self) -> int:
         """Return the update time interval."""
         return self.coordinator.controller.get_update_interval_vin(vin=self._car.vin)
+
+
+class TeslaAccountRequestBudget(TeslaAccountEntity, SensorEntity):
+    """Representation of the Tesla API requests an account can still send."""
+
+    type = "api request budget"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = "requests"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:speedometer-slow"
+
+    def __init__(
+        self,
+        config_entry,
+        coordinator: TeslaDataUpdateCoordinator,
+        governor: TeslaRequestGovernor,
+    ) -> None:
+        """Initialize request budget entity."""
+        self._governor = governor
+        super().__init__(config_entry, coordinator)
+
+    @property
+    def available(self) -> bool:
+        """Return True, the budget is known even when the API fails."""
+        return True
+
+    @property
+    def native_value(self) -> int:
+        """Return the requests that can be sent without waiting."""
+        return self._governor.remaining
+
+    @property
+    def extra_state_attributes(self):
+        """Return device state attributes."""
+        governor = self._governor
+        return {
+            "requests_per_minute": round(governor.rate * 60, 2),
+            "burst": governor.burst,
+            "backoff_remaining": round(governor.backoff_remaining),
+            "rate_limited_count": governor.rate_limited_count,
+        }
+
+
+class TeslaLatencyMixin:
+    """Shared behaviour of the 95th percentile latency sensors."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:timer-outline"
+    _enabled_by_default = False
+
+    # Counters of the coordinator metrics added to the attributes.
+    _metric_attributes: tuple[str, ...] = ("api_calls", "cache_hits")
+
+    def __init__(
+        self,
+        owner: TeslaCar | ConfigEntry,
+        coordinator: TeslaDataUpdateCoordinator,
+        histogram: str,
+    ) -> None:
+        """Initialize latency entity of a car or an account."""
+        self._histogram = histogram
+        self.type = LATENCY_SENSORS[histogram]
+        super().__init__(owner, coordinator)
+
+    @property
+    def available(self) -> bool:
+        """Return True, the timings are known even when the API fails."""
+        return True
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the 95th percentile latency."""
+        return getattr(self.coordinator.metrics, self._histogram).as_dict()["p95"]
+
+    @property
+    def extra_state_attributes(self):
+        """Return device state attributes."""
+        metrics = self.coordinator.metrics
+        return {
+            **getattr(metrics, self._histogram).as_dict(),
+            **{attr: getattr(metrics, attr) for attr in self._metric_attributes},
+        }
+
+
+class TeslaCarLatency(TeslaLatencyMixin, TeslaCarEntity, SensorEntity):
+    """Representation of the 95th percentile latency of a car's updates."""
+
+
+class TeslaAccountLatency(TeslaLatencyMixin, TeslaAccountEntity, SensorEntity):
+    """Representation of the 95th percentile latency of an account's updates."""
+
+    _metric_attributes = ("api_calls", "cache_hits", "update_failed", "reloads")
@@ -0,0 +1,100 @@
+"""Snapshot Module.
+
+This keeps the last known car and energy site data of an account on disk,
+so entities have a state right after a restart, even for sleeping cars.
+"""
+
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from teslajsonpy.car import TeslaCar
+from teslajsonpy.energy import EnergySite
+
+from .const import SNAPSHOT_SAVE_DELAY, SNAPSHOT_STORAGE_KEY, SNAPSHOT_STORAGE_VERSION
+
+logger = logging.getLogger(__name__)
+
+
+def snapshot_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, dict]]:
+    """Return the snapshot Store of a config entry."""
+    return Store[dict[str, dict]](
+        hass, SNAPSHOT_STORAGE_VERSION, f"{SNAPSHOT_STORAGE_KEY}.{entry_id}"
+    )
+
+
+class TeslaSnapshot:
+    """Last known raw API data of the cars and energy sites of an account."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Init Class."""
+        self.hass = hass
+        self.cars: dict[str, TeslaCar] = {}
+        self.energysites: dict[int, EnergySite] = {}
+        self._data: dict[str, dict] = {"cars": {}, "energysites": {}}
+        self._save_scheduled = False
+        self._store = snapshot_store(hass, entry_id)
+
+    async def async_load(self) -> None:
+        """Load the snapshot."""
+        if stored := await self._store.async_load():
+            self._data = {
+                "cars": stored.get("cars", {}),
+                "energysites": stored.get("energysites", {}),
+            }
+
+    @callback
+    def async_restore(
+        self, cars: dict[str, TeslaCar], energysites: dict[int, EnergySite]
+    ) -> tuple[set[str], set[int]]:
+        """Fill in missing car and energy site data from the snapshot.
+
+        Only devices without any data are restored, e.g. cars that were asleep
+        during discovery. The data is copied into the dicts the controller
+        keeps updating, so live data replaces it once it arrives. Returns the
+        VINs of the restored cars and the ids of the restored energy sites.
+        """
+        # pylint: disable=protected-access
+        self.cars = cars
+        self.energysites = energysites
+        restored = set()
+        restored_sites = set()
+
+        for vin, car in cars.items():
+            if car._vehicle_data or not (cached := self._data["cars"].get(vin)):
+                continue
+            car._vehicle_data.update(cached)
+            restored.add(vin)
+            logger.debug("Restored last known data for VIN:%s", vin)
+
+        for energysite_id, energysite in energysites.items():
+            cached = self._data["energysites"].get(str(energysite_id), {})
+            if not getattr(energysite, "_site_data", True) and cached.get("site_data"):
+                energysite._site_data.update(cached["site_data"])
+                restored_sites.add(energysite_id)
+                logger.debug("Restored last known data for site:%s", energysite_id)
+
+        return restored, restored_sites
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save the current data of the cars and energy sites after a delay."""
+        if self._save_scheduled:
+            return
+        self._save_scheduled = True
+        self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict]:
+        """Return the data to store, keeping the last data of idle devices."""
+        # pylint: disable=protected-access
+        self._save_scheduled = False
+        for vin, car in self.cars.items():
+            if car._vehicle_data:
+                self._data["cars"][vin] = dict(car._vehicle_data)
+        for energysite_id, energysite in self.energysites.items():
+            if site_data := getattr(energysite, "_site_data", None):
+                self._data["energysites"][str(energysite_id)] = {
+                    "site_data": dict(site_data)
+                }
+        return self._data
@@ -29,13 +29,14 @@ async def async_setup_entry(hass: HomeAssistant, config_entry, async_add_entitie
         entities.append(TeslaCarCharger(car, coordinator))
         entities.append(TeslaCarValetMode(car, coordinator))
 
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities)
 
 
 class TeslaCarHeatedSteeringWheel(TeslaCarEntity, SwitchEntity):
     """Representation of a Tesla car heated steering wheel switch."""
 
     type = "heated steering"
+    _data_paths = (("climate_state", "steering_wheel_heater"),)
     _attr_icon = "mdi:steering"
 
     def __init__(
@@ -60,12 +61,16 @@ class TeslaCarHeatedSteeringWheel(TeslaCarEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs):
         """Send the on command."""
-        await self._car.set_heated_steering_wheel(True)
+        await self.async_send_command(
+            "steering_wheel_heater", self._car.set_heated_steering_wheel, True
+        )
         self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs):
         """Send the off command."""
-        await self._car.set_heated_steering_wheel(False)
+        await self.async_send_command(
+            "steering_wheel_heater", self._car.set_heated_steering_wheel, False
+        )
         self.async_write_ha_state()
 
 
@@ -102,6 +107,7 @@ class TeslaCarCharger(TeslaCarEntity, SwitchEntity):
     """Representation of a Tesla car charger switch."""
 
     type = "charger"
+    _data_paths = (("charge_state", "charging_state"),)
     _attr_icon = "mdi:ev-station"
 
     @property
@@ -111,12 +117,12 @@ class TeslaCarCharger(TeslaCarEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs):
         """Send the on command."""
-        await self._car.start_charge()
+        await self.async_send_command("charging", self._car.start_charge)
         self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs):
         """Send the off command."""
-        await self._car.stop_charge()
+        await self.async_send_command("charging", self._car.stop_charge)
         self.async_write_ha_state()
 
 
@@ -124,6 +130,10 @@ class TeslaCarSentryMode(TeslaCarEntity, SwitchEntity):
     """Representation of a Tesla car sentry mode switch."""
 
     type = "sentry mode"
+    _data_paths = (
+        ("vehicle_state", "sentry_mode"),
+        ("vehicle_state", "sentry_mode_available"),
+    )
     _attr_icon = "mdi:shield-car"
 
     def __init__(
@@ -150,12 +160,12 @@ class TeslaCarSentryMode(TeslaCarEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs):
         """Send the on command."""
-        await self._car.set_sentry_mode(True)
+        await self.async_send_command("sentry_mode", self._car.set_sentry_mode, True)
         self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs):
         """Send the off command."""
-        await self._car.set_sentry_mode(False)
+        await self.async_send_command("sentry_mode", self._car.set_sentry_mode, False)
         self.async_write_ha_state()
 
 
@@ -163,6 +173,10 @@ class TeslaCarValetMode(TeslaCarEntity, SwitchEntity):
     """Representation of a Tesla car valet mode switch."""
 
     type = "valet mode"
+    _data_paths = (
+        ("vehicle_state", "valet_mode"),
+        ("vehicle_state", "valet_pin_needed"),
+    )
     _attr_icon = "mdi:room-service"
 
     @property
@@ -176,7 +190,7 @@ class TeslaCarValetMode(TeslaCarEntity, SwitchEntity):
         if self._car._vehicle_data.get("vehicle_state", {}).get("valet_pin_needed"):
             _LOGGER.debug("Pin required for valet mode, set pin in vehicle or app.")
         else:
-            await self._car.valet_mode(True)
+            await self.async_send_command("valet_mode", self._car.valet_mode, True)
             self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs):
@@ -185,5 +199,5 @@ class TeslaCarValetMode(TeslaCarEntity, SwitchEntity):
         if self._car._vehicle_data.get("vehicle_state", {}).get("valet_pin_needed"):
             _LOGGER.debug("Pin required for valet mode, set pin in vehicle or app.")
         else:
-            await self._car.valet_mode(False)
+            await self.async_send_command("valet_mode", self._car.valet_mode, False)
             self.async_write_ha_state()
@@ -0,0 +1,249 @@
+"""Fleet Telemetry Module.
+
+This receives the records cars stream through Tesla Fleet Telemetry, and
+updates their entities with the latest data.
+
+The Fleet Telemetry server, or a relay in front of it, posts the decoded
+records as JSON to ``FLEET_TELEMETRY_URL``, authenticated with a Home
+Assistant access token. A record is the JSON form of the ``Payload`` message:
+
+    {"vin": "...", "createdAt": "...",
+     "data": [{"key": "VehicleSpeed", "value": {"doubleValue": 30}}, ...]}
+"""
+
+from collections.abc import Callable
+from http import HTTPStatus
+import logging
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import web
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant, callback
+from teslajsonpy.car import TeslaCar
+
+from .const import DATA_TELEMETRY, FLEET_TELEMETRY_URL
+from .util import DataPath
+
+if TYPE_CHECKING:
+    from . import TeslaDataUpdateCoordinator
+
+logger = logging.getLogger(__name__)
+
+
+def _strip_prefix(prefix: str) -> Callable[[Any], str]:
+    """Return a caster turning an enum name like ShiftStateD into D."""
+
+    def cast(value: Any) -> str:
+        return str(value).removeprefix(prefix)
+
+    return cast
+
+
+def cast_shift_state(value: Any) -> str | None:
+    """Convert a gear to the shift state of the Owner API, None when parked."""
+    shift_state = str(value).removeprefix("ShiftState")
+    return None if shift_state in ("P", "Invalid") else shift_state
+
+
+def cast_bool(value: Any) -> bool:
+    """Convert a boolean, which the relay may also send as a string."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.lower() in ("true", "false"):
+        return value.lower() == "true"
+    raise ValueError(f"Invalid boolean {value!r}")
+
+
+def cast_sentry_mode(value: Any) -> bool:
+    """Convert a sentry mode state to whether sentry mode is on."""
+    return str(value) not in ("SentryModeStateOff", "SentryModeStateUnknown")
+
+
+# Fleet Telemetry field to the (sub_path, attr) of the Owner API data it
+# updates and the caster of its value. The units already match the Owner API.
+FIELD_MAP: dict[str, tuple[str, str, Callable[[Any], Any]]] = {
+    "VehicleSpeed": ("drive_state", "speed", lambda value: int(float(value))),
+    "GpsHeading": ("drive_state", "heading", lambda value: int(float(value))),
+    "Gear": ("drive_state", "shift_state", cast_shift_state),
+    "Odometer": ("vehicle_state", "odometer", float),
+    "Locked": ("vehicle_state", "locked", cast_bool),
+    "SentryMode": ("vehicle_state", "sentry_mode", cast_sentry_mode),
+    "TpmsPressureFl": ("vehicle_state", "tpms_pressure_fl", float),
+    "TpmsPressureFr": ("vehicle_state", "tpms_pressure_fr", float),
+    "TpmsPressureRl": ("vehicle_state", "tpms_pressure_rl", float),
+    "TpmsPressureRr": ("vehicle_state", "tpms_pressure_rr", float),
+    "InsideTemp": ("climate_state", "inside_temp", float),
+    "OutsideTemp": ("climate_state", "outside_temp", float),
+    "BatteryLevel": ("charge_state", "battery_level", float),
+    "Soc": ("charge_state", "usable_battery_level", float),
+    "RatedRange": ("charge_state", "battery_range", float),
+    "EstBatteryRange": ("charge_state", "est_battery_range", float),
+    "IdealBatteryRange": ("charge_state", "ideal_battery_range", float),
+    "ChargeLimitSoc": ("charge_state", "charge_limit_soc", int),
+    "ChargeAmps": ("charge_state", "charge_current_request", int),
+    "ChargerActualCurrent": ("charge_state", "charger_actual_current", int),
+    "ChargerVoltage": ("charge_state", "charger_voltage", int),
+    "ACChargingPower": ("charge_state", "charger_power", float),
+    "ChargePortDoorOpen": ("charge_state", "charge_port_door_open", cast_bool),
+    "DetailedChargeState": (
+        "charge_state",
+        "charging_state",
+        _strip_prefix("DetailedChargeState"),
+    ),
+}
+
+# The location value holds both coordinates.
+LOCATION_FIELD = "Location"
+LOCATION_PATHS: set[DataPath] = {
+    ("drive_state", "latitude"),
+    ("drive_state", "longitude"),
+}
+
+
+def decode_value(value: Any) -> Any:
+    """Return the content of a telemetry value, None when invalid.
+
+    Raises ValueError when value is not a telemetry value at all.
+    """
+    if not isinstance(value, dict) or len(value) > 1:
+        raise ValueError(f"Invalid telemetry value {value!r}")
+    if not value or value.get("invalid"):
+        return None
+    return next(iter(value.values()))
+
+
+def is_record(record: Any) -> bool:
+    """Return whether a posted record has the shape of a telemetry record."""
+    return (
+        isinstance(record, dict)
+        and isinstance(record.get("vin"), str)
+        and isinstance(record.get("data", []), list)
+    )
+
+
+class TeslaFleetTelemetry:
+    """Fleet Telemetry receiver of an account.
+
+    Records are routed here by VIN by the view shared by every account.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinators: dict[str, "TeslaDataUpdateCoordinator"],
+        cars: dict[str, TeslaCar],
+    ) -> None:
+        """Init Class."""
+        self.hass = hass
+        self.coordinators = coordinators
+        self.cars = cars
+        self._enabled = False
+        self.record_count = 0
+        self.field_count = 0
+        self.unknown_field_count = 0
+        self.invalid_field_count = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether telemetry records are accepted."""
+        return self._enabled
+
+    @callback
+    def async_enable(self, enable: bool = True) -> None:
+        """Start or stop accepting the records of the account's cars."""
+        if not enable:
+            self.async_unload()
+            return
+        receivers = self.hass.data.get(DATA_TELEMETRY)
+        if receivers is None:
+            receivers = self.hass.data[DATA_TELEMETRY] = {}
+            self.hass.http.register_view(TeslaFleetTelemetryView)
+        for vin in self.cars:
+            receivers[vin] = self
+        self._enabled = True
+
+    @callback
+    def async_unload(self) -> None:
+        """Stop accepting records."""
+        self._enabled = False
+        receivers = self.hass.data.get(DATA_TELEMETRY, {})
+        for vin in self.cars:
+            if receivers.get(vin) is self:
+                del receivers[vin]
+
+    @callback
+    def async_handle_record(self, vin: str, data: list[dict[str, Any]]) -> None:
+        """Update a car from the data of a telemetry record."""
+        # pylint: disable=protected-access
+        vehicle_data = self.cars[vin]._vehicle_data
+        paths: set[DataPath] = set()
+        for datum in data:
+            if not isinstance(datum, dict):
+                self.invalid_field_count += 1
+                continue
+            key = datum.get("key")
+            try:
+                value = decode_value(datum.get("value"))
+                if key == LOCATION_FIELD:
+                    if value is not None:
+                        latitude = float(value["latitude"])
+                        longitude = float(value["longitude"])
+                        drive_state = vehicle_data.setdefault("drive_state", {})
+                        drive_state["latitude"] = latitude
+                        drive_state["longitude"] = longitude
+                        paths.update(LOCATION_PATHS)
+                    continue
+                if (field := FIELD_MAP.get(key)) is None:
+                    self.unknown_field_count += 1
+                    continue
+                if value is None:
+                    continue
+                sub_path, attr, cast = field
+                value = cast(value)
+            except (KeyError, TypeError, ValueError):
+                logger.debug("%s: Invalid %s value %s", vin[-5:], key, datum)
+                self.invalid_field_count += 1
+                continue
+            vehicle_data.setdefault(sub_path, {})[attr] = value
+            paths.add((sub_path, attr))
+
+        self.record_count += 1
+        self.field_count += len(paths)
+        if paths:
+            self.coordinators[vin].async_handle_pushed_data(paths)
+
+
+class TeslaFleetTelemetryView(HomeAssistantView):
+    """Endpoint accepting Fleet Telemetry records for every account."""
+
+    url = FLEET_TELEMETRY_URL
+    name = "api:tesla_custom:fleet_telemetry"
+
+    async def post(self, request: web.Request) -> web.Response:
+        """Accept a record or a list of records."""
+        try:
+            records = await request.json()
+        except ValueError:
+            return self.json_message("Invalid JSON", HTTPStatus.BAD_REQUEST)
+        if isinstance(records, dict):
+            records = [records]
+        if not isinstance(records, list):
+            return self.json_message("Expected records", HTTPStatus.BAD_REQUEST)
+
+        receivers = request.app["hass"].data.get(DATA_TELEMETRY, {})
+        accepted = ignored = invalid = 0
+        for record in records:
+            if not is_record(record):
+                logger.debug("Skipping invalid telemetry record %s", record)
+                invalid += 1
+                continue
+            vin = record["vin"]
+            if (receiver := receivers.get(vin)) is None:
+                logger.debug("Ignoring telemetry of unknown VIN %s", vin)
+                ignored += 1
+                continue
+            receiver.async_handle_record(vin, record.get("data", []))
+            accepted += 1
+        if records and invalid == len(records):
+            return self.json_message("Invalid records", HTTPStatus.BAD_REQUEST)
+        return self.json({"accepted": accepted, "ignored": ignored, "invalid": invalid})
@@ -5,9 +5,11 @@ with the latest data.
 """
 
 import asyncio
+from collections import Counter, deque
+from collections.abc import Callable, Mapping
 import logging
-import time
-from typing import TYPE_CHECKING
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.mqtt import mqtt_config_entry_enabled
 from homeassistant.components.mqtt.models import ReceiveMessage
@@ -17,18 +19,31 @@ from homeassistant.components.mqtt.subscription import (
     async_unsubscribe_topics,
 )
 from homeassistant.const import UnitOfLength, UnitOfSpeed
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
 from homeassistant.util.unit_conversion import DistanceConverter, SpeedConverter
 from teslajsonpy.car import TeslaCar
 
-from .const import TESLAMATE_STORAGE_KEY, TESLAMATE_STORAGE_VERSION
+from .const import (
+    DEFAULT_TESLAMATE_BATCH_WINDOW,
+    DEFAULT_TESLAMATE_SUBSCRIBE_ALL,
+    TESLAMATE_QUEUE_SIZE,
+    TESLAMATE_STORAGE_KEY,
+    TESLAMATE_STORAGE_VERSION,
+)
+from .util import DataPath
 
 if TYPE_CHECKING:
     from . import TeslaDataUpdateCoordinator
 
 logger = logging.getLogger(__name__)
 
+# TeslaMate reports metric units, the Tesla API imperial ones.
+KM_TO_MILES = DistanceConverter.convert(1, UnitOfLength.KILOMETERS, UnitOfLength.MILES)
+KM_PER_HOUR_TO_MILES_PER_HOUR = SpeedConverter.convert(
+    1, UnitOfSpeed.KILOMETERS_PER_HOUR, UnitOfSpeed.MILES_PER_HOUR
+)
+
 
 def is_car_state_charging(car_state: str) -> bool:
     """Check if car_state is charging."""
@@ -43,10 +58,7 @@ def cast_km_to_miles(km_to_convert: float) -> float:
     We need to convert to Miles so the home assistant sensor calculates
     properly.
     """
-    km = float(km_to_convert)
-    miles = DistanceConverter.convert(km, UnitOfLength.KILOMETERS, UnitOfLength.MILES)
-
-    return miles
+    return float(km_to_convert) * KM_TO_MILES
 
 
 def cast_bool(val: str) -> bool:
@@ -67,12 +79,7 @@ def cast_speed(speed: int) -> int:
     We need to convert to Miles so the speed calculates
     properly.
     """
-    speed_km = int(speed)
-    speed_miles = SpeedConverter.convert(
-        speed_km, UnitOfSpeed.KILOMETERS_PER_HOUR, UnitOfSpeed.MILES_PER_HOUR
-    )
-
-    return int(speed_miles)
+    return int(int(speed) * KM_PER_HOUR_TO_MILES_PER_HOUR)
 
 
 MAP_DRIVE_STATE = {
@@ -121,6 +128,26 @@ MAP_CHARGE_STATE = {
     "charging_state": ("charging_state", str),
 }
 
+# Topic suffix to the (sub_path, attr) it updates and the caster of its
+# payload, merged from the maps above. The car state lives in the car's root.
+TOPIC_DISPATCH: Mapping[str, tuple[str | None, str, Callable[[str], Any]]] = (
+    MappingProxyType(
+        {
+            **{
+                topic: (sub_path, attr, cast)
+                for sub_path, state_map in (
+                    ("drive_state", MAP_DRIVE_STATE),
+                    ("vehicle_state", MAP_VEHICLE_STATE),
+                    ("climate_state", MAP_CLIMATE_STATE),
+                    ("charge_state", MAP_CHARGE_STATE),
+                )
+                for topic, (attr, cast) in state_map.items()
+            },
+            "state": (None, "state", str),
+        }
+    )
+)
+
 
 class TeslaMate:
     """TeslaMate Connector.
@@ -133,15 +160,43 @@ class TeslaMate:
         hass: HomeAssistant,
         coordinators: dict[str, "TeslaDataUpdateCoordinator"],
         cars: dict[str, TeslaCar],
+        batch_window: int = DEFAULT_TESLAMATE_BATCH_WINDOW,
+        subscribe_all: bool = DEFAULT_TESLAMATE_SUBSCRIBE_ALL,
     ) -> None:
-        """Init Class."""
+        """Init Class.
+
+        batch_window is how many milliseconds the updates of a car are
+        collected before they are applied together. subscribe_all subscribes
+        to every topic of a car instead of the ones in TOPIC_DISPATCH.
+        """
         self.cars = cars
         self.hass = hass
         self.coordinators = coordinators
+        self.batch_window = batch_window
+        self.subscribe_all = subscribe_all
         self._enabled = False
         self._data: dict = None
+        # TeslaMate car id to car, rebuilt whenever the car map changes so
+        # messages find their car without touching the store.
+        self._cars_by_id: dict[str, TeslaCar] = {}
+
+        # Messages are queued by the MQTT callback and applied on the next
+        # loop iteration, so the MQTT client never waits on us.
+        self._queue: deque[ReceiveMessage] = deque()
+        self._drain_handle: asyncio.Handle | None = None
+        self.received_count = 0
+        self.dropped_count = 0
+
+        # Updates are collected per car and applied once per batch window.
+        self._pending: dict[str, tuple[TeslaCar, dict[DataPath, Any]]] = {}
+        self._pending_counts: Counter[str] = Counter()
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self.batch_count = 0
+        self.batched_count = 0
+        self.max_batch_size = 0
 
         self.watchers = []
+        self.subscribed_topics: list[str] = []
 
         self._sub_state = None
         self._store = Store[dict[str, str]](
@@ -163,6 +218,16 @@ class TeslaMate:
         """Unsub from MQTT topics."""
         logger.info("Un-subbing from all MQTT Topics.")
         self._sub_state = async_unsubscribe_topics(self.hass, self._sub_state)
+        self.subscribed_topics = []
+        self._queue.clear()
+        if self._drain_handle is not None:
+            self._drain_handle.cancel()
+            self._drain_handle = None
+        self._pending.clear()
+        self._pending_counts.clear()
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
         logger.info("Un-subbed from all MQTT Topics.")
 
     async def async_load(self) -> None:
@@ -170,6 +235,7 @@ class TeslaMate:
         if self._data is None:
             if stored := await self._store.async_load():
                 self._data = stored
+                self._rebuild_car_index()
 
         # If still None, initialise it.
         if self._data is None:
@@ -190,6 +256,7 @@ class TeslaMate:
         self._data["car_map"][vin] = teslamate_id
 
         await self._async_save()
+        self._rebuild_car_index()
         logger.debug("Successfully set car ID. Latest Car data")
         logger.debug(self._data)
 
@@ -212,21 +279,31 @@ class TeslaMate:
 
         await self.async_load()
 
-        car_map = self._data.get("car_map", {})
-        for vin, tm_id in car_map.items():
-            if tm_id != teslamate_id:
-                continue
+        return self._cars_by_id.get(teslamate_id)
 
+    def _rebuild_car_index(self) -> None:
+        """Index the loaded cars by their TeslaMate car id."""
+        cars_by_id = {}
+        for vin, teslamate_id in self.car_map.items():
             if car := self.cars.get(vin):
-                return car
+                cars_by_id[teslamate_id] = car
+            else:
+                logger.debug(
+                    "TeslaMate_id %s is mapped to stale VIN %s that is not loaded",
+                    teslamate_id,
+                    vin,
+                )
+        self._cars_by_id = cars_by_id
 
-            logger.debug(
-                "TeslaMate_id %s is mapped to stale VIN %s that is not loaded",
-                teslamate_id,
-                vin,
-            )
+    @property
+    def enabled(self) -> bool:
+        """Return whether TeslaMate updates are enabled."""
+        return self._enabled
 
-        return None
+    @property
+    def car_map(self) -> dict[str, str]:
+        """Return the TeslaMate car ids by VIN."""
+        return (self._data or {}).get("car_map", {})
 
     async def enable(self, enable=True):
         """Start Listening to MQTT topics."""
@@ -252,6 +329,8 @@ class TeslaMate:
 
         # Unsubscribe from all topics before creating new ones
         await self._unsub_mqtt()
+        await self.async_load()
+        self._rebuild_car_index()
 
         topics = {}
 
@@ -270,6 +349,7 @@ class TeslaMate:
             self.hass, self._sub_state, topics
         )
         await async_subscribe_topics(self.hass, self._sub_state)
+        self.subscribed_topics = [topic["topic"] for topic in topics.values()]
         logger.debug("Subscribed to MQTT Topics")
 
         logger.debug("Completed watch_cars")
@@ -280,37 +360,105 @@ class TeslaMate:
             "Setting up MQTT Sub for VIN:%s TelsaMateID:%s", car.vin, teslamate_id
         )
 
-        def msg_recieved(msg: ReceiveMessage):
-            return asyncio.run_coroutine_threadsafe(
-                self.async_handle_new_data(msg), self.hass.loop
-            ).result()
-
-        sub_id = f"teslamate_{teslamate_id}"
-        mqtt_topic = f"teslamate/cars/{teslamate_id}/#"
-        logger.debug("MQTT Topic: %s", mqtt_topic)
-
-        topics[sub_id] = {
-            "topic": mqtt_topic,
-            "msg_callback": msg_recieved,
-            "qos": 0,
-        }
-
-        logger.info("Created mqtt Topic for: %s", mqtt_topic)
+        # Only the topics we dispatch, unless asked for all of them.
+        if self.subscribe_all:
+            suffixes = {f"teslamate_{teslamate_id}": "#"}
+        else:
+            suffixes = {
+                f"teslamate_{teslamate_id}_{suffix}": suffix
+                for suffix in TOPIC_DISPATCH
+            }
+
+        for sub_id, suffix in suffixes.items():
+            topics[sub_id] = {
+                "topic": f"teslamate/cars/{teslamate_id}/{suffix}",
+                "msg_callback": self.async_queue_message,
+                "qos": 0,
+            }
+
+        logger.info(
+            "Created %s mqtt Topics for TeslaMateID:%s", len(suffixes), teslamate_id
+        )
 
-    async def async_handle_new_data(self, msg: ReceiveMessage):
-        """Update Car Data from MQTT msg."""
+    @callback
+    def async_queue_message(self, msg: ReceiveMessage) -> None:
+        """Queue a MQTT msg, dropping the oldest one when the queue is full."""
+        self.received_count += 1
+        if len(self._queue) >= TESLAMATE_QUEUE_SIZE:
+            self._queue.popleft()
+            self.dropped_count += 1
+        self._queue.append(msg)
+        if self._drain_handle is None:
+            self._drain_handle = self.hass.loop.call_soon(self._async_drain_queue)
+
+    @callback
+    def _async_drain_queue(self) -> None:
+        """Apply the queued MQTT msgs."""
+        self._drain_handle = None
+        queue = self._queue
+        while queue:
+            msg = queue.popleft()
+            try:
+                self.async_handle_new_data(msg)
+            except (TypeError, ValueError):
+                logger.debug("Invalid payload %s for %s", msg.payload, msg.topic)
+        if not self._pending or self._flush_handle is not None:
+            return
+        if self.batch_window > 0:
+            self._flush_handle = self.hass.loop.call_later(
+                self.batch_window / 1000, self.async_flush
+            )
+        else:
+            self.async_flush()
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of MQTT msgs waiting to be applied."""
+        return len(self._queue)
+
+    @property
+    def messages_per_batch(self) -> float | None:
+        """Return the average number of MQTT msgs applied per batch."""
+        return self.batched_count / self.batch_count if self.batch_count else None
+
+    @callback
+    def async_flush(self) -> None:
+        """Apply the pending updates, notifying each car's coordinator once."""
+        self._flush_handle = None
+        pending, self._pending = self._pending, {}
+        counts, self._pending_counts = self._pending_counts, Counter()
+        for vin, (car, updates) in pending.items():
+            for (sub_path, attr), value in updates.items():
+                self.update_car_state(car, sub_path, attr, value)
+            logger.debug(
+                "Applied %s updates from %s MQTT msgs for VIN:%s",
+                len(updates),
+                counts[vin],
+                vin,
+            )
+            self.batch_count += 1
+            self.batched_count += counts[vin]
+            self.max_batch_size = max(self.max_batch_size, counts[vin])
+            self.coordinators[vin].async_handle_pushed_data(set(updates))
+
+    @callback
+    def async_handle_new_data(self, msg: ReceiveMessage) -> None:
+        """Collect the Car Data update of a MQTT msg for the next batch."""
         logger.debug("MQTT Topic Recieved: %s", msg.topic)
 
-        mqtt_attr = msg.topic.split("/")[-1]
-        teslamate_id = msg.topic.split("/")[2]
-        car = await self.get_car_from_id(teslamate_id)
+        topic = msg.topic.split("/")
+        mqtt_attr = topic[-1]
+        if (dispatch := TOPIC_DISPATCH.get(mqtt_attr)) is None:
+            # Nothing matched. Return without updating listeners.
+            return
+
+        teslamate_id = topic[2]
+        car = self._cars_by_id.get(teslamate_id)
 
         if car is None:
             logger.debug("TeslaMate_id %s not found in config", teslamate_id)
             return
 
-        coordinator = self.coordinators[car.vin]
-
         logger.debug(
             "Got %s from MQTT for VIN:%s | TeslsMateID:%s",
             mqtt_attr,
@@ -318,33 +466,14 @@ class TeslaMate:
             teslamate_id,
         )
 
-        if mqtt_attr in MAP_DRIVE_STATE:
-            attr, cast = MAP_DRIVE_STATE[mqtt_attr]
-            self.update_car_state(car, "drive_state", attr, cast(msg.payload))
-
-        elif mqtt_attr in MAP_VEHICLE_STATE:
-            attr, cast = MAP_VEHICLE_STATE[mqtt_attr]
-            self.update_car_state(car, "vehicle_state", attr, cast(msg.payload))
-
-        elif mqtt_attr in MAP_CLIMATE_STATE:
-            attr, cast = MAP_CLIMATE_STATE[mqtt_attr]
-            self.update_car_state(car, "climate_state", attr, cast(msg.payload))
-
-        elif mqtt_attr in MAP_CHARGE_STATE:
-            attr, cast = MAP_CHARGE_STATE[mqtt_attr]
-            self.update_car_state(car, "charge_state", attr, cast(msg.payload))
-
-        elif mqtt_attr == "state":
-            state = msg.payload
-            self.update_car_state(car, None, "state", state)
-
-        else:
-            # Nothing matched. Return without updating listeners.
-            return
+        sub_path, attr, cast = dispatch
+        value = cast(msg.payload)
 
-        coordinator.last_update_time = round(time.time())
-        coordinator.assumed_state = False
-        coordinator.async_update_listeners_debounced()
+        # A later msg of the same batch supersedes an earlier one.
+        if (pending := self._pending.get(car.vin)) is None:
+            pending = self._pending[car.vin] = (car, {})
+        pending[1][(sub_path, attr)] = value
+        self._pending_counts[car.vin] += 1
 
     def update_charging_state(self, car: TeslaCar, val: str):
         """Update charging state."""
@@ -23,7 +23,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry, async_add_entitie
         coordinator = coordinators[vin]
         entities.append(TeslaCarTeslaMateID(car, coordinator, teslamate))
 
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities)
 
 
 class TeslaCarTeslaMateID(TeslaCarEntity, TextEntity):
@@ -53,11 +53,12 @@ class TeslaCarTeslaMateID(TeslaCarEntity, TextEntity):
 
         await self.teslamate.set_car_id(self._car.vin, value)
         await self.teslamate.watch_cars()
+        self._state = value
         self.async_write_ha_state()
 
-    async def async_update(self) -> None:
-        """Update the entity."""
-        # Ignore manual update requests if the entity is disabled
+    async def async_added_to_hass(self) -> None:
+        """Load the stored TeslaMate ID."""
+        await super().async_added_to_hass()
         self._state = await self.teslamate.get_car_id(self._car.vin)
 
     @property
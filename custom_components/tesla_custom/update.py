@@ -16,7 +16,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry, async_add_entitie
     cars = entry_data["cars"]
 
     entities = [TeslaCarUpdate(car, coordinators[vin]) for vin, car in cars.items()]
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities)
 
 
 INSTALLABLE_STATUSES = ["available", "scheduled"]
@@ -34,6 +34,10 @@ class TeslaCarUpdate(TeslaCarEntity, UpdateEntity):
     """Representation of a Tesla car update."""
 
     type = "software update"
+    _data_paths = (
+        ("vehicle_state", "software_update"),
+        ("vehicle_state", "car_version"),
+    )
 
     @property
     def supported_features(self):
@@ -125,6 +129,8 @@ class TeslaCarUpdate(TeslaCarEntity, UpdateEntity):
     async def async_install(self, version, backup: bool, **kwargs: Any) -> None:
         """Install an Update."""
         # Ask Tesla to start the update now.
-        await self._car.schedule_software_update(offset_sec=0)
+        await self.async_send_command(
+            "software_update", self._car.schedule_software_update, offset_sec=0
+        )
         # Do a controller refresh, to get the latest data from Tesla.
         await self.update_controller(force=True)
@@ -1,8 +1,17 @@
 """Utilities for tesla."""
 
+from collections.abc import Iterable
+import hashlib
+import logging
 import ssl
 
+from homeassistant.core import HomeAssistant
 import httpx
+from teslajsonpy.car import TeslaCar
+
+from .const import DATA_SSL_CONTEXTS
+
+_LOGGER = logging.getLogger(__name__)
 
 try:
     # Home Assistant 2023.4.x+
@@ -26,3 +35,96 @@ def create_tesla_ssl_context() -> ssl.SSLContext:
     ctx = httpx.create_ssl_context()
     ctx.maximum_version = ssl.TLSVersion.TLSv1_2
     return ctx
+
+
+def _file_fingerprint(path: str) -> str | None:
+    """Return the SHA-256 of a file's content, None when it cannot be read."""
+    try:
+        with open(path, "rb") as file:
+            return hashlib.sha256(file.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def get_tesla_ssl_context(
+    cache: dict[tuple[str | None, str | None], ssl.SSLContext], cert: str | None
+) -> ssl.SSLContext:
+    """Return the SSL context trusting cert, building it on a cache miss.
+
+    Does blocking I/O. Contexts are cached by certificate path and content,
+    so a changed certificate gets a new context. A cached context is never
+    changed after it was built, which keeps sharing it between accounts safe.
+    """
+    key = (cert, _file_fingerprint(cert) if cert else None)
+    if (ctx := cache.get(key)) is not None:
+        return ctx
+    ctx = create_tesla_ssl_context()
+    if cert:
+        try:
+            ctx.load_verify_locations(cert)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Trusting CA: %s", ctx.get_ca_certs()[-1])
+        except (FileNotFoundError, ssl.SSLError):
+            _LOGGER.warning("Unable to load custom SSL certificate from %s", cert)
+    cache[key] = ctx
+    return ctx
+
+
+async def async_get_tesla_ssl_context(
+    hass: HomeAssistant, cert: str | None
+) -> ssl.SSLContext:
+    """Return the cached SSL context trusting cert, built in the executor."""
+    cache = hass.data.setdefault(DATA_SSL_CONTEXTS, {})
+    return await hass.async_add_executor_job(get_tesla_ssl_context, cache, cert)
+
+
+# A (sub_path, attr) location in a car's raw API data. A None sub_path is the
+# vehicle list entry (``car._car``), any other sub_path is a section of
+# ``car._vehicle_data`` such as ``charge_state``. A None attr matches every key
+# of the sub_path.
+DataPath = tuple[str | None, str | None]
+
+_MISSING = object()
+
+
+def snapshot_car_data(car: TeslaCar) -> dict[str | None, dict]:
+    """Return a shallow, per sub_path copy of a car's raw API data."""
+    # pylint: disable=protected-access
+    snapshot = {None: dict(car._car)}
+    for sub_path, values in car._vehicle_data.items():
+        if isinstance(values, dict):
+            snapshot[sub_path] = dict(values)
+    return snapshot
+
+
+def diff_car_data(
+    old: dict[str | None, dict], new: dict[str | None, dict]
+) -> set[DataPath]:
+    """Return the (sub_path, attr) paths whose values differ between snapshots."""
+    changed = set()
+    for sub_path in old.keys() | new.keys():
+        old_values = old.get(sub_path, {})
+        new_values = new.get(sub_path, {})
+        if old_values == new_values:
+            continue
+        for attr in old_values.keys() | new_values.keys():
+            if old_values.get(attr, _MISSING) != new_values.get(attr, _MISSING):
+                changed.add((sub_path, attr))
+    return changed
+
+
+def update_car_snapshot(
+    snapshot: dict[str | None, dict], car: TeslaCar, paths: Iterable[DataPath]
+) -> None:
+    """Copy the current values of paths from a car into a snapshot."""
+    # pylint: disable=protected-access
+    for sub_path, attr in paths:
+        values = car._car if sub_path is None else car._vehicle_data.get(sub_path)
+        if not isinstance(values, dict):
+            snapshot.pop(sub_path, None)
+        elif attr is None:
+            snapshot[sub_path] = dict(values)
+        elif attr in values:
+            snapshot.setdefault(sub_path, {})[attr] = values[attr]
+        else:
+            snapshot.get(sub_path, {}).pop(attr, None)
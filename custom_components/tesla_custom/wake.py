@@ -0,0 +1,84 @@
+"""Wake Module.
+
+This makes sure a car is only woken up once at a time, however many callers
+asked for it.
+"""
+
+import asyncio
+import logging
+import time
+
+from homeassistant.core import HomeAssistant
+from teslajsonpy.car import TeslaCar
+
+from .const import DOMAIN
+
+logger = logging.getLogger(__name__)
+
+
+class TeslaWakeManager:
+    """Per car single-flight wake up.
+
+    Callers asking for a wake up while one is running share its result. A new
+    wake up is refused until ``cooldown`` seconds after the last one finished,
+    callers then get whether the car is online.
+    """
+
+    def __init__(self, hass: HomeAssistant, car: TeslaCar, cooldown: float) -> None:
+        """Init Class."""
+        self.hass = hass
+        self.car = car
+        self.cooldown = cooldown
+        self._wake: asyncio.Task | None = None
+        self._last_wake_end: float | None = None
+        self.wake_count = 0
+        self.shared_count = 0
+        self.refused_count = 0
+        self.last_latency: float | None = None
+        self.max_latency = 0.0
+
+    @property
+    def cooldown_remaining(self) -> float:
+        """Return the seconds left until a new wake up is sent."""
+        if self._last_wake_end is None:
+            return 0.0
+        return max(self._last_wake_end + self.cooldown - time.monotonic(), 0.0)
+
+    @property
+    def cooling_down(self) -> bool:
+        """Return whether a wake up would be refused because of the cooldown."""
+        return self._wake is None and self.cooldown_remaining > 0
+
+    async def async_wake_up(self) -> bool:
+        """Wake the car up, returns whether it is online."""
+        if self._wake is None:
+            if self.cooldown_remaining > 0:
+                logger.debug(
+                    "%s: Not waking up, last wake up was less than %.0f seconds ago",
+                    self.car.vin[-5:],
+                    self.cooldown,
+                )
+                self.refused_count += 1
+                return self.car.is_on
+            self._wake = self.hass.async_create_task(
+                self._async_wake_up(), f"{DOMAIN} wake up {self.car.vin}"
+            )
+        else:
+            self.shared_count += 1
+        # Shielded so a cancelled caller does not cancel the shared wake up.
+        return await asyncio.shield(self._wake)
+
+    async def _async_wake_up(self) -> bool:
+        """Send the wake up shared by every caller."""
+        start = time.monotonic()
+        try:
+            await self.car.wake_up()
+        finally:
+            self._wake = None
+            self._last_wake_end = time.monotonic()
+            latency = self._last_wake_end - start
+            self.wake_count += 1
+            self.last_latency = latency
+            self.max_latency = max(self.max_latency, latency)
+            logger.debug("%s: Wake up took %.1f seconds", self.car.vin[-5:], latency)
+        return self.car.is_on
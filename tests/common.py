@@ -1,7 +1,8 @@
 """Common methods used across tests for Tesla."""
 
+from collections.abc import Callable
 from datetime import datetime
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from homeassistant.const import (
     CONF_ACCESS_TOKEN,
@@ -77,8 +78,16 @@ def setup_mock_controller(mock_controller):
     }
 
 
-async def setup_platform(hass: HomeAssistant, platform: str) -> MockConfigEntry:
-    """Set up the Tesla platform."""
+async def setup_platform(
+    hass: HomeAssistant,
+    platform: str,
+    setup_controller: Callable[[MagicMock], None] | None = None,
+    options: dict | None = None,
+) -> MockConfigEntry:
+    """Set up the Tesla platform.
+
+    setup_controller can adjust the mock controller after the mock data is set.
+    """
 
     mock_entry = MockConfigEntry(
         domain=TESLA_DOMIN,
@@ -93,7 +102,7 @@ async def setup_platform(hass: HomeAssistant, platform: str) -> MockConfigEntry:
             CONF_API_PROXY_CERT: TEST_API_PROXY_CERT,
             CONF_API_PROXY_URL: TEST_API_PROXY_URL,
         },
-        options=None,
+        options=options,
     )
 
     mock_entry.add_to_hass(hass)
@@ -105,6 +114,8 @@ async def setup_platform(hass: HomeAssistant, platform: str) -> MockConfigEntry:
         ) as mock_controller,
     ):
         setup_mock_controller(mock_controller)
+        if setup_controller is not None:
+            setup_controller(mock_controller)
         assert await async_setup_component(hass, TESLA_DOMIN, {})
     await hass.async_block_till_done()
 
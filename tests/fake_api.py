@@ -0,0 +1,219 @@
+"""Local stand-in for the Tesla Owner and Fleet API.
+
+``FakeTeslaAPI`` answers the requests teslajsonpy makes for a configurable
+fleet of cars and solar sites, with programmable latency, sleeping cars,
+rate limits and server errors. The integration reaches it through
+``CONF_API_PROXY_URL``, so the real controller, request governor and
+coordinators run end to end without a network.
+
+Serve it with ``httpx.MockTransport(fake)`` or, in tests, register it with
+``pytest_httpx``::
+
+    httpx_mock.add_callback(fake, url=FAKE_API_PATTERN, is_reusable=True)
+"""
+
+import asyncio
+from collections import Counter, deque
+from copy import deepcopy
+from dataclasses import dataclass
+import json
+import re
+from typing import Any
+
+import httpx
+
+from .mock_data import car as car_mock_data, energysite as energysite_mock_data
+
+FAKE_API_URL = "https://fake-tesla-api.local"
+FAKE_API_PATTERN = re.compile(rf"^{re.escape(FAKE_API_URL)}/")
+
+ROUTES = [
+    ("products", "GET", re.compile(r"^/api/1/products$")),
+    ("vehicle_summary", "GET", re.compile(r"^/api/1/vehicles/(?P<id>\d+)$")),
+    ("vehicle_data", "GET", re.compile(r"^/api/1/vehicles/(?P<id>\d+)/vehicle_data$")),
+    ("wake_up", "POST", re.compile(r"^/api/1/vehicles/(?P<id>\d+)/wake_up$")),
+    (
+        "command",
+        "POST",
+        re.compile(r"^/api/1/vehicles/(?P<id>\d+)/command/(?P<command>\w+)$"),
+    ),
+    ("site_info", "GET", re.compile(r"^/api/1/energy_sites/(?P<id>\d+)/site_info$")),
+    (
+        "live_status",
+        "GET",
+        re.compile(r"^/api/1/energy_sites/(?P<id>\d+)/live_status$"),
+    ),
+]
+
+
+@dataclass
+class _Failure:
+    """An error the fake answers instead of the next matching requests."""
+
+    status: int
+    count: int
+    endpoint: str | None
+    retry_after: int | None
+
+
+def fake_vin(index: int) -> str:
+    """Return the VIN of the car at index of the fake fleet."""
+    return f"{car_mock_data.VIN[:-3].upper()}{index:03d}"
+
+
+class FakeTeslaAPI:
+    """Fake Tesla API serving the shared mock data for a fleet.
+
+    Every car and site is a copy of the mock data with its own ids, so tests
+    may change the returned data through ``vehicle_data`` and ``site_data``.
+    """
+
+    def __init__(
+        self,
+        vehicles: int = 1,
+        energysites: int = 0,
+        *,
+        latency: float = 0.0,
+        endpoint_latency: dict[str, float] | None = None,
+    ) -> None:
+        """Init Class."""
+        self.latency = latency
+        self.endpoint_latency = endpoint_latency or {}
+        self.calls: Counter[str] = Counter()
+        self.commands: list[tuple[str, str, dict]] = []
+        self._failures: deque[_Failure] = deque()
+
+        self.vehicles: dict[str, dict] = {}
+        self.vehicle_data: dict[str, dict] = {}
+        self._vins_by_id: dict[str, str] = {}
+        for index in range(vehicles):
+            vin = fake_vin(index)
+            car_id = car_mock_data.CAR_ID + index
+            vehicle_id = car_mock_data.VEHICLE["vehicle_id"] + index
+            identity = {
+                "id": car_id,
+                "id_s": str(car_id),
+                "vehicle_id": vehicle_id,
+                "vin": vin,
+                "display_name": f"Model S {index}",
+            }
+            self.vehicles[vin] = {**deepcopy(car_mock_data.VEHICLE), **identity}
+            self.vehicle_data[vin] = {
+                **deepcopy(car_mock_data.VEHICLE_DATA),
+                **identity,
+            }
+            self._vins_by_id[str(car_id)] = vin
+
+        self.sites: dict[int, dict] = {}
+        self.site_data: dict[int, dict] = {}
+        self._site_config: dict[int, dict] = {}
+        for index in range(energysites):
+            energy_site_id = energysite_mock_data.ENERGYSITE_SOLAR["energy_site_id"]
+            energy_site_id += index
+            self.sites[energy_site_id] = {
+                **deepcopy(energysite_mock_data.ENERGYSITE_SOLAR),
+                "energy_site_id": energy_site_id,
+                "asset_site_id": str(energy_site_id),
+            }
+            self._site_config[energy_site_id] = {
+                **deepcopy(energysite_mock_data.SITE_CONFIG_SOLAR),
+                "site_name": f"Home {index}",
+            }
+            self.site_data[energy_site_id] = deepcopy(energysite_mock_data.SITE_DATA)
+
+    def set_asleep(self, vin: str, asleep: bool = True) -> None:
+        """Put a car to sleep, or wake it without a wake up request."""
+        state = "asleep" if asleep else "online"
+        self.vehicles[vin]["state"] = state
+        self.vehicle_data[vin]["state"] = state
+
+    def fail_next(
+        self,
+        status: int,
+        count: int = 1,
+        *,
+        endpoint: str | None = None,
+        retry_after: int | None = None,
+    ) -> None:
+        """Answer the next count requests, of endpoint if given, with status.
+
+        retry_after is sent as the Retry-After header, Tesla sends it with
+        429 Too Many Requests.
+        """
+        self._failures.append(_Failure(status, count, endpoint, retry_after))
+
+    def _take_failure(self, endpoint: str) -> _Failure | None:
+        """Return the error to answer a request of endpoint with, if any."""
+        for failure in self._failures:
+            if failure.endpoint in (None, endpoint):
+                failure.count -= 1
+                if not failure.count:
+                    self._failures.remove(failure)
+                return failure
+        return None
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request like the Tesla API would."""
+        for endpoint, method, pattern in ROUTES:
+            if request.method == method and (match := pattern.match(request.url.path)):
+                break
+        else:
+            return httpx.Response(404, json={"error": "not_found"})
+
+        self.calls[endpoint] += 1
+        if delay := self.endpoint_latency.get(endpoint, self.latency):
+            await asyncio.sleep(delay)
+
+        if failure := self._take_failure(endpoint):
+            headers = {}
+            if failure.retry_after is not None:
+                headers["Retry-After"] = str(failure.retry_after)
+            return httpx.Response(
+                failure.status,
+                headers=headers,
+                json={"response": None, "error": f"fake error {failure.status}"},
+            )
+
+        groups = match.groupdict()
+        if endpoint == "products":
+            return _response([*self.vehicles.values(), *self.sites.values()])
+        if endpoint in ("site_info", "live_status"):
+            return self._site_response(endpoint, int(groups["id"]))
+        if (vin := self._vins_by_id.get(groups["id"])) is None:
+            return httpx.Response(404, json={"error": "not_found"})
+        return self._vehicle_response(endpoint, vin, request, groups.get("command"))
+
+    def _vehicle_response(
+        self, endpoint: str, vin: str, request: httpx.Request, command: str | None
+    ) -> httpx.Response:
+        """Answer a request for a car."""
+        vehicle = self.vehicles[vin]
+        if endpoint == "vehicle_summary":
+            return _response(vehicle)
+        if endpoint == "wake_up":
+            self.set_asleep(vin, False)
+            return _response(vehicle)
+        if vehicle["state"] != "online":
+            return httpx.Response(408, json=car_mock_data.RESULT_VEHICLE_UNAVAILABLE)
+        if endpoint == "vehicle_data":
+            return _response(self.vehicle_data[vin])
+        self.commands.append((vin, command, _json(request)))
+        return httpx.Response(200, json=car_mock_data.RESULT_OK)
+
+    def _site_response(self, endpoint: str, energy_site_id: int) -> httpx.Response:
+        """Answer a request for a solar site."""
+        if energy_site_id not in self.sites:
+            return httpx.Response(404, json={"error": "not_found"})
+        if endpoint == "site_info":
+            return _response(self._site_config[energy_site_id])
+        return _response(self.site_data[energy_site_id])
+
+
+def _response(data: Any) -> httpx.Response:
+    """Return a successful API response wrapping data."""
+    return httpx.Response(200, json={"response": deepcopy(data)})
+
+
+def _json(request: httpx.Request) -> dict:
+    """Return the JSON body of a command, commands may have none."""
+    return json.loads(request.content) if request.content else {}
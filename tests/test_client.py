@@ -0,0 +1,98 @@
+"""Tests for the Tesla HTTP clients."""
+
+from homeassistant.core import HomeAssistant
+import httpx
+import pytest
+
+from custom_components.tesla_custom.client import (
+    TeslaHttpOptions,
+    async_create_client,
+    is_command,
+)
+from custom_components.tesla_custom.const import (
+    CONF_HTTP_COMMAND_TIMEOUT,
+    CONF_HTTP_CONNECT_TIMEOUT,
+    DATA_TRANSPORTS,
+    DEFAULT_HTTP_READ_TIMEOUT,
+)
+from custom_components.tesla_custom.util import create_tesla_ssl_context
+
+pytestmark = pytest.mark.asyncio
+
+API_URL = "https://owner-api.teslamotors.com/api/1/vehicles/123"
+
+
+def test_options_from_config_entry_options() -> None:
+    """Unset options fall back to their defaults."""
+    options = TeslaHttpOptions.from_options(
+        {CONF_HTTP_CONNECT_TIMEOUT: 5, CONF_HTTP_COMMAND_TIMEOUT: 90}
+    )
+
+    assert options.timeout == httpx.Timeout(DEFAULT_HTTP_READ_TIMEOUT, connect=5)
+    assert options.command_timeouts["read"] == 90
+    assert options.command_timeouts["connect"] == 5
+    assert TeslaHttpOptions.from_options({}) == TeslaHttpOptions()
+
+
+def test_is_command() -> None:
+    """Commands and wake ups are told apart from polls."""
+    assert is_command(httpx.Request("POST", f"{API_URL}/command/honk_horn"))
+    assert is_command(httpx.Request("POST", f"{API_URL}/wake_up"))
+    assert not is_command(httpx.Request("GET", f"{API_URL}/vehicle_data"))
+
+
+async def test_clients_share_pool(hass: HomeAssistant) -> None:
+    """Clients with the same options share a pool until the last one closes."""
+    ssl_context = create_tesla_ssl_context()
+    options = TeslaHttpOptions()
+    first = async_create_client(hass, ssl_context, None, options, [], [])
+    second = async_create_client(hass, ssl_context, None, options, [], [])
+    other = async_create_client(
+        hass, ssl_context, None, TeslaHttpOptions(pool_size=1), [], []
+    )
+    transports = hass.data[DATA_TRANSPORTS]
+    assert len(transports) == 2
+    assert first.cookies is not second.cookies
+
+    await first.aclose()
+    await first.aclose()
+    assert len(transports) == 2
+
+    await second.aclose()
+    await other.aclose()
+    assert not transports
+
+
+async def test_new_ssl_context_gets_new_pool(hass: HomeAssistant) -> None:
+    """A certificate whose content changed does not reuse the old pool."""
+    options = TeslaHttpOptions()
+    first = async_create_client(
+        hass, create_tesla_ssl_context(), "cert.pem", options, [], []
+    )
+    second = async_create_client(
+        hass, create_tesla_ssl_context(), "cert.pem", options, [], []
+    )
+
+    assert len(hass.data[DATA_TRANSPORTS]) == 2
+
+    await first.aclose()
+    await second.aclose()
+
+
+async def test_command_timeout(hass: HomeAssistant) -> None:
+    """Commands are sent with the command timeout."""
+    options = TeslaHttpOptions(command_timeout=90)
+    client = async_create_client(
+        hass, create_tesla_ssl_context(), None, options, [], []
+    )
+    set_timeout = client.event_hooks["request"][-1]
+
+    command = client.build_request("POST", f"{API_URL}/command/honk_horn")
+    await set_timeout(command)
+    assert command.extensions["timeout"] == options.command_timeouts
+
+    poll = client.build_request("GET", f"{API_URL}/vehicle_data")
+    await set_timeout(poll)
+    assert poll.extensions["timeout"] == options.timeout.as_dict()
+
+    await client.aclose()
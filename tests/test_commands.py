@@ -0,0 +1,184 @@
+"""Tests for the Tesla car command queue."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from homeassistant.core import HomeAssistant
+import httpx
+import pytest
+from teslajsonpy.exceptions import TeslaException
+
+from custom_components.tesla_custom.commands import TeslaCommandQueue
+from custom_components.tesla_custom.wake import TeslaWakeManager
+
+from .mock_data import car as car_mock_data
+
+pytestmark = pytest.mark.asyncio
+
+
+def _mock_car(is_on: bool = True) -> MagicMock:
+    """Return a car mock that is online once woken up."""
+    car = MagicMock(vin=car_mock_data.VIN, is_on=is_on)
+
+    async def wake_up():
+        car.is_on = True
+
+    car.wake_up = AsyncMock(side_effect=wake_up)
+    return car
+
+
+def _queue(
+    hass: HomeAssistant, car: MagicMock, cooldown: float = 0
+) -> TeslaCommandQueue:
+    """Return a command queue for the car, without a wake up cooldown by default."""
+    return TeslaCommandQueue(hass, car, TeslaWakeManager(hass, car, cooldown=cooldown))
+
+
+async def test_commands_run_in_order(hass: HomeAssistant) -> None:
+    """Queued commands are sent one at a time in the order they were queued."""
+    queue = _queue(hass, _mock_car())
+    sent = []
+    running = 0
+
+    async def command(name):
+        nonlocal running
+        running += 1
+        assert running == 1
+        await asyncio.sleep(0)
+        sent.append(name)
+        running -= 1
+        return name
+
+    results = await asyncio.gather(
+        queue.async_send(None, command, "lock"),
+        queue.async_send(None, command, "horn"),
+        queue.async_send(None, command, "horn"),
+    )
+
+    assert sent == ["lock", "horn", "horn"]
+    assert results == ["lock", "horn", "horn"]
+    assert queue.executed_count == 3
+    assert queue.depth == 0
+    assert queue.last_latency is not None
+    assert queue.average_latency <= queue.max_latency
+
+
+async def test_newer_command_replaces_queued_one(hass: HomeAssistant) -> None:
+    """Only the newest value of a key still waiting in the queue is sent."""
+    queue = _queue(hass, _mock_car())
+    set_charging_amps = AsyncMock(side_effect=lambda amps: amps)
+    lock = AsyncMock()
+
+    results = await asyncio.gather(
+        queue.async_send(None, lock),
+        queue.async_send("charging_amps", set_charging_amps, 8),
+        queue.async_send("charging_amps", set_charging_amps, 16),
+        queue.async_send("charging_amps", set_charging_amps, 32),
+    )
+
+    lock.assert_awaited_once()
+    set_charging_amps.assert_awaited_once_with(32)
+    assert results[1:] == [32, 32, 32]
+    assert queue.superseded_count == 2
+    assert queue.executed_count == 2
+
+
+async def test_replaced_command_keeps_its_position(hass: HomeAssistant) -> None:
+    """A replaced command still runs before the commands queued after it."""
+    queue = _queue(hass, _mock_car())
+    sent = []
+
+    async def command(name, value):
+        sent.append((name, value))
+
+    await asyncio.gather(
+        queue.async_send("hvac_mode", command, "hvac_mode", "off"),
+        queue.async_send("seat_heater", command, "seat_heater", 3),
+        queue.async_send("hvac_mode", command, "hvac_mode", "heat_cool"),
+    )
+
+    assert sent == [("hvac_mode", "heat_cool"), ("seat_heater", 3)]
+    assert queue.superseded_count == 1
+
+
+async def test_batch_wakes_car_once(hass: HomeAssistant) -> None:
+    """An asleep car is woken once for all the queued commands."""
+    car = _mock_car(is_on=False)
+    queue = _queue(hass, car)
+    command = AsyncMock()
+
+    await asyncio.gather(
+        queue.async_send(None, command),
+        queue.async_send(None, command),
+    )
+
+    car.wake_up.assert_awaited_once()
+    assert command.await_count == 2
+
+
+async def test_failed_wake_fails_batch(hass: HomeAssistant) -> None:
+    """Commands are not sent when the car could not be woken."""
+    car = _mock_car(is_on=False)
+    car.wake_up.side_effect = TeslaException(408)
+    queue = _queue(hass, car)
+    command = AsyncMock()
+
+    results = await asyncio.gather(
+        queue.async_send(None, command),
+        queue.async_send("sentry_mode", command),
+        return_exceptions=True,
+    )
+
+    command.assert_not_awaited()
+    assert all(isinstance(result, TeslaException) for result in results)
+    assert queue.failed_count == 2
+
+
+async def test_car_still_asleep_fails_batch(hass: HomeAssistant) -> None:
+    """Commands fail as unavailable when the wake up did not bring the car online."""
+    car = _mock_car(is_on=False)
+    car.wake_up.side_effect = None
+    queue = _queue(hass, car)
+    command = AsyncMock()
+
+    with pytest.raises(TeslaException) as err:
+        await queue.async_send(None, command)
+
+    assert err.value.message == "VEHICLE_UNAVAILABLE"
+    command.assert_not_awaited()
+
+
+async def test_commands_are_sent_during_wake_cooldown(hass: HomeAssistant) -> None:
+    """A failed wake up fails its batch, later commands are sent during the cooldown."""
+    car = _mock_car(is_on=False)
+    car.wake_up.side_effect = httpx.ConnectError("unreachable")
+    queue = _queue(hass, car, cooldown=30)
+    command = AsyncMock(return_value=True)
+
+    with pytest.raises(httpx.ConnectError):
+        await queue.async_send(None, command)
+    command.assert_not_awaited()
+    assert queue.failed_count == 1
+
+    # The car went back to sleep, teslajsonpy wakes it when sending.
+    assert await queue.async_send(None, command) is True
+    car.wake_up.assert_awaited_once()
+    command.assert_awaited_once()
+
+
+async def test_failed_command_does_not_stop_queue(hass: HomeAssistant) -> None:
+    """An error is returned to its caller and the next command is still sent."""
+    queue = _queue(hass, _mock_car())
+    failing = AsyncMock(side_effect=TeslaException(500))
+    command = AsyncMock(return_value=True)
+
+    results = await asyncio.gather(
+        queue.async_send(None, failing),
+        queue.async_send(None, command),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], TeslaException)
+    assert results[1] is True
+    assert queue.failed_count == 1
+    assert queue.executed_count == 1
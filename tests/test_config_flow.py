@@ -22,15 +22,45 @@ from custom_components.tesla_custom.const import (
     CONF_API_PROXY_CERT,
     CONF_API_PROXY_ENABLE,
     CONF_API_PROXY_URL,
+    CONF_ENABLE_FLEET_TELEMETRY,
     CONF_ENABLE_TESLAMATE,
     CONF_EXPIRATION,
+    CONF_FLEET_CONCURRENCY,
+    CONF_FLEET_MODE,
+    CONF_FLEET_REDUCED_ENTITIES,
+    CONF_HTTP2,
+    CONF_HTTP_COMMAND_TIMEOUT,
+    CONF_HTTP_CONNECT_TIMEOUT,
+    CONF_HTTP_KEEPALIVE_EXPIRY,
+    CONF_HTTP_POOL_SIZE,
+    CONF_HTTP_READ_TIMEOUT,
     CONF_INCLUDE_ENERGYSITES,
     CONF_INCLUDE_VEHICLES,
     CONF_POLLING_POLICY,
+    CONF_REQUEST_BURST,
+    CONF_REQUEST_RATE,
+    CONF_TESLAMATE_BATCH_WINDOW,
+    CONF_TESLAMATE_SUBSCRIBE_ALL,
+    CONF_WAKE_COOLDOWN,
     CONF_WAKE_ON_START,
+    DEFAULT_ENABLE_FLEET_TELEMETRY,
     DEFAULT_ENABLE_TESLAMATE,
+    DEFAULT_FLEET_CONCURRENCY,
+    DEFAULT_FLEET_MODE,
+    DEFAULT_FLEET_REDUCED_ENTITIES,
+    DEFAULT_HTTP2,
+    DEFAULT_HTTP_COMMAND_TIMEOUT,
+    DEFAULT_HTTP_CONNECT_TIMEOUT,
+    DEFAULT_HTTP_KEEPALIVE_EXPIRY,
+    DEFAULT_HTTP_POOL_SIZE,
+    DEFAULT_HTTP_READ_TIMEOUT,
     DEFAULT_POLLING_POLICY,
+    DEFAULT_REQUEST_BURST,
+    DEFAULT_REQUEST_RATE,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TESLAMATE_BATCH_WINDOW,
+    DEFAULT_TESLAMATE_SUBSCRIBE_ALL,
+    DEFAULT_WAKE_COOLDOWN,
     DEFAULT_WAKE_ON_START,
     DOMAIN,
     MIN_SCAN_INTERVAL,
@@ -379,6 +409,21 @@ async def test_option_flow(hass):
         CONF_WAKE_ON_START: True,
         CONF_POLLING_POLICY: ATTR_POLLING_POLICY_CONNECTED,
         CONF_ENABLE_TESLAMATE: True,
+        CONF_TESLAMATE_BATCH_WINDOW: DEFAULT_TESLAMATE_BATCH_WINDOW,
+        CONF_TESLAMATE_SUBSCRIBE_ALL: DEFAULT_TESLAMATE_SUBSCRIBE_ALL,
+        CONF_ENABLE_FLEET_TELEMETRY: DEFAULT_ENABLE_FLEET_TELEMETRY,
+        CONF_REQUEST_RATE: DEFAULT_REQUEST_RATE,
+        CONF_REQUEST_BURST: DEFAULT_REQUEST_BURST,
+        CONF_WAKE_COOLDOWN: DEFAULT_WAKE_COOLDOWN,
+        CONF_FLEET_MODE: DEFAULT_FLEET_MODE,
+        CONF_FLEET_CONCURRENCY: DEFAULT_FLEET_CONCURRENCY,
+        CONF_FLEET_REDUCED_ENTITIES: DEFAULT_FLEET_REDUCED_ENTITIES,
+        CONF_HTTP_POOL_SIZE: DEFAULT_HTTP_POOL_SIZE,
+        CONF_HTTP_KEEPALIVE_EXPIRY: DEFAULT_HTTP_KEEPALIVE_EXPIRY,
+        CONF_HTTP2: DEFAULT_HTTP2,
+        CONF_HTTP_CONNECT_TIMEOUT: DEFAULT_HTTP_CONNECT_TIMEOUT,
+        CONF_HTTP_READ_TIMEOUT: DEFAULT_HTTP_READ_TIMEOUT,
+        CONF_HTTP_COMMAND_TIMEOUT: DEFAULT_HTTP_COMMAND_TIMEOUT,
     }
 
 
@@ -401,6 +446,21 @@ async def test_option_flow_defaults(hass):
         CONF_WAKE_ON_START: DEFAULT_WAKE_ON_START,
         CONF_POLLING_POLICY: DEFAULT_POLLING_POLICY,
         CONF_ENABLE_TESLAMATE: DEFAULT_ENABLE_TESLAMATE,
+        CONF_TESLAMATE_BATCH_WINDOW: DEFAULT_TESLAMATE_BATCH_WINDOW,
+        CONF_TESLAMATE_SUBSCRIBE_ALL: DEFAULT_TESLAMATE_SUBSCRIBE_ALL,
+        CONF_ENABLE_FLEET_TELEMETRY: DEFAULT_ENABLE_FLEET_TELEMETRY,
+        CONF_REQUEST_RATE: DEFAULT_REQUEST_RATE,
+        CONF_REQUEST_BURST: DEFAULT_REQUEST_BURST,
+        CONF_WAKE_COOLDOWN: DEFAULT_WAKE_COOLDOWN,
+        CONF_FLEET_MODE: DEFAULT_FLEET_MODE,
+        CONF_FLEET_CONCURRENCY: DEFAULT_FLEET_CONCURRENCY,
+        CONF_FLEET_REDUCED_ENTITIES: DEFAULT_FLEET_REDUCED_ENTITIES,
+        CONF_HTTP_POOL_SIZE: DEFAULT_HTTP_POOL_SIZE,
+        CONF_HTTP_KEEPALIVE_EXPIRY: DEFAULT_HTTP_KEEPALIVE_EXPIRY,
+        CONF_HTTP2: DEFAULT_HTTP2,
+        CONF_HTTP_CONNECT_TIMEOUT: DEFAULT_HTTP_CONNECT_TIMEOUT,
+        CONF_HTTP_READ_TIMEOUT: DEFAULT_HTTP_READ_TIMEOUT,
+        CONF_HTTP_COMMAND_TIMEOUT: DEFAULT_HTTP_COMMAND_TIMEOUT,
     }
 
 
@@ -423,4 +483,19 @@ async def test_option_flow_input_floor(hass):
         CONF_WAKE_ON_START: DEFAULT_WAKE_ON_START,
         CONF_POLLING_POLICY: DEFAULT_POLLING_POLICY,
         CONF_ENABLE_TESLAMATE: DEFAULT_ENABLE_TESLAMATE,
+        CONF_TESLAMATE_BATCH_WINDOW: DEFAULT_TESLAMATE_BATCH_WINDOW,
+        CONF_TESLAMATE_SUBSCRIBE_ALL: DEFAULT_TESLAMATE_SUBSCRIBE_ALL,
+        CONF_ENABLE_FLEET_TELEMETRY: DEFAULT_ENABLE_FLEET_TELEMETRY,
+        CONF_REQUEST_RATE: DEFAULT_REQUEST_RATE,
+        CONF_REQUEST_BURST: DEFAULT_REQUEST_BURST,
+        CONF_WAKE_COOLDOWN: DEFAULT_WAKE_COOLDOWN,
+        CONF_FLEET_MODE: DEFAULT_FLEET_MODE,
+        CONF_FLEET_CONCURRENCY: DEFAULT_FLEET_CONCURRENCY,
+        CONF_FLEET_REDUCED_ENTITIES: DEFAULT_FLEET_REDUCED_ENTITIES,
+        CONF_HTTP_POOL_SIZE: DEFAULT_HTTP_POOL_SIZE,
+        CONF_HTTP_KEEPALIVE_EXPIRY: DEFAULT_HTTP_KEEPALIVE_EXPIRY,
+        CONF_HTTP2: DEFAULT_HTTP2,
+        CONF_HTTP_CONNECT_TIMEOUT: DEFAULT_HTTP_CONNECT_TIMEOUT,
+        CONF_HTTP_READ_TIMEOUT: DEFAULT_HTTP_READ_TIMEOUT,
+        CONF_HTTP_COMMAND_TIMEOUT: DEFAULT_HTTP_COMMAND_TIMEOUT,
     }
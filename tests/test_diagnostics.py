@@ -0,0 +1,63 @@
+"""Tests for the Tesla diagnostics."""
+
+from homeassistant.components.diagnostics import REDACTED
+from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
+from homeassistant.const import CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from custom_components.tesla_custom.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+from .common import setup_platform
+from .const import TEST_ACCESS_TOKEN, TEST_TOKEN, TEST_USERNAME
+
+
+async def test_config_entry_diagnostics(hass: HomeAssistant) -> None:
+    """Tests the diagnostics are redacted and cover every coordinator."""
+    mock_entry, _ = await setup_platform(hass, SENSOR_DOMAIN)
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, mock_entry)
+
+    dumped = str(diagnostics)
+    for secret in (TEST_ACCESS_TOKEN, TEST_TOKEN, TEST_USERNAME):
+        assert secret not in dumped
+
+    account = diagnostics["account"]
+    assert account["update_interval"] is not None
+    assert account["debounce_scheduled"] is False
+    assert account["metrics"]["update_latency"]["samples"] >= 1
+
+    (car,) = diagnostics["cars"]
+    assert car["vin"] == REDACTED
+    assert car["update_interval"] is None
+    assert car["assumed_state"] is False
+    assert car["commands"]["depth"] == 0
+    assert len(diagnostics["energysites"]) == 2
+    assert diagnostics["fleet"] is None
+
+    assert diagnostics["teslamate"] == {
+        "enabled": False,
+        "subscribed_topics": 0,
+        "received": 0,
+        "dropped": 0,
+        "queue_depth": 0,
+        "batches": 0,
+        "messages_per_batch": None,
+        "max_batch_size": 0,
+        "car_map": [],
+    }
+    assert diagnostics["telemetry"]["enabled"] is False
+    assert diagnostics["payloads"]["total_bytes"] > 0
+
+
+async def test_unloaded_config_entry_diagnostics(hass: HomeAssistant) -> None:
+    """Tests an entry that is not loaded only reports its configuration."""
+    mock_entry, _ = await setup_platform(hass, SENSOR_DOMAIN)
+    assert await hass.config_entries.async_unload(mock_entry.entry_id)
+    await hass.async_block_till_done()
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, mock_entry)
+
+    assert list(diagnostics) == ["entry"]
+    assert diagnostics["entry"]["data"][CONF_USERNAME] == REDACTED
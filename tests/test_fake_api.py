@@ -0,0 +1,124 @@
+"""End to end tests for Tesla against the fake Tesla API."""
+
+from unittest.mock import patch
+
+from homeassistant.components.button import DOMAIN as BUTTON_DOMAIN
+from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    CONF_ACCESS_TOKEN,
+    CONF_CLIENT_ID,
+    CONF_DOMAIN,
+    CONF_TOKEN,
+    CONF_USERNAME,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_httpx import HTTPXMock
+from teslajsonpy.const import AUTH_DOMAIN
+
+from custom_components.tesla_custom.const import (
+    CONF_API_PROXY_URL,
+    CONF_EXPIRATION,
+    DOMAIN,
+)
+
+from .const import (
+    TEST_ACCESS_TOKEN,
+    TEST_CLIENT_ID,
+    TEST_TOKEN,
+    TEST_USERNAME,
+    TEST_VALID_EXPIRATION,
+)
+from .fake_api import FAKE_API_PATTERN, FAKE_API_URL, FakeTeslaAPI, fake_vin
+from .mock_data import car as car_mock_data
+
+
+async def setup_fake_api(
+    hass: HomeAssistant, httpx_mock: HTTPXMock, fake: FakeTeslaAPI, platform: str
+) -> MockConfigEntry:
+    """Set up the Tesla platform with the real controller talking to fake."""
+    httpx_mock.add_callback(fake, url=FAKE_API_PATTERN, is_reusable=True)
+    mock_entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=TEST_USERNAME,
+        data={
+            CONF_USERNAME: TEST_USERNAME,
+            CONF_ACCESS_TOKEN: TEST_ACCESS_TOKEN,
+            CONF_TOKEN: TEST_TOKEN,
+            CONF_EXPIRATION: TEST_VALID_EXPIRATION,
+            CONF_DOMAIN: AUTH_DOMAIN,
+            CONF_CLIENT_ID: TEST_CLIENT_ID,
+            CONF_API_PROXY_URL: FAKE_API_URL,
+        },
+        options=None,
+    )
+    mock_entry.add_to_hass(hass)
+
+    with patch("custom_components.tesla_custom.PLATFORMS", [platform]):
+        assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+    return mock_entry
+
+
+async def test_polls_fake_api(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
+    """Tests setup and a car update read the fleet from the API."""
+    fake = FakeTeslaAPI(vehicles=2, energysites=1)
+    mock_entry = await setup_fake_api(hass, httpx_mock, fake, SENSOR_DOMAIN)
+
+    assert fake.calls["products"] == 1
+    assert fake.calls["vehicle_data"] == 2
+    assert fake.calls["site_info"] >= 1
+    level = car_mock_data.VEHICLE_DATA["charge_state"]["usable_battery_level"]
+    assert float(hass.states.get("sensor.model_s_1_battery").state) == level
+
+    vin = fake_vin(1)
+    fake.vehicle_data[vin]["charge_state"]["usable_battery_level"] = 42
+    coordinators = hass.data[DOMAIN][mock_entry.entry_id]["coordinators"]
+    await coordinators[vin].async_update_car()
+    await hass.async_block_till_done()
+
+    assert fake.calls["vehicle_data"] == 3
+    assert float(hass.states.get("sensor.model_s_1_battery").state) == 42
+    assert float(hass.states.get("sensor.model_s_0_battery").state) == level
+
+
+async def test_command_wakes_sleeping_car(
+    hass: HomeAssistant, httpx_mock: HTTPXMock
+) -> None:
+    """Tests a command to a sleeping car wakes it once, then runs."""
+    fake = FakeTeslaAPI()
+    vin = fake_vin(0)
+    fake.set_asleep(vin)
+    await setup_fake_api(hass, httpx_mock, fake, BUTTON_DOMAIN)
+    assert fake.calls["wake_up"] == 0
+
+    await hass.services.async_call(
+        BUTTON_DOMAIN,
+        "press",
+        {ATTR_ENTITY_ID: "button.model_s_0_horn"},
+        blocking=True,
+    )
+
+    assert fake.calls["wake_up"] == 1
+    assert fake.commands == [(vin, "honk_horn", {})]
+
+
+async def test_rate_limit_backs_off(hass: HomeAssistant, httpx_mock: HTTPXMock) -> None:
+    """Tests a 429 from the API pauses polling for its Retry-After."""
+    fake = FakeTeslaAPI(vehicles=1, energysites=1)
+    mock_entry = await setup_fake_api(hass, httpx_mock, fake, SENSOR_DOMAIN)
+    entry_data = hass.data[DOMAIN][mock_entry.entry_id]
+    account_coordinator = entry_data["coordinators"]["update_vehicles"]
+
+    fake.fail_next(429, endpoint="live_status", retry_after=120)
+    await account_coordinator.async_refresh()
+    assert entry_data["governor"].backoff_remaining >= 119
+
+    calls = fake.calls.total()
+    await account_coordinator.async_refresh()
+
+    assert not account_coordinator.last_update_success
+    assert account_coordinator.update_interval.total_seconds() >= 119
+    assert fake.calls.total() == calls
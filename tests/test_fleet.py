@@ -0,0 +1,150 @@
+"""Tests for the Tesla fleet mode poller."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from teslajsonpy.exceptions import TeslaException
+
+from custom_components.tesla_custom.fleet import TeslaFleetPoller
+
+pytestmark = pytest.mark.asyncio
+
+SCAN_INTERVAL = 660
+
+
+def _fleet(vins: list[str], concurrency: int = 4) -> TeslaFleetPoller:
+    """Return a poller for online, parked cars whose data was just fetched."""
+    controller = MagicMock()
+    controller.update = AsyncMock(return_value=False)
+    controller.get_vehicle_data = AsyncMock(side_effect=lambda vin: {"vin": vin})
+    controller.get_updates.return_value = True
+    online = dict.fromkeys(vins, True)
+    controller.is_car_online.side_effect = lambda vin: online[vin]
+    now = time.time()
+    last_update = dict.fromkeys(vins, now)
+    controller.get_last_update_time.return_value = last_update
+    controller.set_last_update_time.side_effect = lambda vin, timestamp: (
+        last_update.__setitem__(vin, timestamp)
+    )
+    controller._calculate_next_interval.return_value = SCAN_INTERVAL
+    controller._Controller__lock = {vin: asyncio.Lock() for vin in vins}
+    controller.online = online
+    controller.last_update = last_update
+    cars = {
+        vin: MagicMock(
+            state="online", in_service=False, is_climate_on=False, _vehicle_data={}
+        )
+        for vin in vins
+    }
+    return TeslaFleetPoller(controller, cars, concurrency)
+
+
+def _fetched(fleet: TeslaFleetPoller) -> list[str]:
+    """Return the VINs fetched since the last call."""
+    vins = [call.args[0] for call in fleet.controller.get_vehicle_data.call_args_list]
+    fleet.controller.get_vehicle_data.reset_mock()
+    return sorted(vins)
+
+
+async def test_only_due_cars_are_fetched() -> None:
+    """Cars are fetched when their state changed or their data is stale."""
+    fleet = _fleet(["a", "b", "c"])
+    controller = fleet.controller
+    controller.online["c"] = False
+    fleet.cars["c"].state = "asleep"
+
+    assert await fleet.async_update(set(fleet.cars), {1})
+    controller.update.assert_awaited_once_with(
+        vins=set(), energy_site_ids={1}, update_vehicles=True
+    )
+    # Every online car is new to the poller.
+    assert _fetched(fleet) == ["a", "b"]
+    assert fleet.cars["a"]._vehicle_data == {"vin": "a"}
+    controller.set_last_update_time.assert_called()
+
+    controller.last_update["b"] -= SCAN_INTERVAL
+    await fleet.async_update(set(fleet.cars), {1})
+    assert _fetched(fleet) == ["b"]
+
+    controller.online["c"] = True
+    fleet.cars["c"].state = "online"
+    await fleet.async_update({"b", "c"}, {1})
+    assert _fetched(fleet) == ["c"]
+    assert fleet.last_due == 1
+    assert fleet.fetch_count == 4
+
+
+async def test_fetches_are_bounded() -> None:
+    """At most concurrency cars are fetched at the same time."""
+    fleet = _fleet([str(index) for index in range(5)], concurrency=2)
+    in_flight = max_in_flight = 0
+
+    async def get_vehicle_data(vin):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return {"vin": vin}
+
+    fleet.controller.get_vehicle_data.side_effect = get_vehicle_data
+
+    await fleet.async_update(set(fleet.cars), set())
+
+    assert max_in_flight == 2
+    assert fleet.fetch_count == 5
+
+
+async def test_failed_fetch_does_not_stop_others() -> None:
+    """A car failing to fetch is counted, the others are still updated."""
+    fleet = _fleet(["a", "b"])
+
+    async def get_vehicle_data(vin):
+        if vin == "a":
+            raise TeslaException(500)
+        return {"vin": vin}
+
+    fleet.controller.get_vehicle_data.side_effect = get_vehicle_data
+
+    assert await fleet.async_update(set(fleet.cars), set())
+
+    assert fleet.failed_count == 1
+    assert fleet.cars["a"]._vehicle_data == {}
+    assert fleet.cars["b"]._vehicle_data == {"vin": "b"}
+
+
+async def test_parked_car_is_not_fetched_within_scan_interval() -> None:
+    """An online, parked car waits for the controller's polling interval."""
+    fleet = _fleet(["a"])
+    controller = fleet.controller
+    controller.last_update.clear()
+
+    await fleet.async_update({"a"}, set())
+    assert _fetched(fleet) == ["a"]
+
+    # Later ticks of the account coordinator do not fetch it again.
+    controller.last_update["a"] -= SCAN_INTERVAL - 60
+    await fleet.async_update({"a"}, set())
+    assert _fetched(fleet) == []
+    controller._calculate_next_interval.assert_called_with("a")
+
+    controller.last_update["a"] -= 60
+    await fleet.async_update({"a"}, set())
+    assert _fetched(fleet) == ["a"]
+
+
+async def test_fetch_records_park_time() -> None:
+    """A car with climate on that parks gets its park time reset."""
+    fleet = _fleet(["a"])
+    fleet.cars["a"].is_climate_on = True
+    fleet.controller.get_vehicle_data.side_effect = lambda vin: {
+        "drive_state": {"shift_state": None, "timestamp": 1700000000000}
+    }
+
+    await fleet.async_update({"a"}, set())
+
+    fleet.controller.set_last_park_time.assert_called_once_with(
+        vin="a", timestamp=1700000000, shift_state=None
+    )
@@ -0,0 +1,93 @@
+"""Tests for the Tesla API request governor."""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+from teslajsonpy.exceptions import TeslaException
+
+from custom_components.tesla_custom.const import REQUEST_BACKOFF_BASE
+from custom_components.tesla_custom.governor import (
+    TeslaRequestGovernor,
+    endpoint_name,
+    parse_retry_after,
+)
+
+pytestmark = pytest.mark.asyncio
+
+REQUEST = httpx.Request("GET", "https://owner-api.teslamotors.com/api/1/products")
+
+
+def test_parse_retry_after() -> None:
+    """Retry-After is read as seconds or as an HTTP date."""
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after("-5") == 0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+
+async def test_requests_wait_for_tokens() -> None:
+    """Requests beyond the burst wait until a token has been earned."""
+    governor = TeslaRequestGovernor(requests_per_minute=60, burst=2)
+
+    with patch("custom_components.tesla_custom.governor.asyncio.sleep") as mock_sleep:
+        await governor.async_on_request(REQUEST)
+        await governor.async_on_request(REQUEST)
+        mock_sleep.assert_not_called()
+        assert governor.remaining == 0
+
+        await governor.async_on_request(REQUEST)
+        mock_sleep.assert_awaited_once()
+        assert mock_sleep.await_args.args[0] == pytest.approx(1, abs=0.1)
+
+
+async def test_too_many_requests_backs_off() -> None:
+    """A 429 pauses all requests, honouring Retry-After."""
+    governor = TeslaRequestGovernor(requests_per_minute=60, burst=10)
+
+    await governor.async_on_response(
+        httpx.Response(429, headers={"Retry-After": "100"}, request=REQUEST)
+    )
+    assert 100 <= governor.backoff_remaining <= 125
+
+    with pytest.raises(TeslaException) as err:
+        await governor.async_on_request(REQUEST)
+    assert err.value.message == "TOO_MANY_REQUESTS"
+
+
+async def test_backoff_grows_without_retry_after() -> None:
+    """Repeated 429s without Retry-After back off exponentially."""
+    governor = TeslaRequestGovernor(requests_per_minute=60, burst=10)
+
+    with patch(
+        "custom_components.tesla_custom.governor.random.uniform", return_value=0
+    ):
+        await governor.async_on_response(httpx.Response(429, request=REQUEST))
+        first = governor.backoff_remaining
+        await governor.async_on_response(httpx.Response(429, request=REQUEST))
+        second = governor.backoff_remaining
+
+    assert first == pytest.approx(REQUEST_BACKOFF_BASE, abs=1)
+    assert second == pytest.approx(REQUEST_BACKOFF_BASE * 2, abs=1)
+
+    await governor.async_on_response(httpx.Response(200, request=REQUEST))
+    assert governor.rate_limited_count == 0
+
+
+async def test_endpoint_stats() -> None:
+    """Requests are counted per endpoint with their ids left out."""
+    governor = TeslaRequestGovernor(requests_per_minute=60, burst=10)
+    for vehicle_id in ("12345678901234567", "76543210987654321"):
+        request = httpx.Request(
+            "GET",
+            f"https://owner-api.teslamotors.com/api/1/vehicles/{vehicle_id}/vehicle_data",
+        )
+        await governor.async_on_request(request)
+        await governor.async_on_response(httpx.Response(200, request=request))
+
+    assert endpoint_name(REQUEST) == "GET /api/1/products"
+    stats = governor.endpoints["GET /api/1/vehicles/{id}/vehicle_data"]
+    assert stats.requests == 2
+    assert stats.errors == 0
+    assert stats.as_dict()["latency"]["samples"] == 2
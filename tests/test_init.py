@@ -1,22 +1,36 @@
 """Tests for the Tesla integration setup and device removal."""
 
 import asyncio
-from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock
+from copy import deepcopy
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr
 import pytest
 from teslajsonpy.car import TeslaCar
 from teslajsonpy.energy import SolarPowerwallSite, SolarSite
+from teslajsonpy.exceptions import TeslaException
 
 from custom_components.tesla_custom import (
     TeslaDataUpdateCoordinator,
+    _platforms_for_devices,
     async_remove_config_entry_device,
 )
 from custom_components.tesla_custom.base import device_identifier
-from custom_components.tesla_custom.const import DOMAIN
+from custom_components.tesla_custom.climate import TeslaCarClimate
+from custom_components.tesla_custom.const import (
+    DOMAIN,
+    FLEET_PLATFORMS,
+    PLATFORMS,
+    PUSH_DATA_TIMEOUT,
+    SCAN_INTERVAL_ACTIVE,
+    SCAN_INTERVAL_ASLEEP,
+    SCAN_INTERVAL_ENERGYSITE_IDLE,
+    SCAN_INTERVAL_ONLINE,
+)
+from custom_components.tesla_custom.sensor import TeslaCarBattery, TeslaCarOdometer
 
 from .common import setup_platform
 from .const import TEST_USERNAME
@@ -179,7 +193,7 @@ async def test_remove_orphan_with_only_foreign_domain() -> None:
     assert await async_remove_config_entry_device(hass, _config_entry(), device) is True
 
 
-@pytest.mark.parametrize("platform", ["binary_sensor"])
+@pytest.mark.parametrize("platform", ["binary_sensor", "sensor"])
 async def test_remove_with_real_loaded_entry(
     hass: HomeAssistant, platform: str
 ) -> None:
@@ -253,6 +267,7 @@ async def test_update_vehicles_key_error_reloads_entry(hass: HomeAssistant) -> N
         vins=set(), energy_site_ids=set(), update_vehicles=True
     )
     hass.config_entries.async_reload.assert_awaited_once_with("test_entry")
+    assert coordinator.metrics.reloads == 1
 
 
 async def test_vehicle_key_error_is_not_swallowed(hass: HomeAssistant) -> None:
@@ -272,3 +287,503 @@ async def test_vehicle_key_error_is_not_swallowed(hass: HomeAssistant) -> None:
         await coordinator._async_update_data()
 
     hass.config_entries.async_reload.assert_not_awaited()
+
+
+async def test_account_coordinator_fans_out_single_update(
+    hass: HomeAssistant,
+) -> None:
+    """One account-level refresh feeds every registered device coordinator."""
+    config_entry = _config_entry()
+    controller = _controller_with_update_error(None)
+    controller.update = AsyncMock(return_value=True)
+    account = TeslaDataUpdateCoordinator(
+        hass,
+        config_entry=config_entry,
+        controller=controller,
+        reload_lock=asyncio.Lock(),
+        update_vehicles=True,
+    )
+    car_coordinator = TeslaDataUpdateCoordinator(
+        hass,
+        config_entry=config_entry,
+        controller=controller,
+        reload_lock=asyncio.Lock(),
+        vin=car_mock_data.VIN,
+        account_coordinator=account,
+    )
+    site_coordinator = TeslaDataUpdateCoordinator(
+        hass,
+        config_entry=config_entry,
+        controller=controller,
+        reload_lock=asyncio.Lock(),
+        energy_site_id=SOLAR_SITE_ID,
+        account_coordinator=account,
+    )
+    car_listener = MagicMock()
+    site_listener = MagicMock()
+    car_coordinator.async_add_listener(car_listener)
+    site_coordinator.async_add_listener(site_listener)
+
+    assert car_coordinator.update_interval is None
+    assert site_coordinator.update_interval is None
+
+    await account.async_refresh()
+
+    controller.update.assert_awaited_once_with(
+        vins={car_mock_data.VIN},
+        energy_site_ids={SOLAR_SITE_ID},
+        update_vehicles=True,
+    )
+    car_listener.assert_called_once()
+    site_listener.assert_called_once()
+    assert car_coordinator.last_update_success
+    assert car_coordinator.last_update_time == (
+        controller.get_last_update_time.return_value
+    )
+    assert account.metrics.api_calls == 1
+    assert len(account.metrics.update_latency) == 1
+    assert len(car_coordinator.metrics.fanout_latency) == 1
+
+    # The controller did not fetch the car again, its cache was used.
+    await account.async_refresh()
+    assert car_coordinator.metrics.cache_hits == 1
+
+
+async def test_car_coordinator_refresh_counts_fetch_once(
+    hass: HomeAssistant,
+) -> None:
+    """A car coordinator refreshing itself counts each fetch once."""
+    config_entry = _config_entry()
+    controller = _controller_with_update_error(None)
+    controller.update = AsyncMock(return_value=True)
+    account = TeslaDataUpdateCoordinator(
+        hass,
+        config_entry=config_entry,
+        controller=controller,
+        reload_lock=asyncio.Lock(),
+        update_vehicles=True,
+    )
+    car_coordinator = TeslaDataUpdateCoordinator(
+        hass,
+        config_entry=config_entry,
+        controller=controller,
+        reload_lock=asyncio.Lock(),
+        vin=car_mock_data.VIN,
+        account_coordinator=account,
+    )
+
+    await car_coordinator.async_refresh()
+    controller.get_last_update_time.return_value += 10
+    await car_coordinator.async_refresh()
+    assert car_coordinator.metrics.api_calls == 1
+    assert car_coordinator.metrics.cache_hits == 0
+
+    await car_coordinator.async_refresh()
+    assert car_coordinator.metrics.api_calls == 1
+    assert car_coordinator.metrics.cache_hits == 1
+    assert account.metrics.api_calls == 0
+
+
+async def test_account_update_interval_follows_vehicle_state(
+    hass: HomeAssistant,
+) -> None:
+    """The account coordinator ticks fast while driving and not while pushed."""
+    config_entry = _config_entry()
+    controller = _controller_with_update_error(None)
+    controller.update = AsyncMock(return_value=True)
+    car = TeslaCar(
+        car_mock_data.VEHICLE, MagicMock(), deepcopy(car_mock_data.VEHICLE_DATA)
+    )
+    account = TeslaDataUpdateCoordinator(
+        hass,
+        config_entry=config_entry,
+        controller=controller,
+        reload_lock=asyncio.Lock(),
+        update_vehicles=True,
+    )
+    car_coordinator = TeslaDataUpdateCoordinator(
+        hass,
+        config_entry=config_entry,
+        controller=controller,
+        reload_lock=asyncio.Lock(),
+        vin=car_mock_data.VIN,
+        car=car,
+        account_coordinator=account,
+    )
+
+    car._vehicle_data["drive_state"]["shift_state"] = "D"
+    await account.async_refresh()
+    assert account.update_interval == timedelta(seconds=SCAN_INTERVAL_ACTIVE)
+
+    car._vehicle_data["drive_state"]["shift_state"] = None
+    car._vehicle_data["charge_state"]["charging_state"] = "Complete"
+    await account.async_refresh()
+    assert account.update_interval == timedelta(seconds=SCAN_INTERVAL_ONLINE)
+
+    controller.is_car_online.return_value = False
+    await account.async_refresh()
+    assert account.update_interval == timedelta(seconds=SCAN_INTERVAL_ASLEEP)
+
+    car_coordinator.last_push_time = hass.loop.time()
+    await account.async_refresh()
+    assert account.update_interval == timedelta(seconds=PUSH_DATA_TIMEOUT)
+
+
+async def test_idle_site_and_pushing_car_are_not_polled_every_tick(
+    hass: HomeAssistant,
+) -> None:
+    """Idle energy sites tick slowly and cars pushing data are not polled."""
+    config_entry = _config_entry()
+    controller = _controller_with_update_error(None)
+    controller.update = AsyncMock(return_value=True)
+    controller.is_car_online.return_value = False
+    site = SolarSite(
+        MagicMock(),
+        energysite_mock_data.ENERGYSITE_SOLAR,
+        energysite_mock_data.SITE_CONFIG_SOLAR,
+        {**energysite_mock_data.SITE_DATA, "solar_power": 0},
+    )
+    account = TeslaDataUpdateCoordinator(
+        hass,
+        config_entry=config_entry,
+        controller=controller,
+        reload_lock=asyncio.Lock(),
+        update_vehicles=True,
+    )
+    car_coordinator = TeslaDataUpdateCoordinator(
+        hass,
+        config_entry=config_entry,
+        controller=controller,
+        reload_lock=asyncio.Lock(),
+        vin=car_mock_data.VIN,
+        account_coordinator=account,
+    )
+    site_coordinator = TeslaDataUpdateCoordinator(
+        hass,
+        config_entry=config_entry,
+        controller=controller,
+        reload_lock=asyncio.Lock(),
+        energy_site_id=SOLAR_SITE_ID,
+        energysite=site,
+        account_coordinator=account,
+    )
+
+    await account.async_refresh()
+    controller.update.assert_awaited_with(
+        vins={car_mock_data.VIN},
+        energy_site_ids={SOLAR_SITE_ID},
+        update_vehicles=True,
+    )
+    assert site_coordinator._calculate_update_interval() == timedelta(
+        seconds=SCAN_INTERVAL_ENERGYSITE_IDLE
+    )
+    # The idle site does not hold the account at fast ticks.
+    assert account.update_interval == timedelta(seconds=SCAN_INTERVAL_ASLEEP)
+
+    # The site is only polled again once its interval passed.
+    await account.async_refresh()
+    controller.update.assert_awaited_with(
+        vins={car_mock_data.VIN}, energy_site_ids=set(), update_vehicles=True
+    )
+    site_coordinator.last_site_poll_time -= SCAN_INTERVAL_ENERGYSITE_IDLE
+    await account.async_refresh()
+    controller.update.assert_awaited_with(
+        vins={car_mock_data.VIN},
+        energy_site_ids={SOLAR_SITE_ID},
+        update_vehicles=True,
+    )
+
+    # A car whose data TeslaMate pushes is left out of the poll.
+    car_coordinator.last_push_time = hass.loop.time()
+    await account.async_refresh()
+    controller.update.assert_awaited_with(
+        vins=set(), energy_site_ids=set(), update_vehicles=True
+    )
+
+
+async def test_restored_data_is_kept_until_car_data_is_fetched(
+    hass: HomeAssistant,
+) -> None:
+    """Restored car data stays assumed until the car data was fetched again."""
+    config_entry = _config_entry()
+    controller = _controller_with_update_error(None)
+    controller.update = AsyncMock(return_value=True)
+    controller.get_last_update_time.return_value = 0
+    account = TeslaDataUpdateCoordinator(
+        hass,
+        config_entry=config_entry,
+        controller=controller,
+        reload_lock=asyncio.Lock(),
+        update_vehicles=True,
+    )
+    car_coordinator = TeslaDataUpdateCoordinator(
+        hass,
+        config_entry=config_entry,
+        controller=controller,
+        reload_lock=asyncio.Lock(),
+        vin=car_mock_data.VIN,
+        account_coordinator=account,
+    )
+    car_coordinator.async_set_restored()
+
+    # The car woke up but its data was not fetched yet.
+    await account.async_refresh()
+    assert car_coordinator.restored
+    assert car_coordinator.assumed_state
+
+    controller.get_last_update_time.return_value = datetime.now().timestamp()
+    await account.async_refresh()
+    assert not car_coordinator.restored
+    assert not car_coordinator.assumed_state
+
+
+async def test_restored_site_data_is_kept_until_site_data_is_fetched(
+    hass: HomeAssistant,
+) -> None:
+    """Restored site data stays assumed until the site data was fetched again."""
+    config_entry = _config_entry()
+    controller = _controller_with_update_error(None)
+    controller.update = AsyncMock(return_value=True)
+    site = SolarSite(
+        MagicMock(),
+        energysite_mock_data.ENERGYSITE_SOLAR,
+        energysite_mock_data.SITE_CONFIG_SOLAR,
+        deepcopy(energysite_mock_data.SITE_DATA),
+    )
+    account = TeslaDataUpdateCoordinator(
+        hass,
+        config_entry=config_entry,
+        controller=controller,
+        reload_lock=asyncio.Lock(),
+        update_vehicles=True,
+    )
+    site_coordinator = TeslaDataUpdateCoordinator(
+        hass,
+        config_entry=config_entry,
+        controller=controller,
+        reload_lock=asyncio.Lock(),
+        energy_site_id=SOLAR_SITE_ID,
+        energysite=site,
+        account_coordinator=account,
+    )
+    site_coordinator.async_set_restored()
+
+    # The site fetch failed, the restored data is still shown.
+    await account.async_refresh()
+    assert site_coordinator.restored
+    assert site_coordinator.assumed_state
+
+    site._site_data["timestamp"] = "2022-07-28T17:12:27Z"
+    await account.async_refresh()
+    assert not site_coordinator.restored
+    assert not site_coordinator.assumed_state
+
+
+async def test_car_coordinator_tracks_changed_paths(hass: HomeAssistant) -> None:
+    """Each listener update records which car data paths changed."""
+    config_entry = _config_entry()
+    controller = _controller_with_update_error(None)
+    controller.update = AsyncMock(return_value=True)
+    car = TeslaCar(
+        deepcopy(car_mock_data.VEHICLE),
+        MagicMock(),
+        deepcopy(car_mock_data.VEHICLE_DATA),
+    )
+    account = TeslaDataUpdateCoordinator(
+        hass,
+        config_entry=config_entry,
+        controller=controller,
+        reload_lock=asyncio.Lock(),
+        update_vehicles=True,
+    )
+    car_coordinator = TeslaDataUpdateCoordinator(
+        hass,
+        config_entry=config_entry,
+        controller=controller,
+        reload_lock=asyncio.Lock(),
+        vin=car_mock_data.VIN,
+        car=car,
+        account_coordinator=account,
+    )
+
+    await account.async_refresh()
+    assert car_coordinator.changed_paths is None
+
+    await account.async_refresh()
+    assert car_coordinator.changed_paths == set()
+
+    car._vehicle_data["charge_state"]["usable_battery_level"] = 42
+    car._vehicle_data["drive_state"].pop("shift_state")
+    car._car["state"] = "asleep"
+    await account.async_refresh()
+    assert car_coordinator.changed_paths == {
+        ("charge_state", "usable_battery_level"),
+        ("drive_state", "shift_state"),
+        (None, "state"),
+    }
+
+    battery = TeslaCarBattery(car, car_coordinator)
+    assert battery._data_changed(car_coordinator.changed_paths)
+    odometer = TeslaCarOdometer(car, car_coordinator)
+    assert not odometer._data_changed(car_coordinator.changed_paths)
+    climate = TeslaCarClimate(car, car_coordinator)
+    assert not climate._data_changed(car_coordinator.changed_paths)
+    car._vehicle_data["climate_state"]["inside_temp"] = 30.5
+    await account.async_refresh()
+    assert climate._data_changed(car_coordinator.changed_paths)
+
+
+async def test_pushed_paths_only_update_dependent_listeners(
+    hass: HomeAssistant,
+) -> None:
+    """A pushed path only calls the listeners indexed under it."""
+    car = TeslaCar(
+        deepcopy(car_mock_data.VEHICLE),
+        MagicMock(),
+        deepcopy(car_mock_data.VEHICLE_DATA),
+    )
+    coordinator = TeslaDataUpdateCoordinator(
+        hass,
+        config_entry=_config_entry(),
+        controller=_controller_with_update_error(None),
+        reload_lock=asyncio.Lock(),
+        vin=car_mock_data.VIN,
+        car=car,
+    )
+    speed_listener = MagicMock()
+    drive_state_listener = MagicMock()
+    battery_listener = MagicMock()
+    coordinator.async_add_path_listener(
+        [("drive_state", "speed"), ("drive_state", "heading")], speed_listener
+    )
+    coordinator.async_add_path_listener([("drive_state", None)], drive_state_listener)
+    remove_battery_listener = coordinator.async_add_path_listener(
+        [("charge_state", "battery_level")], battery_listener
+    )
+
+    coordinator.async_update_path_listeners(
+        {("drive_state", "speed"), ("drive_state", "heading")}
+    )
+    speed_listener.assert_called_once()
+    drive_state_listener.assert_called_once()
+    battery_listener.assert_not_called()
+
+    remove_battery_listener()
+    coordinator.async_update_path_listeners({("charge_state", "battery_level")})
+    battery_listener.assert_not_called()
+    assert ("charge_state", "battery_level") not in coordinator._path_listeners
+
+
+async def test_setup_primes_with_single_refresh(hass: HomeAssistant) -> None:
+    """Setup refreshes the account once instead of once per entity."""
+    _, mock_controller = await setup_platform(hass, "sensor")
+
+    controller = mock_controller.return_value
+    controller.update.assert_awaited_once_with(
+        vins={car_mock_data.VIN},
+        energy_site_ids={SOLAR_SITE_ID, BATTERY_SITE_ID},
+        update_vehicles=True,
+    )
+    assert hass.states.get("sensor.my_model_s_battery").state == "77"
+
+
+async def test_discovery_runs_concurrently_and_retries_on_rate_limit(
+    hass: HomeAssistant,
+) -> None:
+    """A rate limited discovery call cancels the other and retries setup."""
+    car_discovery_cancelled = asyncio.Event()
+
+    async def _slow_car_discovery(**kwargs):
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            car_discovery_cancelled.set()
+            raise
+
+    def _rate_limit_energy_discovery(mock_controller) -> None:
+        controller = mock_controller.return_value
+        controller.generate_car_objects.side_effect = _slow_car_discovery
+        controller.generate_energysite_objects.side_effect = TeslaException(429)
+
+    mock_entry, _ = await setup_platform(
+        hass, "sensor", setup_controller=_rate_limit_energy_discovery
+    )
+
+    assert mock_entry.state is ConfigEntryState.SETUP_RETRY
+    assert car_discovery_cancelled.is_set()
+
+
+def test_platforms_follow_discovered_devices() -> None:
+    """Only platforms with entities for the discovered devices are forwarded."""
+    car = _make_car()
+    solar = _make_solar_site()
+    battery = _make_battery_site()
+
+    assert _platforms_for_devices({}, {}) == []
+    assert _platforms_for_devices({}, {SOLAR_SITE_ID: solar}) == ["sensor"]
+    assert _platforms_for_devices({}, {BATTERY_SITE_ID: battery}) == [
+        "sensor",
+        "binary_sensor",
+        "select",
+        "number",
+    ]
+    assert _platforms_for_devices({car_mock_data.VIN: car}, {}) == PLATFORMS
+    assert (
+        _platforms_for_devices({car_mock_data.VIN: car}, {}, reduced=True)
+        == FLEET_PLATFORMS
+    )
+
+
+async def test_concurrent_car_updates_share_one_fetch(hass: HomeAssistant) -> None:
+    """Forced car updates requested together run a single controller update."""
+    controller = _controller_with_update_error(None)
+    controller.update = AsyncMock(return_value=True)
+    car = _make_car()
+    coordinator = TeslaDataUpdateCoordinator(
+        hass,
+        config_entry=_config_entry(),
+        controller=controller,
+        reload_lock=asyncio.Lock(),
+        vin=car_mock_data.VIN,
+        car=car,
+    )
+
+    def _car_updates():
+        return [call for call in controller.update.await_args_list if call.args]
+
+    with patch("custom_components.tesla_custom.REFRESH_COALESCE_DELAY", 0):
+        await asyncio.gather(
+            coordinator.async_update_car(force=True),
+            coordinator.async_update_car(force=False),
+            coordinator.async_update_car(wake_if_asleep=True, force=False),
+        )
+        assert len(_car_updates()) == 1
+        controller.update.assert_any_await(car.id, wake_if_asleep=False, force=True)
+
+        # A later call needs data fetched after it, so it does not reuse the
+        # finished update.
+        await coordinator.async_update_car()
+        assert len(_car_updates()) == 2
+
+
+async def test_car_update_wakes_through_wake_manager(hass: HomeAssistant) -> None:
+    """An asleep car is woken by its wake manager, not by the controller update."""
+    controller = _controller_with_update_error(None)
+    controller.update = AsyncMock(return_value=True)
+    car = _make_car()
+    car._controller.is_car_online.return_value = False
+    coordinator = TeslaDataUpdateCoordinator(
+        hass,
+        config_entry=_config_entry(),
+        controller=controller,
+        reload_lock=asyncio.Lock(),
+        vin=car_mock_data.VIN,
+        car=car,
+    )
+    coordinator.wake_manager.async_wake_up = AsyncMock(return_value=True)
+
+    with patch("custom_components.tesla_custom.REFRESH_COALESCE_DELAY", 0):
+        await coordinator.async_update_car(wake_if_asleep=True)
+
+    coordinator.wake_manager.async_wake_up.assert_awaited_once()
+    controller.update.assert_any_await(car.id, wake_if_asleep=False, force=True)
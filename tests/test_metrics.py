@@ -0,0 +1,50 @@
+"""Tests for the Tesla coordinator metrics."""
+
+from custom_components.tesla_custom.metrics import (
+    LatencyHistogram,
+    TeslaCoordinatorMetrics,
+)
+
+
+def test_histogram_percentiles() -> None:
+    """Percentiles are the nearest rank of the window."""
+    histogram = LatencyHistogram()
+    assert histogram.p50 is None
+    assert histogram.as_dict() == {"p50": None, "p95": None, "max": None, "samples": 0}
+
+    for milliseconds in range(100, 0, -1):
+        histogram.record(milliseconds / 1000)
+
+    assert histogram.p50 == 0.05
+    assert histogram.p95 == 0.095
+    assert histogram.max == 0.1
+    assert histogram.as_dict() == {
+        "p50": 50.0,
+        "p95": 95.0,
+        "max": 100.0,
+        "samples": 100,
+    }
+
+
+def test_histogram_keeps_latest_samples() -> None:
+    """Only the latest durations are kept."""
+    histogram = LatencyHistogram(size=2)
+    for seconds in (10, 1, 2):
+        histogram.record(seconds)
+
+    assert len(histogram) == 2
+    assert histogram.max == 2
+
+
+def test_histogram_times_failing_block() -> None:
+    """A block that raises is still timed."""
+    metrics = TeslaCoordinatorMetrics()
+
+    try:
+        with metrics.update_latency.time():
+            raise ValueError
+    except ValueError:
+        pass
+
+    assert len(metrics.update_latency) == 1
+    assert metrics.as_dict()["update_latency"]["samples"] == 1
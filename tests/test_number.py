@@ -8,6 +8,11 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 from teslajsonpy.const import BACKUP_RESERVE_MAX, BACKUP_RESERVE_MIN, CHARGE_CURRENT_MIN
 
+from custom_components.tesla_custom.const import (
+    CONF_FLEET_MODE,
+    CONF_FLEET_REDUCED_ENTITIES,
+)
+
 from .common import setup_platform
 from .mock_data import car as car_mock_data, energysite as energysite_mock_data
 
@@ -27,6 +32,20 @@ async def test_registry_entries(hass: HomeAssistant) -> None:
     assert entry.unique_id == "67890_backup_reserve"
 
 
+async def test_reduced_entities_with_powerwall(hass: HomeAssistant) -> None:
+    """Tests the fleet mode's reduced set leaves out car numbers, not sites'."""
+    await setup_platform(
+        hass,
+        NUMBER_DOMAIN,
+        options={CONF_FLEET_MODE: True, CONF_FLEET_REDUCED_ENTITIES: True},
+    )
+    entity_registry = er.async_get(hass)
+
+    assert entity_registry.async_get("number.my_model_s_charge_limit") is None
+    assert entity_registry.async_get("number.my_model_s_charging_amps") is None
+    assert entity_registry.async_get("number.battery_home_backup_reserve")
+
+
 async def test_charge_limit(hass: HomeAssistant) -> None:
     """Tests car charge limit is getting the correct value."""
     await setup_platform(hass, NUMBER_DOMAIN)
@@ -7,6 +7,11 @@ from homeassistant.const import ATTR_ENTITY_ID, SERVICE_SELECT_OPTION
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 
+from custom_components.tesla_custom.const import (
+    CONF_FLEET_MODE,
+    CONF_FLEET_REDUCED_ENTITIES,
+)
+
 from .common import setup_platform
 from .mock_data import car as car_mock_data
 
@@ -41,6 +46,19 @@ async def test_registry_entries(hass: HomeAssistant) -> None:
     assert entry.unique_id == f"{car_mock_data.VIN.lower()}_heated_steering_wheel"
 
 
+async def test_reduced_entities_with_powerwall(hass: HomeAssistant) -> None:
+    """Tests the fleet mode's reduced set leaves out car selects, not sites'."""
+    await setup_platform(
+        hass,
+        SELECT_DOMAIN,
+        options={CONF_FLEET_MODE: True, CONF_FLEET_REDUCED_ENTITIES: True},
+    )
+    entity_registry = er.async_get(hass)
+
+    assert entity_registry.async_get("select.my_model_s_heated_seat_left") is None
+    assert entity_registry.async_get("select.battery_home_operation_mode")
+
+
 async def test_skipped_entries(hass: HomeAssistant) -> None:
     """Tests devices are skipped in the entity registry."""
 
@@ -21,6 +21,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.util import dt
 from homeassistant.util.unit_conversion import (
     DistanceConverter,
@@ -30,11 +31,16 @@ from homeassistant.util.unit_conversion import (
 import pytest
 from pytest import MonkeyPatch
 
-pytestmark = pytest.mark.asyncio
+from custom_components.tesla_custom.const import (
+    DEFAULT_REQUEST_BURST,
+    DEFAULT_REQUEST_RATE,
+)
 
 from .common import setup_platform
 from .mock_data import car as car_mock_data, energysite as energysite_mock_data
 
+pytestmark = pytest.mark.asyncio
+
 ATTR_STATE_CLASS = "state_class"
 
 
@@ -676,3 +682,29 @@ async def test_distance_to_arrival(hass: HomeAssistant) -> None:
 
     assert state.attributes.get(ATTR_DEVICE_CLASS) == SensorDeviceClass.DISTANCE
     assert state.attributes.get(ATTR_STATE_CLASS) == SensorStateClass.MEASUREMENT
+
+
+async def test_api_request_budget(hass: HomeAssistant) -> None:
+    """Tests the account request budget sensor is getting the correct value."""
+    await setup_platform(hass, SENSOR_DOMAIN)
+
+    state = hass.states.get("sensor.test_username_api_request_budget")
+    assert state.state == str(DEFAULT_REQUEST_BURST)
+    assert state.attributes.get("requests_per_minute") == DEFAULT_REQUEST_RATE
+    assert state.attributes.get("backoff_remaining") == 0
+
+
+async def test_latency_sensors_disabled_by_default(hass: HomeAssistant) -> None:
+    """Tests the latency diagnostic sensors are registered disabled."""
+    await setup_platform(hass, SENSOR_DOMAIN)
+    entity_registry = er.async_get(hass)
+
+    for entity_id in (
+        "sensor.my_model_s_update_latency",
+        "sensor.my_model_s_fan_out_latency",
+        "sensor.test_username_update_latency",
+        "sensor.test_username_fan_out_latency",
+    ):
+        entry = entity_registry.async_get(entity_id)
+        assert entry.disabled
+        assert entry.entity_category == EntityCategory.DIAGNOSTIC
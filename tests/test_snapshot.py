@@ -0,0 +1,85 @@
+"""Tests for the last known state snapshot."""
+
+from copy import deepcopy
+from unittest.mock import MagicMock
+
+from homeassistant.core import HomeAssistant
+from teslajsonpy.car import TeslaCar
+from teslajsonpy.energy import SolarSite
+
+from custom_components.tesla_custom.const import (
+    SNAPSHOT_STORAGE_KEY,
+    SNAPSHOT_STORAGE_VERSION,
+)
+from custom_components.tesla_custom.snapshot import TeslaSnapshot
+
+from .mock_data import car as car_mock_data, energysite as energysite_mock_data
+
+ENTRY_ID = "test-entry"
+SOLAR_SITE_ID = 12345
+
+
+async def test_restore_fills_only_devices_without_data(
+    hass: HomeAssistant, hass_storage
+) -> None:
+    """Cars and sites discovered without data get their last known data."""
+    hass_storage[f"{SNAPSHOT_STORAGE_KEY}.{ENTRY_ID}"] = {
+        "version": SNAPSHOT_STORAGE_VERSION,
+        "key": f"{SNAPSHOT_STORAGE_KEY}.{ENTRY_ID}",
+        "data": {
+            "cars": {
+                car_mock_data.VIN: deepcopy(car_mock_data.VEHICLE_DATA),
+                "other-vin": {"charge_state": {"battery_level": 1}},
+            },
+            "energysites": {
+                str(SOLAR_SITE_ID): {"site_data": energysite_mock_data.SITE_DATA}
+            },
+        },
+    }
+    asleep_car = TeslaCar(deepcopy(car_mock_data.VEHICLE), MagicMock(), {})
+    online_car = TeslaCar(
+        {**car_mock_data.VEHICLE, "vin": "other-vin"},
+        MagicMock(),
+        {"charge_state": {"battery_level": 50}},
+    )
+    solar_site = SolarSite(
+        MagicMock(),
+        energysite_mock_data.ENERGYSITE_SOLAR,
+        energysite_mock_data.SITE_CONFIG_SOLAR,
+        {},
+    )
+
+    snapshot = TeslaSnapshot(hass, ENTRY_ID)
+    await snapshot.async_load()
+    restored, restored_sites = snapshot.async_restore(
+        {car_mock_data.VIN: asleep_car, "other-vin": online_car},
+        {SOLAR_SITE_ID: solar_site},
+    )
+
+    assert restored == {car_mock_data.VIN}
+    assert restored_sites == {SOLAR_SITE_ID}
+    assert asleep_car.usable_battery_level == 77
+    assert online_car.battery_level == 50
+    assert solar_site.solar_power == energysite_mock_data.SITE_DATA["solar_power"]
+
+
+async def test_save_keeps_last_data_of_sleeping_cars(
+    hass: HomeAssistant, hass_storage
+) -> None:
+    """Saving does not drop the last known data of a car without data."""
+    online_car = TeslaCar(
+        deepcopy(car_mock_data.VEHICLE),
+        MagicMock(),
+        deepcopy(car_mock_data.VEHICLE_DATA),
+    )
+    asleep_car = TeslaCar(
+        {**car_mock_data.VEHICLE, "vin": "other-vin"}, MagicMock(), {}
+    )
+    snapshot = TeslaSnapshot(hass, ENTRY_ID)
+    snapshot._data["cars"]["other-vin"] = {"charge_state": {"battery_level": 1}}
+    snapshot.async_restore({car_mock_data.VIN: online_car, "other-vin": asleep_car}, {})
+
+    data = snapshot._data_to_save()
+
+    assert data["cars"][car_mock_data.VIN] == car_mock_data.VEHICLE_DATA
+    assert data["cars"]["other-vin"] == {"charge_state": {"battery_level": 1}}
@@ -0,0 +1,216 @@
+"""Tests for Tesla Fleet Telemetry support."""
+
+from http import HTTPStatus
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
+from homeassistant.core import HomeAssistant
+import pytest
+
+from custom_components.tesla_custom.const import (
+    CONF_ENABLE_FLEET_TELEMETRY,
+    DOMAIN,
+    FLEET_TELEMETRY_URL,
+)
+from custom_components.tesla_custom.telemetry import (
+    TeslaFleetTelemetry,
+    cast_bool,
+    decode_value,
+)
+
+from .common import setup_platform
+from .mock_data import car as car_mock_data
+
+pytestmark = pytest.mark.asyncio
+
+VIN = car_mock_data.VIN
+
+
+def _telemetry(hass: HomeAssistant) -> TeslaFleetTelemetry:
+    """Return a receiver for one car with a mock coordinator."""
+    car = SimpleNamespace(vin=VIN, _vehicle_data={"charge_state": {}})
+    return TeslaFleetTelemetry(hass, {VIN: MagicMock()}, {VIN: car})
+
+
+def test_decode_value() -> None:
+    """Values are unwrapped, invalid ones are dropped."""
+    assert decode_value({"doubleValue": 42.5}) == 42.5
+    assert decode_value({"stringValue": "ShiftStateD"}) == "ShiftStateD"
+    assert decode_value({"invalid": True}) is None
+    assert decode_value({}) is None
+    with pytest.raises(ValueError):
+        decode_value("BatteryLevel")
+
+
+def test_cast_bool() -> None:
+    """Booleans are decoded strictly."""
+    assert cast_bool(True) is True
+    assert cast_bool("false") is False
+    assert cast_bool("True") is True
+    with pytest.raises(ValueError):
+        cast_bool("no")
+    with pytest.raises(ValueError):
+        cast_bool(1)
+
+
+async def test_record_updates_car(hass: HomeAssistant) -> None:
+    """A record updates the car in place and notifies its coordinator once."""
+    telemetry = _telemetry(hass)
+    car = telemetry.cars[VIN]
+
+    telemetry.async_handle_record(
+        VIN,
+        [
+            {"key": "BatteryLevel", "value": {"doubleValue": 42.5}},
+            {"key": "Gear", "value": {"shiftStateValue": "ShiftStateD"}},
+            {
+                "key": "DetailedChargeState",
+                "value": {"detailedChargeStateValue": "DetailedChargeStateCharging"},
+            },
+            {
+                "key": "Location",
+                "value": {"locationValue": {"latitude": 1.5, "longitude": 2.5}},
+            },
+            {"key": "Odometer", "value": {"invalid": True}},
+            {"key": "NotAField", "value": {"intValue": 1}},
+        ],
+    )
+
+    assert car._vehicle_data["charge_state"] == {
+        "battery_level": 42.5,
+        "charging_state": "Charging",
+    }
+    assert car._vehicle_data["drive_state"] == {
+        "shift_state": "D",
+        "latitude": 1.5,
+        "longitude": 2.5,
+    }
+    telemetry.coordinators[VIN].async_handle_pushed_data.assert_called_once_with(
+        {
+            ("charge_state", "battery_level"),
+            ("charge_state", "charging_state"),
+            ("drive_state", "shift_state"),
+            ("drive_state", "latitude"),
+            ("drive_state", "longitude"),
+        }
+    )
+    assert telemetry.record_count == 1
+    assert telemetry.field_count == 5
+    assert telemetry.unknown_field_count == 1
+
+
+async def test_record_without_known_fields(hass: HomeAssistant) -> None:
+    """Records without usable fields do not notify."""
+    telemetry = _telemetry(hass)
+
+    telemetry.async_handle_record(
+        VIN, [{"key": "ChargeAmps", "value": {"stringValue": "many"}}]
+    )
+
+    telemetry.coordinators[VIN].async_handle_pushed_data.assert_not_called()
+    assert telemetry.record_count == 1
+
+
+async def test_malformed_data_is_skipped(hass: HomeAssistant) -> None:
+    """Data of the wrong shape is counted and skipped, the rest is applied."""
+    telemetry = _telemetry(hass)
+    car = telemetry.cars[VIN]
+
+    telemetry.async_handle_record(
+        VIN,
+        [
+            "BatteryLevel",
+            {"key": "BatteryLevel", "value": 42},
+            {"key": "Locked", "value": {"stringValue": "false"}},
+            {"key": "ChargePortDoorOpen", "value": {"stringValue": "maybe"}},
+            {"key": "Location", "value": {"locationValue": {"latitude": 1.5}}},
+            {"key": ["Odometer"], "value": {"doubleValue": 1}},
+        ],
+    )
+
+    assert car._vehicle_data["vehicle_state"] == {"locked": False}
+    assert "drive_state" not in car._vehicle_data
+    assert telemetry.invalid_field_count == 5
+    assert telemetry.field_count == 1
+
+
+async def test_endpoint_routes_records(hass: HomeAssistant, hass_client) -> None:
+    """Posted records reach the car of their VIN once telemetry is enabled."""
+    mock_entry, _ = await setup_platform(hass, SENSOR_DOMAIN)
+    hass.config_entries.async_update_entry(
+        mock_entry, options={CONF_ENABLE_FLEET_TELEMETRY: True}
+    )
+    await hass.async_block_till_done()
+    entry_data = hass.data[DOMAIN][mock_entry.entry_id]
+    client = await hass_client()
+
+    response = await client.post(
+        FLEET_TELEMETRY_URL,
+        json=[
+            {
+                "vin": VIN,
+                "data": [{"key": "BatteryLevel", "value": {"doubleValue": 42}}],
+            },
+            {"vin": "unknown", "data": []},
+        ],
+    )
+    assert response.status == HTTPStatus.OK
+    assert await response.json() == {"accepted": 1, "ignored": 1, "invalid": 0}
+    car = entry_data["cars"][VIN]
+    assert car._vehicle_data["charge_state"]["battery_level"] == 42
+    assert entry_data["telemetry"].record_count == 1
+
+    response = await client.post(FLEET_TELEMETRY_URL, data="not json")
+    assert response.status == HTTPStatus.BAD_REQUEST
+
+    for malformed in (
+        "records",
+        {"vin": ["not", "a", "vin"]},
+        [{"vin": VIN, "data": "BatteryLevel"}, 42],
+    ):
+        response = await client.post(FLEET_TELEMETRY_URL, json=malformed)
+        assert response.status == HTTPStatus.BAD_REQUEST
+
+    response = await client.post(
+        FLEET_TELEMETRY_URL,
+        json=[{"vin": VIN, "data": [{"key": "BatteryLevel", "value": 42}]}, None],
+    )
+    assert response.status == HTTPStatus.OK
+    assert await response.json() == {"accepted": 1, "ignored": 0, "invalid": 1}
+
+    hass.config_entries.async_update_entry(
+        mock_entry, options={CONF_ENABLE_FLEET_TELEMETRY: False}
+    )
+    await hass.async_block_till_done()
+    response = await client.post(FLEET_TELEMETRY_URL, json={"vin": VIN, "data": []})
+    assert await response.json() == {"accepted": 0, "ignored": 1, "invalid": 0}
+
+
+async def test_car_receiving_telemetry_is_not_polled(
+    hass: HomeAssistant, hass_client
+) -> None:
+    """The car data is not polled while telemetry pushes it."""
+    mock_entry, mock_controller = await setup_platform(
+        hass, SENSOR_DOMAIN, options={CONF_ENABLE_FLEET_TELEMETRY: True}
+    )
+    controller = mock_controller.return_value
+    account_coordinator = hass.data[DOMAIN][mock_entry.entry_id]["coordinators"][
+        "update_vehicles"
+    ]
+    client = await hass_client()
+
+    await account_coordinator.async_refresh()
+    assert controller.update.call_args.kwargs["vins"] == {VIN}
+
+    response = await client.post(
+        FLEET_TELEMETRY_URL,
+        json={
+            "vin": VIN,
+            "data": [{"key": "BatteryLevel", "value": {"doubleValue": 42}}],
+        },
+    )
+    assert response.status == HTTPStatus.OK
+
+    await account_coordinator.async_refresh()
+    assert controller.update.call_args.kwargs["vins"] == set()
@@ -1,11 +1,24 @@
 """Tests for TeslaMate MQTT support."""
 
+from datetime import timedelta
 from types import SimpleNamespace
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
 
-from custom_components.tesla_custom.teslamate import TeslaMate
+from custom_components.tesla_custom.teslamate import (
+    MAP_CHARGE_STATE,
+    MAP_CLIMATE_STATE,
+    MAP_DRIVE_STATE,
+    MAP_VEHICLE_STATE,
+    TOPIC_DISPATCH,
+    TeslaMate,
+    cast_km_to_miles,
+    cast_speed,
+)
 
 from .mock_data import car as car_mock_data
 
@@ -17,12 +30,148 @@ async def test_get_car_from_id_skips_stale_vin_mapping() -> None:
     active_car = SimpleNamespace(vin=car_mock_data.VIN)
     teslamate = object.__new__(TeslaMate)
     teslamate.cars = {car_mock_data.VIN: active_car}
-    teslamate._data = {
-        "car_map": {
-            "stale-vin": "1",
-            car_mock_data.VIN: "1",
+    teslamate._data = None
+    teslamate._cars_by_id = {}
+    teslamate._store = MagicMock()
+    teslamate._store.async_load = AsyncMock(
+        return_value={
+            "car_map": {
+                "stale-vin": "1",
+                car_mock_data.VIN: "1",
+            }
         }
-    }
-    teslamate.async_load = AsyncMock()
+    )
 
     assert await teslamate.get_car_from_id("1") is active_car
+    assert await teslamate.get_car_from_id("1") is active_car
+    teslamate._store.async_load.assert_awaited_once()
+
+
+async def test_car_index_follows_car_map(hass: HomeAssistant) -> None:
+    """Test messages find their car through the index set_car_id rebuilds."""
+    car = SimpleNamespace(vin=car_mock_data.VIN, _car={}, _vehicle_data={})
+    coordinator = MagicMock()
+    teslamate = TeslaMate(
+        hass, coordinators={car_mock_data.VIN: coordinator}, cars={car.vin: car}
+    )
+    teslamate._data = {}
+    teslamate.async_load = AsyncMock()
+    teslamate._async_save = AsyncMock()
+
+    await teslamate.set_car_id(car_mock_data.VIN, "2")
+    teslamate.async_load.reset_mock()
+
+    teslamate.async_handle_new_data(
+        SimpleNamespace(topic="teslamate/cars/2/state", payload="online")
+    )
+    teslamate.async_flush()
+
+    teslamate.async_load.assert_not_awaited()
+    assert car._car["state"] == "online"
+    coordinator.async_handle_pushed_data.assert_called_once_with({(None, "state")})
+
+
+async def test_queue_is_bounded(hass: HomeAssistant) -> None:
+    """Test MQTT msgs are applied on the loop and the oldest are dropped."""
+    car = SimpleNamespace(vin=car_mock_data.VIN, _car={}, _vehicle_data={})
+    coordinator = MagicMock()
+    teslamate = TeslaMate(
+        hass, coordinators={car_mock_data.VIN: coordinator}, cars={}, batch_window=0
+    )
+    teslamate._cars_by_id = {"1": car}
+
+    with patch("custom_components.tesla_custom.teslamate.TESLAMATE_QUEUE_SIZE", 2):
+        for heading in ("90", "180", "270"):
+            teslamate.async_queue_message(
+                SimpleNamespace(topic="teslamate/cars/1/heading", payload=heading)
+            )
+        teslamate.async_queue_message(
+            SimpleNamespace(topic="teslamate/cars/1/speed", payload="fast")
+        )
+    assert teslamate.queue_depth == 2
+    assert car._vehicle_data == {}
+
+    await hass.async_block_till_done()
+
+    assert teslamate.queue_depth == 0
+    assert teslamate.received_count == 4
+    assert teslamate.dropped_count == 2
+    assert car._vehicle_data["drive_state"] == {"heading": 270}
+    coordinator.async_handle_pushed_data.assert_called_once()
+
+
+async def test_updates_are_batched(hass: HomeAssistant) -> None:
+    """Test the updates of a car are applied once per batch window."""
+    car = SimpleNamespace(vin=car_mock_data.VIN, _car={}, _vehicle_data={})
+    coordinator = MagicMock()
+    teslamate = TeslaMate(hass, coordinators={car_mock_data.VIN: coordinator}, cars={})
+    teslamate._cars_by_id = {"1": car}
+
+    for attr, payload in (
+        ("latitude", "1.5"),
+        ("longitude", "2.5"),
+        ("speed", "10"),
+        ("speed", "20"),
+        ("elevation", "100"),
+    ):
+        teslamate.async_queue_message(
+            SimpleNamespace(topic=f"teslamate/cars/1/{attr}", payload=payload)
+        )
+    await hass.async_block_till_done()
+    assert car._vehicle_data == {}
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    assert car._vehicle_data["drive_state"] == {
+        "latitude": 1.5,
+        "longitude": 2.5,
+        "speed": 12,
+    }
+    coordinator.async_handle_pushed_data.assert_called_once_with(
+        {
+            ("drive_state", "latitude"),
+            ("drive_state", "longitude"),
+            ("drive_state", "speed"),
+        }
+    )
+    assert teslamate.batch_count == 1
+    assert teslamate.messages_per_batch == 4
+    assert teslamate.max_batch_size == 4
+
+
+def test_topic_dispatch() -> None:
+    """Test every mapped topic is dispatched to its state."""
+    assert len(TOPIC_DISPATCH) == (
+        len(MAP_DRIVE_STATE)
+        + len(MAP_VEHICLE_STATE)
+        + len(MAP_CLIMATE_STATE)
+        + len(MAP_CHARGE_STATE)
+        + 1
+    )
+    assert TOPIC_DISPATCH["speed"] == ("drive_state", "speed", cast_speed)
+    assert TOPIC_DISPATCH["trunk_open"][:2] == ("vehicle_state", "rt")
+    assert TOPIC_DISPATCH["state"][:2] == (None, "state")
+    assert "elevation" not in TOPIC_DISPATCH
+    with pytest.raises(TypeError):
+        TOPIC_DISPATCH["elevation"] = ("drive_state", "elevation", int)
+
+    assert cast_km_to_miles("100") == pytest.approx(62.137, abs=1e-3)
+    assert cast_speed("100") == 62
+
+
+async def test_subscribes_to_dispatched_topics(hass: HomeAssistant) -> None:
+    """Test cars subscribe to exact topics unless every topic is asked for."""
+    car = SimpleNamespace(vin=car_mock_data.VIN)
+    teslamate = TeslaMate(hass, coordinators={}, cars={})
+
+    topics = {}
+    await teslamate._get_car_topic(car, "1", topics)
+    assert len(topics) == len(TOPIC_DISPATCH)
+    assert topics["teslamate_1_speed"]["topic"] == "teslamate/cars/1/speed"
+    assert topics["teslamate_1_state"]["topic"] == "teslamate/cars/1/state"
+
+    teslamate.subscribe_all = True
+    topics = {}
+    await teslamate._get_car_topic(car, "1", topics)
+    assert [topic["topic"] for topic in topics.values()] == ["teslamate/cars/1/#"]
@@ -0,0 +1,30 @@
+"""Tests for the Tesla utilities."""
+
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant
+import pytest
+
+from custom_components.tesla_custom.util import async_get_tesla_ssl_context
+
+from .const import TEST_API_PROXY_CERT
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_ssl_context_is_cached(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Contexts are reused until the certificate content changes."""
+    default = await async_get_tesla_ssl_context(hass, None)
+    assert await async_get_tesla_ssl_context(hass, None) is default
+
+    missing = await async_get_tesla_ssl_context(hass, TEST_API_PROXY_CERT)
+    assert missing is not default
+    assert await async_get_tesla_ssl_context(hass, TEST_API_PROXY_CERT) is missing
+
+    cert = tmp_path / "cert.pem"
+    cert.write_text("first")
+    first = await async_get_tesla_ssl_context(hass, str(cert))
+    assert await async_get_tesla_ssl_context(hass, str(cert)) is first
+
+    cert.write_text("second")
+    assert await async_get_tesla_ssl_context(hass, str(cert)) is not first
@@ -0,0 +1,62 @@
+"""Tests for the Tesla car wake manager."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from homeassistant.core import HomeAssistant
+import pytest
+
+from custom_components.tesla_custom.wake import TeslaWakeManager
+
+from .mock_data import car as car_mock_data
+
+pytestmark = pytest.mark.asyncio
+
+
+def _mock_car() -> MagicMock:
+    """Return an asleep car mock that is online once woken up."""
+    car = MagicMock(vin=car_mock_data.VIN, is_on=False)
+    woken = asyncio.Event()
+
+    async def wake_up():
+        await woken.wait()
+        car.is_on = True
+
+    car.wake_up = AsyncMock(side_effect=wake_up)
+    car.woken = woken
+    return car
+
+
+async def test_concurrent_wake_ups_share_one_request(hass: HomeAssistant) -> None:
+    """Callers asking while a wake up runs share its result."""
+    car = _mock_car()
+    manager = TeslaWakeManager(hass, car, cooldown=30)
+
+    wake_ups = [hass.async_create_task(manager.async_wake_up()) for _ in range(3)]
+    await asyncio.sleep(0)
+    car.woken.set()
+
+    assert await asyncio.gather(*wake_ups) == [True, True, True]
+    car.wake_up.assert_awaited_once()
+    assert manager.wake_count == 1
+    assert manager.shared_count == 2
+    assert manager.last_latency is not None
+
+
+async def test_wake_up_refused_during_cooldown(hass: HomeAssistant) -> None:
+    """No new wake up is sent until the cooldown after the last one passed."""
+    car = _mock_car()
+    car.woken.set()
+    manager = TeslaWakeManager(hass, car, cooldown=30)
+
+    assert await manager.async_wake_up()
+    car.is_on = False
+    assert not await manager.async_wake_up()
+
+    car.wake_up.assert_awaited_once()
+    assert manager.refused_count == 1
+    assert 0 < manager.cooldown_remaining <= 30
+
+    manager.cooldown = 0
+    await manager.async_wake_up()
+    assert car.wake_up.await_count == 2